@@ -0,0 +1,141 @@
+"""
+星期/闰年核心的一致性与速度基准：公元1-9999年的每一天
+
+对比对象：
+- calendar_core.weekday（查400年周期表，现在所有视图共用）
+- 原 SolarCalendar.get_weekday 的蔡勒公式
+- 原 views / display_year 的基姆拉尔森公式（按“0=周日”使用时整体差一天）
+- 标准库 calendar.weekday 和 datetime.date
+
+以 datetime.date 为准统计不一致天数，并输出每次调用的平均耗时；
+calendar_core 有任何不一致时退出码为1
+
+运行方式：python benchmarks/bench_calendar_core.py [end_year]
+"""
+
+import calendar
+import os
+import sys
+import time
+import unicodedata
+from datetime import date
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_ROOT, "src"))
+
+import calendar_core  # noqa: E402
+
+
+def zeller(year, month, day):
+    """原 SolarCalendar.get_weekday 的蔡勒公式（不含参数校验）"""
+    if month < 3:
+        month += 12
+        year -= 1
+    century, year_of_century = divmod(year, 100)
+    h = (day + (13 * (month + 1)) // 5 + year_of_century +
+         year_of_century // 4 + century // 4 - 2 * century) % 7
+    return (h + 6) % 7
+
+
+def kim_larsen(year, month, day):
+    """原 views.get_weekday / display_year.get_weekday 的基姆拉尔森公式（原样保留）"""
+    if month < 3:
+        month += 12
+        year -= 1
+    return (day + 2 * month + 3 * (month + 1) // 5 + year + year // 4 - year // 100 + year // 400) % 7
+
+
+def stdlib_calendar(year, month, day):
+    """标准库 calendar.weekday（0=周一），换算为0=周日"""
+    return (calendar.weekday(year, month, day) + 1) % 7
+
+
+def stdlib_datetime(year, month, day):
+    """datetime.date（基准）"""
+    return date(year, month, day).isoweekday() % 7
+
+
+WEEKDAY_IMPLEMENTATIONS = {
+    "calendar_core.weekday": calendar_core.weekday,
+    "蔡勒公式(原 solar)": zeller,
+    "基姆拉尔森(原 views)": kim_larsen,
+    "calendar.weekday": stdlib_calendar,
+    "datetime.date": stdlib_datetime,
+}
+
+
+def legacy_is_leap(year):
+    """原各模块内联的闰年判断"""
+    return (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0)
+
+
+LEAP_IMPLEMENTATIONS = {
+    "calendar_core.is_leap_year": calendar_core.is_leap_year,
+    "内联判断(原 main/views)": legacy_is_leap,
+    "calendar.isleap": calendar.isleap,
+}
+
+
+def pad(text, width=28):
+    """按显示宽度补空格（每个汉字占2列）"""
+    return text + " " * (width - sum(2 if unicodedata.east_asian_width(c) in ("W", "F") else 1 for c in text))
+
+
+def time_weekdays(function, end_year):
+    """逐日调用一遍，返回 (调用次数, 耗时)"""
+    month_days = calendar_core.month_days
+    calls = 0
+    start = time.perf_counter()
+    for year in range(1, end_year + 1):
+        for month in range(1, 13):
+            for day in range(1, month_days(year, month) + 1):
+                function(year, month, day)
+            calls += month_days(year, month)
+    return calls, time.perf_counter() - start
+
+
+def count_weekday_mismatches(end_year):
+    """以 datetime 为准统计各实现的不一致天数"""
+    mismatches = dict.fromkeys(WEEKDAY_IMPLEMENTATIONS, 0)
+    ordinal = 1
+    for year in range(1, end_year + 1):
+        for month in range(1, 13):
+            for day in range(1, calendar_core.month_days(year, month) + 1):
+                expected = ordinal % 7  # 序数1（公元1年1月1日）是星期一
+                for name, function in WEEKDAY_IMPLEMENTATIONS.items():
+                    if function(year, month, day) != expected:
+                        mismatches[name] += 1
+                ordinal += 1
+    return mismatches
+
+
+def main():
+    end_year = int(sys.argv[1]) if len(sys.argv) > 1 else 9999
+
+    print(f"星期计算：公元1-{end_year}年逐日对比（以 datetime.date 为准）")
+    mismatches = count_weekday_mismatches(end_year)
+    for name, function in WEEKDAY_IMPLEMENTATIONS.items():
+        calls, elapsed = time_weekdays(function, end_year)
+        print(f"  {pad(name)}  不一致 {mismatches[name]:9,d} 天  {elapsed / calls * 1e9:8.1f} ns/次")
+
+    print(f"\n闰年判断：公元1-{end_year}年")
+    years = range(1, end_year + 1)
+    expected = [calendar.isleap(year) for year in years]
+    leap_mismatches = {}
+    for name, function in LEAP_IMPLEMENTATIONS.items():
+        leap_mismatches[name] = sum(function(year) != leap for year, leap in zip(years, expected))
+        start = time.perf_counter()
+        for _ in range(20):
+            for year in years:
+                function(year)
+        elapsed = time.perf_counter() - start
+        print(f"  {pad(name)}  不一致 {leap_mismatches[name]:9,d} 年  {elapsed / (20 * len(years)) * 1e9:8.1f} ns/次")
+
+    if mismatches["calendar_core.weekday"] or leap_mismatches["calendar_core.is_leap_year"]:
+        print("\n❌ calendar_core 与 datetime 不一致")
+        sys.exit(1)
+    print("\n✅ calendar_core 与 datetime 完全一致")
+
+
+if __name__ == "__main__":
+    main()
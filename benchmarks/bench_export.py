@@ -0,0 +1,48 @@
+"""
+导出吞吐量基准：分别以 CSV / JSONL / ICS、是否 gzip、串行和多进程导出一段年份
+
+输出每种组合的耗时、行数、吞吐量（行/秒）和文件大小
+
+运行方式：python benchmarks/bench_export.py [start_year] [end_year]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_ROOT, "src"))
+
+from export import FORMATS, export  # noqa: E402
+
+
+def run(directory, start_year, end_year, fmt, compress, workers):
+    """导出一次，返回 (耗时, 行数, 文件字节数)"""
+    path = os.path.join(directory, f"calendar.{fmt}" + (".gz" if compress else ""))
+    start = time.perf_counter()
+    rows = export(path, start_year, end_year, fmt=fmt, compress=compress, workers=workers)
+    elapsed = time.perf_counter() - start
+    return elapsed, rows, os.path.getsize(path)
+
+
+def main():
+    start_year = int(sys.argv[1]) if len(sys.argv) > 1 else 1900
+    end_year = int(sys.argv[2]) if len(sys.argv) > 2 else 2100
+    cpu_count = os.cpu_count() or 1
+    worker_counts = [1] if cpu_count == 1 else [1, cpu_count]
+
+    print(f"导出 {start_year}-{end_year} 年逐日数据（CPU 核数 {cpu_count}）")
+    # 表头按显示宽度手工对齐（每个汉字占2列）
+    print("  格式     压缩   进程   耗时(秒)       行数        行/秒   大小(KB)")
+    with tempfile.TemporaryDirectory() as directory:
+        for fmt in FORMATS:
+            for compress in (False, True):
+                for workers in worker_counts:
+                    elapsed, rows, size = run(directory, start_year, end_year, fmt, compress, workers)
+                    print(f"  {fmt:8} {'gzip' if compress else '-':6} {workers:4d} {elapsed:10.3f} "
+                          f"{rows:10,d} {rows / elapsed:12,.0f} {size / 1024:10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+农历引擎基准与差分校验：逐日对比 my_lunar.get_lunar_date 与 zhdate
+
+遍历 1900-2100 年的每一天（两者共同支持的范围），输出 JSON：
+- 不一致的日期（数量和前若干条）
+- 两个实现的吞吐量（次/秒）、单次调用延迟分位数（微秒）和峰值内存（tracemalloc）
+
+存在不一致时退出码为1，可以直接用于回归门禁
+
+运行方式：python benchmarks/bench_lunar.py [--start 1900] [--end 2100] [--output result.json]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_ROOT, "src"))
+
+from zhdate import ZhDate  # noqa: E402
+
+import my_lunar  # noqa: E402
+from my_lunar import get_lunar_date, _LUNAR_MONTH_NAMES, _LUNAR_DAY_PREFIX  # noqa: E402
+from solar import SolarCalendar  # noqa: E402
+
+# zhdate 的数据范围：1900年正月初一（公历1900-01-31）到2100年末
+ZHDATE_FIRST = (1900, 1, 31)
+ZHDATE_LAST = (2100, 12, 31)
+
+PERCENTILES = (50, 90, 99, 99.9)
+
+# JSON 中最多列出的不一致日期数
+MAX_REPORTED_MISMATCHES = 20
+
+
+def collect_days(start_year, end_year):
+    """
+    收集要遍历的日期，返回 (days, skipped)
+
+    超出 zhdate 数据范围的日期计入 skipped
+    """
+    first = SolarCalendar.to_ordinal(start_year, 1, 1)
+    last = SolarCalendar.to_ordinal(end_year + 1, 1, 1)
+    low = max(first, SolarCalendar.to_ordinal(*ZHDATE_FIRST))
+    high = min(last, SolarCalendar.to_ordinal(*ZHDATE_LAST) + 1)
+    days = [SolarCalendar.from_ordinal(ordinal) for ordinal in range(low, high)]
+    return days, (last - first) - len(days)
+
+
+def zhdate_text(year, month, day):
+    """用 zhdate 的结果按 get_lunar_date 的格式拼出文字（不含节日）"""
+    lunar = ZhDate.from_datetime(datetime(year, month, day))
+    return (f"农历{lunar.lunar_year}年{'闰' if lunar.leap_month else ''}"
+            f"{_LUNAR_MONTH_NAMES[lunar.lunar_month - 1]}{_LUNAR_DAY_PREFIX[lunar.lunar_day - 1]}")
+
+
+def verify(days):
+    """逐日对比，返回不一致的日期列表"""
+    mismatches = []
+    for date in days:
+        actual = get_lunar_date(*date).split(" ")[0]
+        expected = zhdate_text(*date)
+        if actual != expected:
+            mismatches.append({"date": "%04d-%02d-%02d" % date, "my_lunar": actual, "zhdate": expected})
+    return mismatches
+
+
+def percentile(sorted_values, p):
+    """最近秩法分位数"""
+    index = min(len(sorted_values) - 1, max(0, int(round(p / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def measure(convert, days):
+    """
+    测量一个转换函数：峰值内存、吞吐量和单次延迟
+
+    峰值内存最先测量，避免其它两轮预热的缓存计入；tracemalloc 会拖慢速度，所以单独一轮
+    """
+    tracemalloc.start()
+    for date in days:
+        convert(*date)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for date in days:
+        convert(*date)
+    elapsed = time.perf_counter() - start
+
+    latencies = []
+    clock = time.perf_counter_ns
+    for date in days:
+        begin = clock()
+        convert(*date)
+        latencies.append(clock() - begin)
+    latencies.sort()
+    latency_us = {f"p{p:g}": round(percentile(latencies, p) / 1000, 3) for p in PERCENTILES}
+    latency_us["max"] = round(latencies[-1] / 1000, 3)
+
+    return {
+        "calls": len(days),
+        "seconds": round(elapsed, 6),
+        "conversions_per_sec": round(len(days) / elapsed, 1),
+        "latency_us": latency_us,
+        "peak_memory_kb": round(peak / 1024, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="农历引擎基准与 zhdate 差分校验")
+    parser.add_argument("--start", type=int, default=1900, help="起始公历年（默认1900）")
+    parser.add_argument("--end", type=int, default=2100, help="结束公历年，包含（默认2100）")
+    parser.add_argument("--output", help="同时把 JSON 写入该文件")
+    args = parser.parse_args()
+
+    days, skipped = collect_days(args.start, args.end)
+    # 先测基准再校验，峰值内存不受校验时预热的缓存影响
+    benchmarks = {
+        "my_lunar.get_lunar_date": measure(get_lunar_date, days),
+        "zhdate": measure(lambda year, month, day: ZhDate.from_datetime(datetime(year, month, day)), days),
+    }
+    mismatches = verify(days)
+    result = {
+        "range": {"start": "%04d-%02d-%02d" % days[0], "end": "%04d-%02d-%02d" % days[-1]} if days else None,
+        "days": len(days),
+        "skipped_days": skipped,
+        "table_file": my_lunar._table_file is not None,
+        "mismatch_count": len(mismatches),
+        "mismatches": mismatches[:MAX_REPORTED_MISMATCHES],
+        "benchmarks": benchmarks,
+    }
+
+    text = json.dumps(result, ensure_ascii=False, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text + "\n")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+月份版式基准测试：扫描公元1-9999年的全部月份
+
+对比三种方式的吞吐量（月/秒）：
+    1. 旧实现：每次用蔡勒公式求1号星期，再逐日填充新的二维列表
+    2. generate_month_matrix：查400年周期表后复制为可修改的列表
+    3. get_month_layout：直接返回周期表中共享的只读版式
+
+运行方式：python benchmarks/bench_month_layout.py
+"""
+
+import os
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_ROOT, "src"))
+
+from solar import SolarCalendar  # noqa: E402
+
+START_YEAR, END_YEAR = 1, 9999
+
+
+def legacy_month_matrix(year, month):
+    """旧版 generate_month_matrix 的实现，作为对照"""
+    matrix = [[0 for _ in range(7)] for _ in range(6)]
+    total_days = SolarCalendar.get_month_days(year, month)
+    first_day_weekday = SolarCalendar.get_weekday(year, month, 1)
+    row, col = 0, first_day_weekday
+    for day in range(1, total_days + 1):
+        matrix[row][col] = day
+        col += 1
+        if col >= 7:
+            col = 0
+            row += 1
+    return matrix
+
+
+def sweep(func):
+    """扫描所有年份和月份，返回耗时（秒）"""
+    start = time.perf_counter()
+    for year in range(START_YEAR, END_YEAR + 1):
+        for month in range(1, 13):
+            func(year, month)
+    return time.perf_counter() - start
+
+
+def main():
+    # 先核对结果一致，再计时
+    for year in range(START_YEAR, END_YEAR + 1):
+        for month in range(1, 13):
+            expected = legacy_month_matrix(year, month)
+            assert SolarCalendar.generate_month_matrix(year, month) == expected
+            assert [list(row) for row in SolarCalendar.get_month_layout(year, month)] == expected
+
+    total = (END_YEAR - START_YEAR + 1) * 12
+    print(f"扫描 {START_YEAR}-{END_YEAR} 年，共 {total} 个月")
+    for name, func in [
+        ("旧实现（蔡勒+逐日填充）", legacy_month_matrix),
+        ("generate_month_matrix", SolarCalendar.generate_month_matrix),
+        ("get_month_layout", SolarCalendar.get_month_layout),
+    ]:
+        elapsed = sweep(func)
+        print(f"  {name:<24} {elapsed:8.3f} 秒  {total / elapsed:14,.0f} 月/秒")
+
+
+if __name__ == "__main__":
+    main()
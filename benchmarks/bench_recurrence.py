@@ -0,0 +1,74 @@
+"""
+农历重复规则的回归校验与速度基准：LunarMonthlyRule 对比逐日扫描
+
+对农历初一到三十的每条规则，在整个农历数据范围（1900-2100）内：
+- 展开结果必须与逐日调用 get_lunar_info 找到的日期完全一致
+  （三十只出现在大月，两个小月相连时两次命中相隔约88天，也不能中断）
+- 从任意起点开始的无上限展开必须能一直走到数据范围末尾
+
+输出每条规则的命中次数和两种方式的耗时；有任何不一致时退出码为1
+
+运行方式：python benchmarks/bench_recurrence.py
+"""
+
+import os
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_ROOT, "src"))
+
+from my_lunar import get_lunar_info, lunar_ordinal_range  # noqa: E402
+from recurrence import LunarMonthlyRule  # noqa: E402
+from solar import SolarCalendar  # noqa: E402
+
+MIN_ORDINAL, MAX_ORDINAL = lunar_ordinal_range()
+FIRST_DAY = SolarCalendar.from_ordinal(MIN_ORDINAL)
+END_DAY = SolarCalendar.from_ordinal(MAX_ORDINAL)  # 不包含
+
+# 无上限展开的起点：包括数据范围之前、2024年初（紧接着有连续小月）和数据范围内最后一天
+OPEN_ENDED_STARTS = ((1900, 1, 1), (2024, 1, 1), (2099, 6, 15), SolarCalendar.from_ordinal(MAX_ORDINAL - 1))
+
+
+def scan_by_day():
+    """逐日查询一遍农历，返回 {农历日: [公历日期, ...]}"""
+    hits = {lunar_day: [] for lunar_day in range(1, 31)}
+    for ordinal in range(MIN_ORDINAL, MAX_ORDINAL):
+        date = SolarCalendar.from_ordinal(ordinal)
+        hits[get_lunar_info(*date).day].append(date)
+    return hits
+
+
+def main():
+    start = time.perf_counter()
+    expected = scan_by_day()
+    scan_elapsed = time.perf_counter() - start
+    print(f"逐日扫描 {FIRST_DAY} 至 {END_DAY}（不含）：{scan_elapsed:.3f} 秒")
+
+    failures = 0
+    rule_elapsed = 0.0
+    for lunar_day in range(1, 31):
+        rule = LunarMonthlyRule(lunar_day)
+        start = time.perf_counter()
+        actual = list(rule.iter_dates(FIRST_DAY, END_DAY))
+        rule_elapsed += time.perf_counter() - start
+
+        problems = []
+        if actual != expected[lunar_day]:
+            problems.append("有界展开不一致")
+        for open_start in OPEN_ENDED_STARTS:
+            tail = [date for date in expected[lunar_day] if date >= open_start]
+            if list(rule.iter_dates(open_start)) != tail:
+                problems.append(f"从 {open_start} 开始的无上限展开不一致")
+        failures += bool(problems)
+        print(f"  农历第{lunar_day:2d}天  命中 {len(actual):5d} 次  {'；'.join(problems) or '一致'}")
+
+    print(f"\n30条规则展开合计 {rule_elapsed:.3f} 秒，逐日扫描 {scan_elapsed:.3f} 秒")
+    if failures:
+        print(f"\n❌ {failures} 条规则与逐日扫描不一致")
+        sys.exit(1)
+    print("\n✅ 全部规则与逐日扫描一致")
+
+
+if __name__ == "__main__":
+    main()
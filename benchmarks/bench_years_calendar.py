@@ -0,0 +1,54 @@
+"""
+多进程年历生成的扩展性基准：生成公元1-9999年的全年日历
+
+依次使用 1, 2, 4, ... 个进程（不超过 CPU 核数），输出耗时和吞吐量（年/秒）
+
+运行方式：python benchmarks/bench_years_calendar.py [chunk_size]
+"""
+
+import os
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_ROOT, "src"))
+
+from solar import SolarCalendar  # noqa: E402
+
+START_YEAR, END_YEAR = 1, 9999
+
+
+def run(workers, chunk_size):
+    """完整消费一次生成器，返回耗时（秒）"""
+    start = time.perf_counter()
+    expected = START_YEAR
+    for year, _ in SolarCalendar.generate_years_calendar(
+            START_YEAR, END_YEAR, workers=workers, chunk_size=chunk_size):
+        assert year == expected, "结果顺序错误"
+        expected += 1
+    assert expected == END_YEAR + 1, "结果数量错误"
+    return time.perf_counter() - start
+
+
+def main():
+    chunk_size = int(sys.argv[1]) if len(sys.argv) > 1 else 256
+    cpu_count = os.cpu_count() or 1
+    counts = []
+    workers = 1
+    while workers < cpu_count:
+        counts.append(workers)
+        workers *= 2
+    counts.append(cpu_count)
+
+    total = END_YEAR - START_YEAR + 1
+    print(f"生成 {START_YEAR}-{END_YEAR} 年日历（{total} 年），chunk_size={chunk_size}")
+    baseline = None
+    for workers in counts:
+        elapsed = run(workers, chunk_size)
+        baseline = baseline or elapsed
+        print(f"  {workers:3d} 进程  {elapsed:8.3f} 秒  {total / elapsed:12,.0f} 年/秒"
+              f"  加速比 {baseline / elapsed:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
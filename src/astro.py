@@ -0,0 +1,361 @@
+# 天文计算模块：朔日（新月）与二十四节气
+"""
+简化精度的天文算法（Meeus《天文算法》第25、47、49章的低精度版本）
+
+- 太阳视黄经：误差约0.01°，对应节气时刻误差约15分钟
+- 朔：平朔加主要周期项，误差约1分钟
+- 时间统一按北京时间（UTC+8）取日期
+
+除了给视图标注节气外，还可以离线重新生成 my_lunar 的农历压缩表：
+    python src/astro.py 1900 2100
+"""
+import sys
+from functools import lru_cache
+
+from solar import SolarCalendar
+
+try:
+    import numpy as np
+except ImportError:  # 天文计算依赖 numpy
+    np = None
+
+
+# 二十四节气（按公历年内顺序，小寒在前），第i个节气的太阳视黄经为 285 + 15i 度
+SOLAR_TERM_NAMES = (
+    "小寒", "大寒", "立春", "雨水", "惊蛰", "春分",
+    "清明", "谷雨", "立夏", "小满", "芒种", "夏至",
+    "小暑", "大暑", "立秋", "处暑", "白露", "秋分",
+    "寒露", "霜降", "立冬", "小雪", "大雪", "冬至",
+)
+
+_J2000 = 2451545.0
+_DAYS_PER_CENTURY = 36525.0
+_TROPICAL_YEAR = 365.2422
+_SYNODIC_MONTH = 29.530588861
+
+# 儒略日与序数的换算：序数 = floor(JD + 0.5 + 时区) - _JD_ORDINAL_OFFSET
+_JD_ORDINAL_OFFSET = 1721425
+_BEIJING_OFFSET = 8 / 24
+
+# 朔的行星摄动项：(系数, 角度常数, 每个朔望月的角度增量)
+_NEW_MOON_PLANETARY_TERMS = (
+    (0.000325, 299.77, 0.107408), (0.000165, 251.88, 0.016321),
+    (0.000164, 251.83, 26.651886), (0.000126, 349.42, 36.412478),
+    (0.000110, 84.66, 18.206239), (0.000062, 141.74, 53.303771),
+    (0.000060, 207.14, 2.453732), (0.000056, 154.84, 7.306860),
+    (0.000047, 34.52, 27.261239), (0.000042, 207.19, 0.121824),
+    (0.000040, 291.34, 1.844379), (0.000037, 161.72, 24.198154),
+    (0.000035, 239.56, 25.513099), (0.000023, 331.55, 3.592518),
+)
+
+
+def _require_numpy():
+    """天文计算的依赖检查，未安装 numpy 时给出明确提示"""
+    if np is None:
+        raise ImportError("天文计算需要 numpy，请先执行: pip install numpy")
+
+
+def _delta_t(year):
+    """
+    力学时与世界时之差 ΔT（秒），Espenak-Meeus 分段多项式，向量化
+
+    参数:
+        year: 小数年份（数组）
+    """
+    y = np.asarray(year, dtype=np.float64)
+    conditions = [y < 1900, y < 1920, y < 1941, y < 1961, y < 1986, y < 2005, y < 2050, y < 2150]
+    t = [
+        (y - 1820) / 100,
+        y - 1900, y - 1920, y - 1950, y - 1975, y - 2000, y - 2000,
+        (y - 1820) / 100,
+    ]
+    choices = [
+        -20 + 32 * t[0] ** 2,
+        -2.79 + 1.494119 * t[1] - 0.0598939 * t[1] ** 2 + 0.0061966 * t[1] ** 3 - 0.000197 * t[1] ** 4,
+        21.20 + 0.84493 * t[2] - 0.076100 * t[2] ** 2 + 0.0020936 * t[2] ** 3,
+        29.07 + 0.407 * t[3] - t[3] ** 2 / 233 + t[3] ** 3 / 2547,
+        45.45 + 1.067 * t[4] - t[4] ** 2 / 260 - t[4] ** 3 / 718,
+        63.86 + 0.3345 * t[5] - 0.060374 * t[5] ** 2 + 0.0017275 * t[5] ** 3
+        + 0.000651814 * t[5] ** 4 + 0.00002373599 * t[5] ** 5,
+        62.92 + 0.32217 * t[6] + 0.005589 * t[6] ** 2,
+        -20 + 32 * t[7] ** 2 - 0.5628 * (2150 - y),
+    ]
+    return np.select(conditions, choices, default=-20 + 32 * ((y - 1820) / 100) ** 2)
+
+
+def _tt_to_ut(jde):
+    """力学时儒略日 → 世界时儒略日"""
+    year = 2000 + (jde - _J2000) / 365.25
+    return jde - _delta_t(year) / 86400
+
+
+def jd_to_ordinal(jd, offset: float = _BEIJING_OFFSET):
+    """
+    世界时儒略日 → 当地日期的序数（默认北京时间），向量化
+
+    参数:
+        jd: 儒略日（数组或标量）
+        offset: 时区偏移（日），默认 8/24
+    """
+    _require_numpy()
+    return np.floor(np.asarray(jd) + 0.5 + offset).astype(np.int64) - _JD_ORDINAL_OFFSET
+
+
+def sun_apparent_longitude(jde):
+    """
+    太阳视黄经（度，0-360），向量化
+
+    参数:
+        jde: 力学时儒略日
+    """
+    t = (np.asarray(jde, dtype=np.float64) - _J2000) / _DAYS_PER_CENTURY
+    mean_longitude = 280.46646 + 36000.76983 * t + 0.0003032 * t ** 2
+    mean_anomaly = np.radians(357.52911 + 35999.05029 * t - 0.0001537 * t ** 2)
+    center = ((1.914602 - 0.004817 * t - 0.000014 * t ** 2) * np.sin(mean_anomaly)
+              + (0.019993 - 0.000101 * t) * np.sin(2 * mean_anomaly)
+              + 0.000289 * np.sin(3 * mean_anomaly))
+    omega = np.radians(125.04 - 1934.136 * t)
+    return (mean_longitude + center - 0.00569 - 0.00478 * np.sin(omega)) % 360
+
+
+def solar_terms(years):
+    """
+    计算若干年的二十四节气时刻，向量化
+
+    参数:
+        years: 公历年份序列
+
+    返回:
+        numpy.ndarray: 形状 (年数, 24) 的世界时儒略日，列顺序同 SOLAR_TERM_NAMES
+    """
+    _require_numpy()
+    years = np.atleast_1d(np.asarray(years, dtype=np.float64))
+    index = np.arange(24)
+    target = (285 + 15 * index) % 360
+
+    # 初值：1月6日左右为小寒，之后每个节气约15.2天
+    jan1 = np.array([SolarCalendar.to_ordinal(int(year), 1, 1) for year in years])
+    jde = (jan1[:, None] + _JD_ORDINAL_OFFSET - 0.5 + 5 + index * _TROPICAL_YEAR / 24)
+
+    # 牛顿迭代：黄经差换算成天数修正
+    for _ in range(6):
+        difference = (target - sun_apparent_longitude(jde) + 180) % 360 - 180
+        jde = jde + difference * _TROPICAL_YEAR / 360
+
+    return _tt_to_ut(jde)
+
+
+def new_moons(k):
+    """
+    计算第 k 个朔的时刻（k=0 为2000年1月6日的朔），向量化
+
+    参数:
+        k: 朔序号（整数数组）
+
+    返回:
+        numpy.ndarray: 世界时儒略日
+    """
+    _require_numpy()
+    k = np.asarray(k, dtype=np.float64)
+    t = k / 1236.85
+    jde = (2451550.09766 + _SYNODIC_MONTH * k + 0.00015437 * t ** 2
+           - 0.00000015 * t ** 3 + 0.00000000073 * t ** 4)
+
+    e = 1 - 0.002516 * t - 0.0000074 * t ** 2
+    sun = np.radians(2.5534 + 29.10535670 * k - 0.0000014 * t ** 2 - 0.00000011 * t ** 3)
+    moon = np.radians(201.5643 + 385.81693528 * k + 0.0107582 * t ** 2
+                      + 0.00001238 * t ** 3 - 0.000000058 * t ** 4)
+    arg = np.radians(160.7108 + 390.67050284 * k - 0.0016118 * t ** 2
+                     - 0.00000227 * t ** 3 + 0.000000011 * t ** 4)
+    omega = np.radians(124.7746 - 1.56375588 * k + 0.0020672 * t ** 2 + 0.00000215 * t ** 3)
+
+    jde = jde + (
+        -0.40720 * np.sin(moon)
+        + 0.17241 * e * np.sin(sun)
+        + 0.01608 * np.sin(2 * moon)
+        + 0.01039 * np.sin(2 * arg)
+        + 0.00739 * e * np.sin(moon - sun)
+        - 0.00514 * e * np.sin(moon + sun)
+        + 0.00208 * e * e * np.sin(2 * sun)
+        - 0.00111 * np.sin(moon - 2 * arg)
+        - 0.00057 * np.sin(moon + 2 * arg)
+        + 0.00056 * e * np.sin(2 * moon + sun)
+        - 0.00042 * np.sin(3 * moon)
+        + 0.00042 * e * np.sin(sun + 2 * arg)
+        + 0.00038 * e * np.sin(sun - 2 * arg)
+        - 0.00024 * e * np.sin(2 * moon - sun)
+        - 0.00017 * np.sin(omega)
+        - 0.00007 * np.sin(moon + 2 * sun)
+        + 0.00004 * np.sin(2 * moon - 2 * arg)
+        + 0.00004 * np.sin(3 * sun)
+        + 0.00003 * np.sin(moon + sun - 2 * arg)
+        + 0.00003 * np.sin(2 * moon + 2 * arg)
+        - 0.00003 * np.sin(moon + sun + 2 * arg)
+        + 0.00003 * np.sin(moon - sun + 2 * arg)
+        - 0.00002 * np.sin(moon - sun - 2 * arg)
+        - 0.00002 * np.sin(3 * moon + sun)
+        + 0.00002 * np.sin(4 * moon)
+    )
+
+    for coefficient, base, rate in _NEW_MOON_PLANETARY_TERMS:
+        angle = base + rate * k
+        if base == 299.77:
+            angle = angle - 0.009173 * t ** 2
+        jde = jde + coefficient * np.sin(np.radians(angle))
+
+    return _tt_to_ut(jde)
+
+
+def new_moon_ordinals(start_ordinal: int, end_ordinal: int):
+    """
+    计算 [start_ordinal, end_ordinal) 内所有朔日（北京时间）的序数
+
+    返回:
+        numpy.ndarray: 升序排列的序数
+    """
+    _require_numpy()
+    first = int(np.floor((start_ordinal + _JD_ORDINAL_OFFSET - _J2000) / _SYNODIC_MONTH)) - 1
+    last = int(np.ceil((end_ordinal + _JD_ORDINAL_OFFSET - _J2000) / _SYNODIC_MONTH)) + 1
+    ordinals = jd_to_ordinal(new_moons(np.arange(first, last + 1)))
+    return ordinals[(ordinals >= start_ordinal) & (ordinals < end_ordinal)]
+
+
+@lru_cache(maxsize=512)
+def get_solar_terms(year: int, month: int) -> tuple:
+    """
+    获取某个公历月内的节气（有缓存，视图可以逐月调用）
+
+    参数:
+        year: 公历年
+        month: 公历月
+
+    返回:
+        tuple: ((day, 节气名), ...)，每月通常两个
+    """
+    if not 1 <= month <= 12:
+        raise ValueError("月份必须在1-12之间")
+    terms = _year_term_ordinals(year)
+    first = SolarCalendar.to_ordinal(year, month, 1)
+    result = []
+    # 第 2(m-1) 和 2(m-1)+1 个节气落在第m月
+    for index in (2 * (month - 1), 2 * (month - 1) + 1):
+        result.append((terms[index] - first + 1, SOLAR_TERM_NAMES[index]))
+    return tuple(result)
+
+
+def get_solar_term(year: int, month: int, day: int):
+    """
+    查询某天是否为节气
+
+    返回:
+        str: 节气名，不是节气返回 None
+    """
+    for term_day, name in get_solar_terms(year, month):
+        if term_day == day:
+            return name
+    return None
+
+
+@lru_cache(maxsize=64)
+def _year_term_ordinals(year: int) -> tuple:
+    """某年24个节气的日期序数（北京时间）"""
+    return tuple(int(ordinal) for ordinal in jd_to_ordinal(solar_terms([year])[0]))
+
+
+# --- 农历压缩表的离线生成 ---
+def _encode_year_info(new_year_offset: int, leap_month: int, lengths) -> int:
+    """按 my_lunar._LUNAR_YEAR_INFO 的格式压缩一年的农历数据"""
+    bits = sum(1 << i for i, length in enumerate(lengths) if length == 30)
+    return bits | leap_month << 13 | new_year_offset << 17
+
+
+def _label_lunations(start_year: int, end_year: int) -> list:
+    """
+    为 [start_year-1 年冬至所在月, end_year+1 年冬至所在月) 之间的每个朔望月编号
+
+    规则：
+        1. 含冬至的月为十一月
+        2. 两个十一月之间若有13个月，则其中第一个不含中气的月为闰月，沿用上个月的月份
+
+    返回:
+        list: [(朔日序数, 农历月, 是否闰月), ...]，最后多一项只提供结束边界
+    """
+    years = np.arange(start_year - 1, end_year + 2)
+    terms = jd_to_ordinal(solar_terms(years))
+    # 中气为冬至、大寒、雨水……即偶数黄经 (285+15i) % 30 == 0 的节气
+    major_terms = np.sort(terms[:, 1::2].ravel())
+    winter_solstices = terms[:, 23]
+
+    moons = new_moon_ordinals(int(winter_solstices[0]) - 40, int(winter_solstices[-1]) + 40)
+
+    def month_index_of(ordinal):
+        """ordinal 所在朔望月的下标"""
+        return int(np.searchsorted(moons, ordinal, side="right")) - 1
+
+    labels = []
+    for solstice, next_solstice in zip(winter_solstices[:-1], winter_solstices[1:]):
+        begin, end = month_index_of(solstice), month_index_of(next_solstice)
+        leap_found = end - begin == 12  # 只有12个月的岁不置闰
+        month = 11
+        for index in range(begin, end):
+            if index > begin:
+                has_major_term = np.any((major_terms >= moons[index]) & (major_terms < moons[index + 1]))
+                if not leap_found and not has_major_term:
+                    labels.append((int(moons[index]), month, True))
+                    leap_found = True
+                    continue
+                month = month % 12 + 1
+            labels.append((int(moons[index]), month, False))
+    labels.append((int(moons[end]), 11, False))
+    return labels
+
+
+def build_lunar_year_info(start_year: int, end_year: int) -> list:
+    """
+    用天文算法生成农历压缩表（格式同 my_lunar._LUNAR_YEAR_INFO）
+
+    参数:
+        start_year: 起始农历年
+        end_year: 结束农历年（包含）
+
+    返回:
+        list: 每个农历年一个整数
+    """
+    labels = _label_lunations(start_year, end_year)
+    result = []
+    for year in range(start_year, end_year + 1):
+        jan1 = SolarCalendar.to_ordinal(year, 1, 1)
+        # 正月初一：公历年内第一个非闰的正月
+        first = next(i for i, (ordinal, month, leap) in enumerate(labels)
+                     if month == 1 and not leap and ordinal >= jan1)
+        last = next(i for i in range(first + 1, len(labels))
+                    if labels[i][1] == 1 and not labels[i][2])
+
+        lengths = [labels[i + 1][0] - labels[i][0] for i in range(first, last)]
+        leap_month = next((labels[i][1] for i in range(first, last) if labels[i][2]), 0)
+        result.append(_encode_year_info(labels[first][0] - jan1, leap_month, lengths))
+    return result
+
+
+def main():
+    """离线重新生成农历压缩表，并与 my_lunar 中的表逐年对比"""
+    start_year = int(sys.argv[1]) if len(sys.argv) > 1 else 1900
+    end_year = int(sys.argv[2]) if len(sys.argv) > 2 else 2100
+
+    from my_lunar import _LUNAR_YEAR_INFO, LUNAR_MIN_YEAR
+
+    table = build_lunar_year_info(start_year, end_year)
+    for first in range(0, len(table), 6):
+        row = table[first:first + 6]
+        year = start_year + first
+        print("    " + ", ".join(f"0x{info:06x}" for info in row)
+              + f",  # {year}-{year + len(row) - 1}")
+
+    differences = [start_year + i for i, info in enumerate(table)
+                   if 0 <= start_year + i - LUNAR_MIN_YEAR < len(_LUNAR_YEAR_INFO)
+                   and _LUNAR_YEAR_INFO[start_year + i - LUNAR_MIN_YEAR] != info]
+    print(f"# 与 my_lunar 现有数据不一致的年份: {differences or '无'}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
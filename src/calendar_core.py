@@ -0,0 +1,79 @@
+# 日历核心模块：闰年、月天数、星期的唯一实现，所有模块和视图共用
+"""
+公历每400年（146097天，恰好20871周）循环一次，模块加载时排好周期内
+4800个月份1号的星期（4800字节），之后求任意日期的星期只需一次查表加一次取模
+
+这里的函数不做参数校验，供视图等热路径直接调用；
+需要校验和报错的场合使用 SolarCalendar 中的同名方法
+"""
+
+# 各月份天数（非闰年2月为28天）
+MONTH_DAYS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# 各月1日之前的累计天数（前缀和表），下标0为平年、1为闰年，第13项为全年总天数
+CUMULATIVE_DAYS = (
+    (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334, 365),
+    (0, 31, 60, 91, 121, 152, 182, 213, 244, 274, 305, 335, 366),
+)
+
+# 400年周期的年数和天数
+CYCLE_YEARS = 400
+DAYS_PER_CYCLE = 146097
+
+
+def is_leap_year(year: int) -> bool:
+    """判断是否为闰年（四年一闰，百年不闰，四百年再闰）"""
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def month_days(year: int, month: int) -> int:
+    """指定年月的天数（month 为1-12）"""
+    if month == 2 and is_leap_year(year):
+        return 29
+    return MONTH_DAYS[month - 1]
+
+
+def _build_first_weekdays() -> bytes:
+    """生成400年周期内每个月1号的星期表，下标为 周期年×12 + 月-1"""
+    table = bytearray()
+    weekday = 1  # 公元1年1月1日是星期一
+    for year in range(1, CYCLE_YEARS + 1):
+        for month in range(1, 13):
+            table.append(weekday)
+            weekday = (weekday + month_days(year, month)) % 7
+    return bytes(table)
+
+
+_FIRST_WEEKDAYS = _build_first_weekdays()
+
+
+def first_weekday(year: int, month: int) -> int:
+    """
+    查表获取指定月份1号是星期几
+
+    返回:
+        int: 0=周日，1=周一，...，6=周六
+    """
+    return _FIRST_WEEKDAYS[((year - 1) % CYCLE_YEARS) * 12 + month - 1]
+
+
+def weekday(year: int, month: int, day: int) -> int:
+    """
+    查表计算指定日期是星期几
+
+    返回:
+        int: 0=周日，1=周一，...，6=周六
+    """
+    return (_FIRST_WEEKDAYS[((year - 1) % CYCLE_YEARS) * 12 + month - 1] + day - 1) % 7
+
+
+def month_weeks(year: int, month: int) -> list:
+    """
+    按周排列的月历（周日开头），只包含实际用到的周，空白处为0
+
+    返回:
+        list: 4-6个长度为7的列表
+    """
+    cells = [0] * first_weekday(year, month) + list(range(1, month_days(year, month) + 1))
+    cells += [0] * (-len(cells) % 7)
+    return [cells[i:i + 7] for i in range(0, len(cells), 7)]
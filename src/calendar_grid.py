@@ -0,0 +1,164 @@
+# 紧凑日历数据结构：每月42字节、每年504字节，替代嵌套列表长期驻留内存
+from solar import SolarCalendar
+
+# 每月固定 6行 × 7列
+WEEKS_PER_MONTH = 6
+DAYS_PER_WEEK = 7
+MONTH_CELLS = WEEKS_PER_MONTH * DAYS_PER_WEEK
+YEAR_CELLS = 12 * MONTH_CELLS
+
+
+class MonthGrid:
+    """
+    单月紧凑日历（42字节缓冲区）
+
+    缓冲区直接引用 SolarCalendar 的400年周期表，不复制数据；
+    按周切片返回 memoryview，逐日迭代返回 int
+    """
+
+    __slots__ = ("year", "month", "_buffer")
+
+    def __init__(self, year: int, month: int, buffer=None):
+        """
+        参数:
+            year: 年份
+            month: 月份（1-12）
+            buffer: 可选，42字节的 bytes / memoryview（由 YearGrid 传入），
+                    省略时从周期表中查找
+        """
+        if not 1 <= month <= 12:
+            raise ValueError("月份必须在1-12之间")
+
+        if buffer is None:
+            block = memoryview(SolarCalendar.get_year_block(year))
+            buffer = block[(month - 1) * MONTH_CELLS:month * MONTH_CELLS]
+        elif len(buffer) != MONTH_CELLS:
+            raise ValueError(f"月份缓冲区必须为{MONTH_CELLS}字节")
+
+        self.year = year
+        self.month = month
+        self._buffer = memoryview(buffer).toreadonly()
+
+    @property
+    def buffer(self) -> memoryview:
+        """只读的42字节缓冲区"""
+        return self._buffer
+
+    @property
+    def first_weekday(self) -> int:
+        """1号是星期几（0=周日，...，6=周六）"""
+        return bytes(self._buffer[:DAYS_PER_WEEK]).index(1)
+
+    @property
+    def month_days(self) -> int:
+        """该月天数"""
+        # 月末至少是28号，一定落在第4行及以后
+        return max(self._buffer[3 * DAYS_PER_WEEK:])
+
+    @property
+    def week_count(self) -> int:
+        """该月占用的周数（4-6）"""
+        return (self.first_weekday + self.month_days + DAYS_PER_WEEK - 1) // DAYS_PER_WEEK
+
+    def week(self, index: int) -> memoryview:
+        """
+        按周切片
+
+        参数:
+            index: 第几周（0-5，支持负数下标）
+
+        返回:
+            memoryview: 7字节，空白处为0
+        """
+        if index < 0:
+            index += WEEKS_PER_MONTH
+        if not 0 <= index < WEEKS_PER_MONTH:
+            raise IndexError("周序号必须在0-5之间")
+        return self._buffer[index * DAYS_PER_WEEK:(index + 1) * DAYS_PER_WEEK]
+
+    def weeks(self):
+        """依次返回6周的 memoryview"""
+        for index in range(WEEKS_PER_MONTH):
+            yield self.week(index)
+
+    def __iter__(self):
+        """逐日迭代（跳过空白），依次产生 1, 2, ..., 月末"""
+        for cell in self._buffer:
+            if cell:
+                yield cell
+
+    def __len__(self):
+        return self.month_days
+
+    def to_matrix(self) -> list:
+        """兼容接口：返回与 generate_month_matrix 相同的 6×7 嵌套列表"""
+        return [list(week) for week in self.weeks()]
+
+    def __eq__(self, other):
+        if not isinstance(other, MonthGrid):
+            return NotImplemented
+        return (self.year, self.month) == (other.year, other.month)
+
+    def __hash__(self):
+        return hash((self.year, self.month))
+
+    def __repr__(self):
+        return f"MonthGrid({self.year}, {self.month})"
+
+
+class YearGrid:
+    """
+    全年紧凑日历（504字节缓冲区）
+
+    12个月连续存放，month() 返回共享同一缓冲区的 MonthGrid
+    """
+
+    __slots__ = ("year", "_buffer")
+
+    def __init__(self, year: int):
+        """
+        参数:
+            year: 年份
+        """
+        self.year = year
+        self._buffer = memoryview(SolarCalendar.get_year_block(year))
+
+    @property
+    def buffer(self) -> memoryview:
+        """只读的504字节缓冲区"""
+        return self._buffer
+
+    def month(self, month: int) -> MonthGrid:
+        """
+        获取某个月（不复制数据）
+
+        参数:
+            month: 月份（1-12）
+        """
+        if not 1 <= month <= 12:
+            raise ValueError("月份必须在1-12之间")
+        start = (month - 1) * MONTH_CELLS
+        return MonthGrid(self.year, month, self._buffer[start:start + MONTH_CELLS])
+
+    def __iter__(self):
+        """按月迭代，依次产生12个 MonthGrid"""
+        for month in range(1, 13):
+            yield self.month(month)
+
+    def __len__(self):
+        return 12
+
+    def to_dict(self) -> dict:
+        """兼容接口：返回与 generate_year_calendar 相同的 {月份: 6×7列表} 字典"""
+        return {grid.month: grid.to_matrix() for grid in self}
+
+    def __eq__(self, other):
+        if not isinstance(other, YearGrid):
+            return NotImplemented
+        return self.year == other.year
+
+    def __hash__(self):
+        return hash(self.year)
+
+    def __repr__(self):
+        return f"YearGrid({self.year})"
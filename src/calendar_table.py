@@ -0,0 +1,187 @@
+# 预生成日历表文件：构建 + 内存映射读取
+"""
+表文件格式（小端序，版本2）：
+
+    文件头   16字节   魔数 b"PCAL" | 版本 u16 | 文件头长度 u16 | 首日序数 i32 | 天数 i32
+    节日表   2 + 24×N 字节   节日个数 u16，之后每个节日名为 UTF-8，补0到24字节
+    日记录   3×天数 字节     每天: 农历编码 u16 | 农历节日编号 u8（0表示无，i 表示节日表第i个）
+
+农历编码与 my_lunar.LunarDays 相同（年份标志相对于该日公历年-1）。
+表里只存 my_lunar.get_lunar_info 需要的农历数据：节日编号只对应农历节日和除夕；
+星期由 calendar_core 查表得到，公历节日和计算型节日由 festivals 模块的年索引给出，
+都不在表中（版本1的每条记录多存了一个运行时从未读取的星期字节，已去掉）。
+读取时只解析文件头，查询某天的农历只需一次偏移计算；文件以只读方式 mmap，
+多个进程共享同一份页缓存。
+
+生成方式：
+    python src/calendar_table.py --start 1901 --end 2100 --output data/calendar_table.bin
+"""
+import argparse
+import mmap
+import os
+import struct
+
+from solar import SolarCalendar
+
+MAGIC = b"PCAL"
+VERSION = 2
+
+_HEADER = struct.Struct("<4sHHii")
+_FESTIVAL_COUNT = struct.Struct("<H")
+_FESTIVAL_NAME_SIZE = 24
+_RECORD = struct.Struct("<HB")
+
+# 默认输出位置：项目根目录下的 data/
+DEFAULT_TABLE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "calendar_table.bin")
+
+
+class CalendarTable:
+    """
+    只读映射的日历表文件
+    """
+
+    __slots__ = ("path", "first_ordinal", "day_count", "_file", "_mmap",
+                 "_records_offset", "_festival_names")
+
+    def __init__(self, path):
+        """
+        参数:
+            path: 表文件路径
+
+        异常:
+            OSError: 文件无法打开
+            ValueError: 魔数、版本或长度不符
+        """
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"表文件为空: {path}")
+
+        try:
+            magic, version, header_size, self.first_ordinal, self.day_count = \
+                _HEADER.unpack_from(self._mmap, 0)
+            if magic != MAGIC:
+                raise ValueError(f"不是日历表文件: {path}")
+            if version != VERSION:
+                raise ValueError(f"表文件版本 {version} 不受支持（需要 {VERSION}）")
+
+            (festival_count,) = _FESTIVAL_COUNT.unpack_from(self._mmap, header_size)
+            festivals_offset = header_size + _FESTIVAL_COUNT.size
+            self._records_offset = festivals_offset + festival_count * _FESTIVAL_NAME_SIZE
+            if len(self._mmap) < self._records_offset + self.day_count * _RECORD.size:
+                raise ValueError(f"表文件长度不足: {path}")
+        except (ValueError, struct.error):
+            self.close()
+            raise
+
+        # 节日名只是 memoryview 切片，用到时才解码
+        view = memoryview(self._mmap)
+        self._festival_names = [None] + [
+            view[festivals_offset + i * _FESTIVAL_NAME_SIZE:
+                 festivals_offset + (i + 1) * _FESTIVAL_NAME_SIZE]
+            for i in range(festival_count)
+        ]
+
+    def __contains__(self, ordinal: int) -> bool:
+        return self.first_ordinal <= ordinal < self.first_ordinal + self.day_count
+
+    def record(self, ordinal: int) -> tuple:
+        """
+        读取某天的记录
+
+        参数:
+            ordinal: 日期序数（见 SolarCalendar.to_ordinal）
+
+        返回:
+            tuple: (农历编码, 农历节日编号)
+        """
+        if ordinal not in self:
+            raise ValueError("日期超出表文件范围")
+        return _RECORD.unpack_from(self._mmap, self._records_offset + (ordinal - self.first_ordinal) * _RECORD.size)
+
+    def festival_name(self, festival_id: int):
+        """节日编号 → 名称（0 返回 None）"""
+        name = self._festival_names[festival_id]
+        if isinstance(name, memoryview):
+            name = bytes(name).rstrip(b"\0").decode("utf-8")
+            self._festival_names[festival_id] = name
+        return name
+
+    def close(self):
+        """解除映射并关闭文件"""
+        self._festival_names = [None]
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass  # 仍有外部 memoryview 引用时交给垃圾回收
+        self._file.close()
+
+
+def build_table_file(path, start_year: int, end_year: int) -> int:
+    """
+    生成表文件
+
+    参数:
+        path: 输出路径（目录不存在时自动创建）
+        start_year: 起始公历年
+        end_year: 结束公历年（包含），范围受 my_lunar 农历数据限制
+
+    返回:
+        int: 写入的字节数
+    """
+    from my_lunar import get_lunar_year
+
+    if end_year < start_year:
+        raise ValueError("年份范围无效")
+
+    years = [get_lunar_year(year) for year in range(start_year, end_year + 1)]
+
+    festivals = []
+    festival_ids = {}
+    records = bytearray()
+    for lunar_days in years:
+        for index, code in enumerate(lunar_days.codes):
+            festival = lunar_days[index].festival
+            if festival is not None and festival not in festival_ids:
+                festivals.append(festival)
+                festival_ids[festival] = len(festivals)
+            records += _RECORD.pack(code, festival_ids.get(festival, 0))
+
+    data = bytearray(_HEADER.pack(MAGIC, VERSION, _HEADER.size,
+                                  SolarCalendar.to_ordinal(start_year, 1, 1), len(records) // _RECORD.size))
+    data += _FESTIVAL_COUNT.pack(len(festivals))
+    for name in festivals:
+        encoded = name.encode("utf-8")
+        if len(encoded) > _FESTIVAL_NAME_SIZE:
+            raise ValueError(f"节日名过长: {name}")
+        data += encoded.ljust(_FESTIVAL_NAME_SIZE, b"\0")
+    data += records
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    # 先写临时文件再替换，正在映射旧文件的进程不受影响
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(data)
+    os.replace(temp_path, path)
+    return len(data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="生成预计算的日历表文件")
+    parser.add_argument("--start", type=int, default=1901, help="起始公历年（默认1901）")
+    parser.add_argument("--end", type=int, default=2100, help="结束公历年（默认2100）")
+    parser.add_argument("--output", default=DEFAULT_TABLE_PATH, help="输出路径")
+    args = parser.parse_args()
+
+    size = build_table_file(args.output, args.start, args.end)
+    print(f"✅ 已生成 {args.output}（{args.start}-{args.end} 年，{size} 字节）")
+    print(f"💡 运行前设置环境变量 PYCALENDAR_TABLE={args.output} 即可启用")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,67 +1,81 @@
-import calendar
+import sys
 from datetime import datetime
 
+import calendar_core
+from solar import SolarCalendar
 
-def print_aligned_calendar(year=None, month=None):
+
+def _resolve_today(today):
+    """统一 today 参数：None 表示取当前日期（整帧只取一次），也可以传 date 或 (year, month, day)"""
+    if today is None:
+        now = datetime.now()
+        return now.year, now.month, now.day
+    if isinstance(today, tuple):
+        return today
+    return today.year, today.month, today.day
+
+
+def render_aligned_calendar(year=None, month=None, today=None):
     """
-    打印对齐的月视图日历
+    渲染对齐的月视图日历，返回整帧字符串
     """
+    today = _resolve_today(today)
     if year is None or month is None:
-        now = datetime.now()
-        year, month = now.year, now.month
+        year, month = today[0], today[1]
 
     # 验证月份
     if month < 1 or month > 12:
-        print(f"错误：月份必须在1-12之间")
-        return
+        return "错误：月份必须在1-12之间\n"
 
-    # 创建日历对象
-    cal = calendar.Calendar(calendar.SUNDAY)
-    month_days = cal.monthdayscalendar(year, month)
+    # 按周排列的月历（周日开头）
+    month_days = calendar_core.month_weeks(year, month)
 
     # 设置单元格宽度
     cell_width = 4  # 每个单元格4个字符宽度
 
     # 星期标题（英文缩写）
     weekdays = ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]
+    width = len(weekdays) * cell_width
 
-    # 打印月份标题
-    title = f"{calendar.month_name[month]} {year}"
-    print(f"\n{'=' * (len(weekdays) * cell_width)}")
-    print(title.center(len(weekdays) * cell_width))
-    print(f"{'=' * (len(weekdays) * cell_width)}")
+    # 月份标题
+    title = f"{SolarCalendar.get_month_name(month)} {year}"
+    lines = ["", "=" * width, title.center(width), "=" * width]
 
-    # 打印星期标题（居中对齐）
-    for wd in weekdays:
-        print(f"{wd:^{cell_width}}", end="")
-    print()
-    print("-" * (len(weekdays) * cell_width))
+    # 星期标题（居中对齐）
+    lines.append("".join(f"{wd:^{cell_width}}" for wd in weekdays))
+    lines.append("-" * width)
 
-    # 打印日期（每个日期居中对齐）
+    # 日期（每个日期居中对齐），今天特殊标记
+    today_day = today[2] if (year, month) == today[:2] else None
     for week in month_days:
+        cells = []
         for day in week:
             if day == 0:
-                # 空日期
-                print(f"{'':^{cell_width}}", end="")
+                cells.append(f"{'':^{cell_width}}")  # 空日期
+            elif day == today_day:
+                cells.append(f"{f'[{day}]':^{cell_width}}")
             else:
-                # 如果是今天，特殊标记
-                now = datetime.now()
-                if year == now.year and month == now.month and day == now.day:
-                    print(f"{f'[{day}]':^{cell_width}}", end="")
-                else:
-                    print(f"{day:^{cell_width}d}", end="")
-        print()  # 换行
+                cells.append(f"{day:^{cell_width}d}")
+        lines.append("".join(cells))
 
-    print(f"{'=' * (len(weekdays) * cell_width)}")
+    lines.append("=" * width)
+    return "\n".join(lines) + "\n"
 
 
-def print_chinese_aligned_calendar(year=None, month=None):
+def print_aligned_calendar(year=None, month=None):
     """
-    打印对齐的中文月视图日历
+    打印对齐的月视图日历（整帧一次写出）
     """
+    sys.stdout.write(render_aligned_calendar(year, month))
+
+
+def render_chinese_aligned_calendar(year=None, month=None, today=None):
+    """
+    渲染对齐的中文月视图日历，返回整帧字符串
+    """
+    today = _resolve_today(today)
     if year is None or month is None:
-        now = datetime.now()
-        year, month = now.year, now.month
+        year, month = today[0], today[1]
 
     # 中文月份名称
     chinese_months = {
@@ -73,39 +87,43 @@ def print_chinese_aligned_calendar(year=None, month=None):
     # 中文星期（每个占2字符）
     chinese_weekdays = ["日", "一", "二", "三", "四", "五", "六"]
 
-    # 创建日历对象
-    cal = calendar.Calendar(calendar.SUNDAY)
-    month_days = cal.monthdayscalendar(year, month)
+    # 按周排列的月历（周日开头）
+    month_days = calendar_core.month_weeks(year, month)
 
     # 单元格宽度（中文需要更大宽度）
     cell_width = 6  # 每个单元格6个字符宽度
+    width = len(chinese_weekdays) * cell_width
 
-    # 打印标题
+    # 标题
     title = f"{year}年 {chinese_months[month]}"
-    print(f"\n{'=' * (len(chinese_weekdays) * cell_width)}")
-    print(title.center(len(chinese_weekdays) * cell_width))
-    print(f"{'=' * (len(chinese_weekdays) * cell_width)}")
+    lines = ["", "=" * width, title.center(width), "=" * width]
 
-    # 打印星期标题
-    for wd in chinese_weekdays:
-        print(f"星期{wd}".center(cell_width), end="")
-    print()
-    print("-" * (len(chinese_weekdays) * cell_width))
+    # 星期标题
+    lines.append("".join(f"星期{wd}".center(cell_width) for wd in chinese_weekdays))
+    lines.append("-" * width)
 
-    # 打印日期
+    # 日期
+    today_day = today[2] if (year, month) == today[:2] else None
     for week in month_days:
+        cells = []
         for day in week:
             if day == 0:
-                print(f"{'':^{cell_width}}", end="")
+                cells.append(f"{'':^{cell_width}}")
+            elif day == today_day:
+                cells.append(f"{f'[{day}]':^{cell_width}}")
             else:
-                now = datetime.now()
-                if year == now.year and month == now.month and day == now.day:
-                    print(f"{f'[{day}]':^{cell_width}}", end="")
-                else:
-                    print(f"{day:^{cell_width}d}", end="")
-        print()
-
-    print(f"{'=' * (len(chinese_weekdays) * cell_width)}")
+                cells.append(f"{day:^{cell_width}d}")
+        lines.append("".join(cells))
+
+    lines.append("=" * width)
+    return "\n".join(lines) + "\n"
+
+
+def print_chinese_aligned_calendar(year=None, month=None):
+    """
+    打印对齐的中文月视图日历（整帧一次写出）
+    """
+    sys.stdout.write(render_chinese_aligned_calendar(year, month))
 
 
 # 测试
@@ -1,31 +1,27 @@
 # 年视图模块（杨雨晨负责） 
-import os
 import sys
 
+import calendar_core
+from screen import ScreenRenderer
+
 # 月份名称
 month_names = ["January", "February", "March", "April", "May", "June",
                "July", "August", "September", "October", "November", "December"]
 
-# 每月天数（非闰年）
-month_days = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+# 每月天数（非闰年），与 calendar_core 共用同一张表
+month_days = calendar_core.MONTH_DAYS
 
-# 判断闰年
+# 判断闰年（calendar_core.is_leap_year）
 def is_leap_year(year):
-    return (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0)
+    return calendar_core.is_leap_year(year)
 
-# 基姆拉尔森计算星期几（返回 0=周日, 1=周一...6=周六）
+# 计算星期几（calendar_core.weekday，返回 0=周日, 1=周一...6=周六）
 def get_weekday(day, month, year):
-    if month < 3:
-        month += 12
-        year -= 1
-    w = (day + 2 * month + 3 * (month + 1) // 5 + year + year // 4 - year // 100 + year // 400) % 7
-    return w
+    return calendar_core.weekday(year, month, day)
 
 # 构建单个月份的日历为字符串列表（每行一个字符串），便于横向拼接
 def generate_month_lines(year, month):
-    days = month_days[month - 1]
-    if month == 2 and is_leap_year(year):
-        days = 29
+    days = calendar_core.month_days(year, month)
 
     # 标题行
     title = f"{month_names[month - 1]} {year}"
@@ -35,7 +31,7 @@ def generate_month_lines(year, month):
     lines.append(header)
 
     # 获取1号是星期几
-    first_weekday = get_weekday(1, month, year)
+    first_weekday = calendar_core.first_weekday(year, month)
     current_line = ""
 
     # 前导空格
@@ -63,11 +59,10 @@ def generate_month_lines(year, month):
 
     return lines
 
-# 显示年视图（3列并排）
-def show_year_view(year):
-    os.system('cls' if os.name == 'nt' else 'clear')
-    print(f"==================== {year} 年日历（年视图） ====================")
-    print("注：* 标记为农历初一\n")
+# 渲染年视图（3列并排）为整帧字符串
+def render_year_view(year):
+    lines = [f"==================== {year} 年日历（年视图） ====================",
+             "注：* 标记为农历初一", ""]
 
     all_months = []
     for m in range(1, 13):
@@ -81,16 +76,19 @@ def show_year_view(year):
         while len(months_in_row) < 3:
             months_in_row.append([""] * 8)
 
-        # 逐行合并三个日历
-        for i in range(8):  # 每个日历最多8行
-            line_combined = ""
-            for j, m_lines in enumerate(months_in_row):
-                if j > 0:
-                    line_combined += "    "  # 间隔4个空格
-                line_combined += f"{m_lines[i]:27}"  # 固定宽度对齐
-            print(line_combined)
+        # 逐行合并三个日历（每个日历最多8行），间隔4个空格，固定宽度对齐
+        for i in range(8):
+            lines.append("    ".join(f"{m_lines[i]:27}" for m_lines in months_in_row))
+
+        lines.append("")  # 行间空行
 
-        print()  # 行间空行
+    return "\n".join(lines) + "\n"
+
+# 显示年视图：差分重绘，不再调用 os.system 清屏
+_screen = ScreenRenderer()
+
+def show_year_view(year):
+    _screen.draw(render_year_view(year))
 
 # 主函数
 def main():
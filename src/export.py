@@ -0,0 +1,302 @@
+# 导出模块：把任意年份范围的逐日数据导出为 CSV / JSONL / ICS
+"""
+每天一行：公历日期、星期、ISO 年和周、农历日期、节日
+
+- 以年为单位生成文本块，整块写入带大缓冲的文件，可选 gzip 压缩
+- 年份范围较大时可以用进程池并行生成，结果按年份顺序写出，在途任务数有上限
+
+运行方式：python src/export.py 1900 2100 --output calendar.csv.gz [--workers 4]
+"""
+import argparse
+import csv
+import gzip
+import io
+import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import Optional
+
+from solar import SolarCalendar
+from my_lunar import LUNAR_MIN_YEAR, LUNAR_MAX_YEAR, get_lunar_info, get_lunar_year
+from festivals import get_month_festivals
+
+
+FORMATS = ("csv", "jsonl", "ics")
+
+# 每行的字段
+FIELDS = ("date", "weekday", "iso_year", "iso_week", "lunar", "festivals")
+
+# 文件写缓冲大小（字节）
+BUFFER_SIZE = 1 << 20
+
+# 农历数据覆盖的公历年份（1900年1月和2101年1月只有部分日期有数据）
+_LUNAR_FIRST_YEAR, _LUNAR_LAST_YEAR = LUNAR_MIN_YEAR, LUNAR_MAX_YEAR + 1
+
+
+def _lunar_text(lunar) -> str:
+    """农历日期文字（不含节日，节日单独放在 festivals 列）"""
+    return f"农历{lunar.year}年{lunar.month_name}{lunar.day_name}"
+
+
+def iter_year_rows(year: int):
+    """
+    逐日产生某一公历年的导出行
+
+    返回:
+        generator: 依次产生与 FIELDS 对应的元组；
+                   weekday 为 0=周日…6=周六，超出农历数据范围的日期 lunar 为空字符串
+    """
+    for _, row in _iter_year_days(year):
+        yield row
+
+
+def _iter_year_days(year: int):
+    """
+    逐日产生 ((year, month, day), 导出行)，日期元组供 ICS 等格式直接使用，不必再解析 date 字符串
+    """
+    day_count = SolarCalendar.get_cumulative_days(year)[12]
+
+    # 农历：范围内整年一次查询，边界年逐日查询，范围外为空
+    lunar_days = None
+    if _LUNAR_FIRST_YEAR < year < _LUNAR_LAST_YEAR:
+        lunar_days = get_lunar_year(year)
+
+    # 节日：按月查询后转成 年内第几天 → 名称 的字典
+    festival_names = {}
+    cumulative_days = SolarCalendar.get_cumulative_days(year)
+    for month in range(1, 13):
+        for day, name in get_month_festivals(year, month):
+            festival_names.setdefault(cumulative_days[month - 1] + day, []).append(name)
+
+    # 星期和 ISO 周从1月1日开始逐日递推
+    weekday = SolarCalendar.get_first_weekday(year, 1)
+    iso_year, iso_week, iso_weekday = SolarCalendar.get_iso_calendar(year, 1, 1)
+    weeks_in_iso_year = SolarCalendar.get_iso_weeks_in_year(iso_year)
+
+    month = 1
+    for day_of_year in range(1, day_count + 1):
+        while day_of_year > cumulative_days[month]:
+            month += 1
+        day = day_of_year - cumulative_days[month - 1]
+
+        if lunar_days is not None:
+            lunar = _lunar_text(lunar_days[day_of_year - 1])
+        elif _LUNAR_FIRST_YEAR <= year <= _LUNAR_LAST_YEAR:
+            try:
+                lunar = _lunar_text(get_lunar_info(year, month, day))
+            except ValueError:
+                lunar = ""
+        else:
+            lunar = ""
+
+        yield (year, month, day), ("%04d-%02d-%02d" % (year, month, day), weekday, iso_year, iso_week,
+                                   lunar, "、".join(festival_names.get(day_of_year, ())))
+
+        weekday = (weekday + 1) % 7
+        iso_weekday += 1
+        if iso_weekday > 7:
+            iso_weekday = 1
+            iso_week += 1
+            if iso_week > weeks_in_iso_year:
+                iso_year, iso_week = iso_year + 1, 1
+                weeks_in_iso_year = SolarCalendar.get_iso_weeks_in_year(iso_year)
+
+
+# --- 各格式的文本生成 ---
+def _format_csv(rows) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(rows)
+    return buffer.getvalue()
+
+
+def _format_jsonl(rows) -> str:
+    return "".join(json.dumps(dict(zip(FIELDS, row)), ensure_ascii=False) + "\n" for row in rows)
+
+
+def _ics_escape(text: str) -> str:
+    """按 RFC 5545 转义文本值"""
+    return text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+
+
+def _ics_fold(line: str) -> str:
+    """按 RFC 5545 把超过75字节的内容行折行（不拆开多字节字符）"""
+    if len(line.encode("utf-8")) <= 75:
+        return line + "\r\n"
+    parts = []
+    current, size = "", 0
+    for char in line:
+        char_size = len(char.encode("utf-8"))
+        if size + char_size > 75:
+            parts.append(current)
+            current, size = " ", 1  # 续行以一个空格开头
+        current += char
+        size += char_size
+    parts.append(current)
+    return "\r\n".join(parts) + "\r\n"
+
+
+def _format_ics(days, stamp: str) -> str:
+    """days 为 _iter_year_days 产生的 ((year, month, day), 导出行) 序列"""
+    lines = []
+    for ymd, (date, weekday, iso_year, iso_week, lunar, festivals) in days:
+        compact = "%04d%02d%02d" % ymd
+        end = "%04d%02d%02d" % SolarCalendar.from_ordinal(SolarCalendar.to_ordinal(*ymd) + 1)
+        summary = " ".join(part for part in (lunar, festivals) if part) or date
+        lines += [
+            "BEGIN:VEVENT",
+            f"UID:{compact}@python-calendar",
+            f"DTSTAMP:{stamp}",
+            f"DTSTART;VALUE=DATE:{compact}",
+            f"DTEND;VALUE=DATE:{end}",
+            f"SUMMARY:{_ics_escape(summary)}",
+            f"DESCRIPTION:{_ics_escape(f'ISO {iso_year}-W{iso_week:02d}')}",
+            "TRANSP:TRANSPARENT",
+            "END:VEVENT",
+        ]
+    return "".join(_ics_fold(line) for line in lines)
+
+
+def _render_years(first: int, last: int, fmt: str, stamp: str) -> tuple:
+    """
+    生成 [first, last] 年的文本块（进程池任务，必须是模块级函数）
+
+    返回:
+        tuple: (文本, 行数)
+    """
+    days = [day for year in range(first, last + 1) for day in _iter_year_days(year)]
+    if fmt == "ics":
+        return _format_ics(days, stamp), len(days)
+    rows = [row for _, row in days]
+    if fmt == "csv":
+        return _format_csv(rows), len(rows)
+    return _format_jsonl(rows), len(rows)
+
+
+def _header(fmt: str) -> str:
+    if fmt == "csv":
+        return _format_csv([FIELDS])
+    if fmt == "ics":
+        return "".join(_ics_fold(line) for line in (
+            "BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//python-calendar//万年历//ZH",
+            "CALSCALE:GREGORIAN", "X-WR-CALNAME:万年历"))
+    return ""
+
+
+def _footer(fmt: str) -> str:
+    return _ics_fold("END:VCALENDAR") if fmt == "ics" else ""
+
+
+def iter_chunks(start_year: int, end_year: int, fmt: str = "csv",
+                workers: Optional[int] = 1, chunk_years: int = 8):
+    """
+    按年份顺序产生导出文本块（含文件头尾）
+
+    参数:
+        start_year: 起始年份（包含）
+        end_year: 结束年份（包含）
+        fmt: 'csv'、'jsonl' 或 'ics'
+        workers: 进程数，1 表示在当前进程串行生成，None 表示 CPU 核数
+        chunk_years: 每个文本块（进程池任务）包含的年数
+
+    返回:
+        generator: 依次产生 (文本, 行数)
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"格式必须是 {', '.join(FORMATS)} 之一")
+    if start_year < 1 or end_year < start_year:
+        raise ValueError("年份范围无效")
+    if chunk_years < 1:
+        raise ValueError("chunk_years 必须为正整数")
+
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    chunks = [(first, min(first + chunk_years - 1, end_year))
+              for first in range(start_year, end_year + 1, chunk_years)]
+    workers = workers or os.cpu_count() or 1
+
+    yield _header(fmt), 0
+    if workers == 1:
+        for first, last in chunks:
+            yield _render_years(first, last, fmt, stamp)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = deque()
+            next_chunk = 0
+            while next_chunk < len(chunks) or pending:
+                # 补满任务窗口，控制在途结果的数量
+                while next_chunk < len(chunks) and len(pending) < workers * 2:
+                    first, last = chunks[next_chunk]
+                    pending.append(pool.submit(_render_years, first, last, fmt, stamp))
+                    next_chunk += 1
+                yield pending.popleft().result()
+    yield _footer(fmt), 0
+
+
+def _detect_format(path: str) -> tuple:
+    """根据扩展名推断 (格式, 是否 gzip)，如 calendar.jsonl.gz"""
+    name = path.lower()
+    compress = name.endswith(".gz")
+    if compress:
+        name = name[:-3]
+    ext = os.path.splitext(name)[1].lstrip(".")
+    return (ext if ext in FORMATS else None), compress
+
+
+def export(path: str, start_year: int, end_year: int, fmt: Optional[str] = None,
+           compress: Optional[bool] = None, workers: Optional[int] = 1, chunk_years: int = 8) -> int:
+    """
+    导出 [start_year, end_year] 的逐日数据到文件
+
+    参数:
+        path: 输出文件路径
+        start_year: 起始年份（包含）
+        end_year: 结束年份（包含）
+        fmt: 'csv'、'jsonl' 或 'ics'，None 表示按扩展名推断
+        compress: 是否 gzip 压缩，None 表示按 .gz 扩展名推断
+        workers: 进程数，1 表示串行，None 表示 CPU 核数
+        chunk_years: 每个文本块包含的年数
+
+    返回:
+        int: 导出的行数（天数）
+
+    异常:
+        ValueError: 无法确定格式或参数无效
+    """
+    detected_format, detected_compress = _detect_format(path)
+    fmt = fmt or detected_format
+    if fmt is None:
+        raise ValueError(f"无法从文件名推断格式，请指定 {', '.join(FORMATS)} 之一")
+    compress = detected_compress if compress is None else compress
+
+    # CSV 和 ICS 自己控制换行符，不做转换
+    if compress:
+        file = gzip.open(path, "wt", encoding="utf-8", newline="")
+    else:
+        file = open(path, "w", encoding="utf-8", newline="", buffering=BUFFER_SIZE)
+
+    total = 0
+    with file:
+        for text, count in iter_chunks(start_year, end_year, fmt, workers, chunk_years):
+            file.write(text)
+            total += count
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="导出逐日日历数据（CSV / JSONL / ICS）")
+    parser.add_argument("start", type=int, help="起始年份")
+    parser.add_argument("end", type=int, help="结束年份（包含）")
+    parser.add_argument("--output", required=True, help="输出文件，扩展名决定格式，.gz 结尾时压缩")
+    parser.add_argument("--format", choices=FORMATS, help="输出格式（默认按扩展名推断）")
+    parser.add_argument("--workers", type=int, default=1, help="进程数（默认1，0 表示 CPU 核数）")
+    parser.add_argument("--chunk-years", type=int, default=8, help="每个任务包含的年数（默认8）")
+    args = parser.parse_args()
+
+    rows = export(args.output, args.start, args.end, fmt=args.format,
+                  workers=args.workers or None, chunk_years=args.chunk_years)
+    print(f"已导出 {rows} 行到 {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+# 节日模块：公历节日、农历节日与计算型节日（清明、复活节等）的统一查询
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import Optional
+
+from solar import SolarCalendar
+from my_lunar import LUNAR_FESTIVALS, LUNAR_MIN_YEAR, LUNAR_MAX_YEAR, lunar_month_starts, lunar_to_solar
+
+
+# 农历固定节日 LUNAR_FESTIVALS 定义在 my_lunar 中（农历标注也用它），这里直接导入
+
+# 公历固定节日（月, 日）→ 名称
+SOLAR_FESTIVALS = {
+    (1, 1): "元旦",
+    (2, 14): "情人节",
+    (3, 8): "妇女节",
+    (3, 12): "植树节",
+    (4, 1): "愚人节",
+    (5, 1): "劳动节",
+    (5, 4): "青年节",
+    (6, 1): "儿童节",
+    (7, 1): "建党节",
+    (8, 1): "建军节",
+    (9, 10): "教师节",
+    (10, 1): "国庆节",
+    (12, 24): "平安夜",
+    (12, 25): "圣诞节",
+}
+
+def easter(year: int) -> tuple:
+    """
+    复活节日期（格里历，匿名算法 / Meeus-Jones-Butcher）
+
+    返回:
+        tuple: (month, day)
+    """
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return month, day + 1
+
+
+def qingming(year: int) -> tuple:
+    """
+    清明节日期（太阳视黄经15°所在的那天，北京时间）
+
+    返回:
+        tuple: (month, day)
+    """
+    from astro import get_solar_terms  # 天文计算依赖 numpy，用到时再导入
+
+    for day, name in get_solar_terms(year, 4):
+        if name == "清明":
+            # 按4月1日加偏移换算：公元一万年前后历法漂移，清明可能落到3月底（偏移≤0）
+            return SolarCalendar.from_ordinal(SolarCalendar.to_ordinal(year, 4, 1) + day - 1)[1:]
+    raise ValueError(f"{year}年4月没有找到清明")
+
+
+def _nth_weekday(year: int, month: int, weekday: int, nth: int) -> tuple:
+    """某月第 nth 个星期 weekday（0=周日）"""
+    first_weekday = SolarCalendar.get_first_weekday(year, month)
+    return month, 1 + (weekday - first_weekday) % 7 + 7 * (nth - 1)
+
+
+# 计算型节日：名称 → 函数(year) → (month, day)
+COMPUTED_FESTIVALS = {
+    "清明节": qingming,
+    "复活节": easter,
+    "母亲节": lambda year: _nth_weekday(year, 5, 0, 2),
+    "父亲节": lambda year: _nth_weekday(year, 6, 0, 3),
+}
+
+
+class FestivalCalendar:
+    """
+    节日日历
+
+    每个公历年首次查询时把全部节日展开成一张按日期排序的索引（序数列表 + 名称列表），
+    之后按月查询和“下一次出现”都是二分查找；已生成的年份放在 LRU 缓存中
+    """
+
+    # 查找下一次出现时最多向后查找的年数（每个节日一年至少出现一次）
+    _SEARCH_YEARS = 2
+
+    def __init__(self, solar_festivals=None, lunar_festivals=None,
+                 computed_festivals=None, include_eve: bool = True, cache_size: int = 64):
+        """
+        参数:
+            solar_festivals: 公历节日 {(month, day): 名称}，None 表示使用 SOLAR_FESTIVALS
+            lunar_festivals: 农历节日 {(lunar_month, lunar_day): 名称}，None 表示使用 LUNAR_FESTIVALS
+            computed_festivals: 计算型节日 {名称: 函数(year) → (month, day)}，
+                                None 表示使用 COMPUTED_FESTIVALS，传入 {} 可关闭
+            include_eve: 是否包含除夕（农历年最后一天）
+            cache_size: 最多缓存的年份索引数
+        """
+        self.solar_festivals = dict(SOLAR_FESTIVALS if solar_festivals is None else solar_festivals)
+        self.lunar_festivals = dict(LUNAR_FESTIVALS if lunar_festivals is None else lunar_festivals)
+        self.computed_festivals = dict(COMPUTED_FESTIVALS if computed_festivals is None else computed_festivals)
+        self.include_eve = include_eve
+        self._year_index = lru_cache(maxsize=cache_size)(self._build_year_index)
+
+    # --- 查询 ---
+    def get_festivals(self, year: int, month: int, day: int) -> tuple:
+        """
+        查询某天的节日
+
+        返回:
+            tuple: 节日名称，没有节日返回空元组
+        """
+        ordinals, names = self._year_index(year)
+        ordinal = SolarCalendar.to_ordinal(year, month, day)
+        return names[bisect_left(ordinals, ordinal):bisect_right(ordinals, ordinal)]
+
+    def festivals_in_month(self, year: int, month: int) -> list:
+        """
+        查询某月的全部节日
+
+        返回:
+            list: [(day, 名称), ...]，按日期排序，同一天有多个节日时各占一项
+        """
+        ordinals, names = self._year_index(year)
+        first = SolarCalendar.to_ordinal(year, month, 1)
+        start = bisect_left(ordinals, first)
+        end = bisect_left(ordinals, first + SolarCalendar.get_month_days(year, month))
+        return [(ordinals[i] - first + 1, names[i]) for i in range(start, end)]
+
+    def next_occurrence(self, date: tuple, name: Optional[str] = None):
+        """
+        查找 date 之后（不含当天）的下一个节日
+
+        参数:
+            date: 起始日期 (year, month, day)
+            name: 只查找该名称的节日；None 表示任意节日
+
+        返回:
+            tuple: ((year, month, day), 名称)，找不到返回 None
+        """
+        ordinal = SolarCalendar.to_ordinal(*date)
+        for year in range(date[0], date[0] + self._SEARCH_YEARS + 1):
+            ordinals, names = self._year_index(year)
+            for i in range(bisect_right(ordinals, ordinal), len(ordinals)):
+                if name is None or names[i] == name:
+                    return SolarCalendar.from_ordinal(ordinals[i]), names[i]
+        return None
+
+    def clear_cache(self):
+        """修改节日表后清空已生成的年份索引"""
+        self._year_index.cache_clear()
+
+    # --- 年索引 ---
+    def _build_year_index(self, year: int) -> tuple:
+        """
+        展开某个公历年的全部节日
+
+        返回:
+            tuple: (ordinals, names)，两个等长元组，按日期排序
+        """
+        first = SolarCalendar.to_ordinal(year, 1, 1)
+        last = first + SolarCalendar.get_cumulative_days(year)[12]
+        entries = []
+
+        for (month, day), name in self.solar_festivals.items():
+            if SolarCalendar.validate_date(year, month, day):
+                entries.append((SolarCalendar.to_ordinal(year, month, day), name))
+
+        for name, function in self.computed_festivals.items():
+            entries.append((SolarCalendar.to_ordinal(year, *function(year)), name))
+
+        # 公历年内同时包含上一农历年年末（腊八、除夕）和本农历年的节日
+        for lunar_year in (year - 1, year):
+            if not LUNAR_MIN_YEAR <= lunar_year <= LUNAR_MAX_YEAR:
+                continue
+            for (lunar_month, lunar_day), name in self.lunar_festivals.items():
+                try:
+                    ordinal = SolarCalendar.to_ordinal(*lunar_to_solar(lunar_year, lunar_month, lunar_day))
+                except ValueError:  # 小月没有三十
+                    continue
+                if first <= ordinal < last:
+                    entries.append((ordinal, name))
+            if self.include_eve:
+                # 下一年正月初一的前一天；数据最后一年的下一年正月初一也在表中
+                ordinal = lunar_month_starts(lunar_year)[-1] - 1
+                if first <= ordinal < last:
+                    entries.append((ordinal, "除夕"))
+
+        entries.sort(key=lambda entry: entry[0])
+        return tuple(ordinal for ordinal, _ in entries), tuple(name for _, name in entries)
+
+
+# 默认节日日历，供视图直接调用
+_default_calendar = FestivalCalendar()
+
+
+def get_festivals(year: int, month: int, day: int) -> tuple:
+    """查询某天的节日（默认节日表）"""
+    return _default_calendar.get_festivals(year, month, day)
+
+
+def get_month_festivals(year: int, month: int) -> list:
+    """查询某月的全部节日（默认节日表），返回 [(day, 名称), ...]"""
+    return _default_calendar.festivals_in_month(year, month)
+
+
+def next_festival(date: tuple, name: Optional[str] = None):
+    """查找 date 之后的下一个节日（默认节日表），返回 ((year, month, day), 名称) 或 None"""
+    return _default_calendar.next_occurrence(date, name)
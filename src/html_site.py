@@ -0,0 +1,364 @@
+# 静态网站模块：生成可浏览的年/月 HTML 日历页面，增量重建
+"""
+输出目录结构：
+    index.html            年份索引
+    style.css
+    2025/index.html       年视图（12个小月历）
+    2025/01.html ...      月视图（农历、节日、纯文本版）
+    manifest.json         每个页面内容的 SHA-256
+
+重建时先渲染页面再比较哈希，只改写内容有变化的页面（例如更新了农历表或节日表），
+未变化的文件保持原样，修改时间也不变；年份较多时可以按年分块并行生成
+
+运行方式：python src/html_site.py 1900 2100 --output site [--workers 4]
+"""
+import argparse
+import hashlib
+import html
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from string import Template
+from typing import Optional
+
+import views
+from solar import SolarCalendar
+from my_lunar import get_lunar_info, get_lunar_month, lunar_ordinal_range
+from festivals import get_month_festivals
+
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+_WEEKDAY_HEADER = "".join(f"<th>{name}</th>" for name in "日一二三四五六")
+
+# --- 模板（模块加载时编译一次）---
+PAGE_TEMPLATE = Template("""<!DOCTYPE html>
+<html lang="zh-CN">
+<head>
+<meta charset="utf-8">
+<title>$title</title>
+<link rel="stylesheet" href="${root}style.css">
+</head>
+<body>
+<nav>$nav</nav>
+<h1>$title</h1>
+$body
+</body>
+</html>
+""")
+
+MONTH_TABLE_TEMPLATE = Template("""<table class="$css_class">
+<caption>$caption</caption>
+<thead><tr>$header</tr></thead>
+<tbody>
+$rows
+</tbody>
+</table>""")
+
+MONTH_BODY_TEMPLATE = Template("""$table
+$festivals
+<h2>纯文本</h2>
+<pre>$text</pre>""")
+
+STYLE_SHEET = """body { font-family: sans-serif; margin: 2em; }
+nav a { margin-right: 1em; }
+table { border-collapse: collapse; margin: 0 1em 1em 0; }
+th, td { border: 1px solid #ccc; padding: 0.3em; text-align: center; vertical-align: top; }
+table.month td { width: 5em; height: 3.5em; }
+table.mini { display: inline-table; font-size: 0.85em; }
+.lunar { display: block; color: #888; font-size: 0.8em; }
+.festival { display: block; color: #c00; font-size: 0.8em; }
+.first-day { font-weight: bold; }
+.weekend { background: #f7f7f7; }
+"""
+
+
+def _link(href: str, text: str) -> str:
+    return f'<a href="{html.escape(href)}">{html.escape(text)}</a>'
+
+
+def _month_lunar(year: int, month: int) -> list:
+    """
+    整月农历数据，下标 day-1 对应第 day 天
+
+    整月查询超出农历数据范围时（1900年1月、2101年1月只有部分日期有数据）逐日查询，
+    范围外的日期为 None，与年视图经 views.get_lunar_first_days 的标记一致
+    """
+    try:
+        return list(get_lunar_month(year, month))
+    except ValueError:
+        pass
+    first, last = lunar_ordinal_range()
+    start = SolarCalendar.to_ordinal(year, month, 1)
+    return [get_lunar_info(*SolarCalendar.from_ordinal(ordinal)) if first <= ordinal < last else None
+            for ordinal in range(start, start + SolarCalendar.get_month_days(year, month))]
+
+
+def _table_rows(matrix, cell) -> str:
+    """把 6×7 矩阵渲染成表格行，空白周省略；cell(day, column) 返回单元格内部 HTML"""
+    rows = []
+    for week in matrix:
+        if not any(week):
+            continue
+        cells = []
+        for column, day in enumerate(week):
+            css = ' class="weekend"' if column in (0, 6) else ""
+            cells.append(f"<td{css}>{cell(day, column) if day else ''}</td>")
+        rows.append("<tr>" + "".join(cells) + "</tr>")
+    return "\n".join(rows)
+
+
+# --- 页面渲染 ---
+def _in_range(year: int, start_year: Optional[int], end_year: Optional[int]) -> bool:
+    """year 是否在生成范围内（None 表示该侧不限，但年份至少为1）"""
+    return year >= max(1, start_year or 1) and (end_year is None or year <= end_year)
+
+
+def render_month_page(year: int, month: int, start_year: Optional[int] = None,
+                      end_year: Optional[int] = None) -> str:
+    """
+    渲染月视图页面
+
+    参数:
+        year: 年份
+        month: 月份
+        start_year / end_year: 生成范围，上个月/下个月落在范围外时不放导航链接；None 表示不限
+
+    返回:
+        str: 完整 HTML 文本
+    """
+    lunar_days = _month_lunar(year, month)
+    festivals = {}
+    for day, name in get_month_festivals(year, month):
+        festivals.setdefault(day, []).append(name)
+
+    def cell(day, column):
+        parts = [f"<b>{day}</b>"]
+        lunar = lunar_days[day - 1]
+        if lunar is not None:
+            label = lunar.month_name if lunar.is_first_day else lunar.day_name
+            css = "lunar first-day" if lunar.is_first_day else "lunar"
+            parts.append(f'<span class="{css}">{label}</span>')
+        for name in festivals.get(day, ()):
+            parts.append(f'<span class="festival">{html.escape(name)}</span>')
+        return "".join(parts)
+
+    table = MONTH_TABLE_TEMPLATE.substitute(
+        css_class="month", caption=f"{year}年{month}月", header=_WEEKDAY_HEADER,
+        rows=_table_rows(SolarCalendar.generate_month_matrix(year, month), cell))
+    festival_list = "".join(f"<li>{month}月{day}日 {html.escape('、'.join(names))}</li>"
+                            for day, names in sorted(festivals.items()))
+    body = MONTH_BODY_TEMPLATE.substitute(
+        table=table,
+        festivals=f"<h2>本月节日</h2>\n<ul>{festival_list}</ul>" if festival_list else "",
+        text=html.escape("\n".join(line.rstrip() for line in views.generate_month_lines(year, month)).rstrip()))
+
+    previous_year, previous_month = (year - 1, 12) if month == 1 else (year, month - 1)
+    next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+    nav = [_link("index.html", f"{year}年")]
+    if _in_range(previous_year, start_year, end_year):
+        nav.insert(0, _link(f"../{previous_year}/{previous_month:02d}.html", "上个月"))
+    if _in_range(next_year, start_year, end_year):
+        nav.append(_link(f"../{next_year}/{next_month:02d}.html", "下个月"))
+
+    return PAGE_TEMPLATE.substitute(title=f"{year}年{month}月", root="../", nav=" ".join(nav), body=body)
+
+
+def render_year_page(year: int, start_year: Optional[int] = None, end_year: Optional[int] = None) -> str:
+    """
+    渲染年视图页面（12个小月历，农历初一加粗）
+
+    参数:
+        year: 年份
+        start_year / end_year: 生成范围，上一年/下一年落在范围外时不放导航链接；None 表示不限
+
+    返回:
+        str: 完整 HTML 文本
+    """
+    tables = []
+    for month in range(1, 13):
+        first_days = views.get_lunar_first_days(year, month, SolarCalendar.get_month_days(year, month))
+
+        def cell(day, column, first_days=first_days):
+            return f'<span class="first-day">{day}</span>' if day in first_days else str(day)
+
+        tables.append(MONTH_TABLE_TEMPLATE.substitute(
+            css_class="mini", caption=_link(f"{month:02d}.html", f"{month}月"), header=_WEEKDAY_HEADER,
+            rows=_table_rows(SolarCalendar.generate_month_matrix(year, month), cell)))
+
+    nav = [_link("../index.html", "全部年份")]
+    if _in_range(year - 1, start_year, end_year):
+        nav.insert(0, _link(f"../{year - 1}/index.html", "上一年"))
+    if _in_range(year + 1, start_year, end_year):
+        nav.append(_link(f"../{year + 1}/index.html", "下一年"))
+    body = "<p>加粗的日期为农历初一</p>\n" + "\n".join(tables)
+    return PAGE_TEMPLATE.substitute(title=f"{year}年", root="../", nav=" ".join(nav), body=body)
+
+
+def render_index_page(years) -> str:
+    """渲染年份索引页"""
+    items = "\n".join(f"<li>{_link(f'{year}/index.html', f'{year}年')}</li>" for year in years)
+    return PAGE_TEMPLATE.substitute(title="万年历", root="", nav="", body=f"<ul>\n{items}\n</ul>")
+
+
+# --- 增量写入 ---
+def _content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _write_if_changed(output_dir: str, path: str, text: str, old_hash: Optional[str]) -> tuple:
+    """
+    内容哈希与上次不同（或文件不存在）时才写入，先写临时文件再替换
+
+    返回:
+        tuple: (相对路径, 哈希, 是否写入)
+    """
+    digest = _content_hash(text)
+    full_path = os.path.join(output_dir, path)
+    if digest == old_hash and os.path.exists(full_path):
+        return path, digest, False
+
+    os.makedirs(os.path.dirname(full_path), exist_ok=True)
+    temp_path = full_path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8", newline="\n") as file:
+        file.write(text)
+    os.replace(temp_path, full_path)
+    return path, digest, True
+
+
+def _init_lunar_functions():
+    """
+    向 views 注入农历查询函数，年视图和纯文本版才有初一标记
+    （进程池的 initializer；串行构建时由 build_site 调用，结束后恢复原值）
+    """
+    views.set_lunar_function(get_lunar_info)  # 整月查询超出农历数据范围时逐日查询
+    views.set_lunar_month_function(get_lunar_month)
+
+
+def _build_years(output_dir: str, first: int, last: int, old_hashes: dict,
+                 start_year: int, end_year: int) -> list:
+    """
+    生成 [first, last] 年的年页面和月页面（进程池任务，必须是模块级函数）
+
+    参数:
+        start_year / end_year: 整个网站的年份范围，用于省略指向范围外的导航链接
+
+    返回:
+        list: [(相对路径, 哈希, 是否写入), ...]
+    """
+    results = []
+    for year in range(first, last + 1):
+        path = f"{year}/index.html"
+        results.append(_write_if_changed(output_dir, path, render_year_page(year, start_year, end_year),
+                                         old_hashes.get(path)))
+        for month in range(1, 13):
+            path = f"{year}/{month:02d}.html"
+            results.append(_write_if_changed(output_dir, path,
+                                             render_month_page(year, month, start_year, end_year),
+                                             old_hashes.get(path)))
+    return results
+
+
+def _load_manifest(output_dir: str) -> tuple:
+    """
+    读取上次构建的清单
+
+    返回:
+        tuple: (页面哈希字典, 清单文件本身的哈希)；不存在时为 ({}, None)，格式不对时页面哈希为空字典
+    """
+    try:
+        with open(os.path.join(output_dir, MANIFEST_NAME), encoding="utf-8") as file:
+            text = file.read()
+    except OSError:
+        return {}, None
+
+    digest = _content_hash(text)
+    try:
+        manifest = json.loads(text)
+    except ValueError:
+        return {}, digest
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        return {}, digest
+    return manifest.get("pages", {}), digest
+
+
+def build_site(output_dir: str, start_year: int, end_year: int,
+               workers: Optional[int] = 1, chunk_years: int = 4) -> dict:
+    """
+    增量生成 [start_year, end_year] 的静态网站
+
+    参数:
+        output_dir: 输出目录
+        start_year: 起始年份（包含）
+        end_year: 结束年份（包含）
+        workers: 进程数，1 表示串行，None 表示 CPU 核数
+        chunk_years: 每个进程池任务包含的年数
+
+    返回:
+        dict: {"pages": 页面总数, "written": 改写数, "unchanged": 未变化数}
+    """
+    if start_year < 1 or end_year < start_year:
+        raise ValueError("年份范围无效")
+    if chunk_years < 1:
+        raise ValueError("chunk_years 必须为正整数")
+
+    os.makedirs(output_dir, exist_ok=True)
+    old_hashes, manifest_hash = _load_manifest(output_dir)
+    workers = workers or os.cpu_count() or 1
+
+    # 每个任务只带上自己那几年的旧哈希
+    tasks = []
+    for first in range(start_year, end_year + 1, chunk_years):
+        last = min(first + chunk_years - 1, end_year)
+        prefixes = tuple(f"{year}/" for year in range(first, last + 1))
+        tasks.append((output_dir, first, last,
+                      {path: digest for path, digest in old_hashes.items() if path.startswith(prefixes)},
+                      start_year, end_year))
+
+    results = [
+        _write_if_changed(output_dir, "style.css", STYLE_SHEET, old_hashes.get("style.css")),
+        _write_if_changed(output_dir, "index.html", render_index_page(range(start_year, end_year + 1)),
+                          old_hashes.get("index.html")),
+    ]
+    if workers == 1:
+        saved_functions = views.get_lunar_functions()
+        _init_lunar_functions()
+        try:
+            for task in tasks:
+                results.extend(_build_years(*task))
+        finally:
+            views.set_lunar_function(saved_functions[0])
+            views.set_lunar_month_function(saved_functions[1])
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_lunar_functions) as pool:
+            for chunk in pool.map(_build_years, *zip(*tasks)):
+                results.extend(chunk)
+
+    # 合并清单：范围外的旧页面保留原记录；内容没变时清单文件也不动
+    pages = dict(old_hashes)
+    pages.update((path, digest) for path, digest, _ in results)
+    _write_if_changed(output_dir, MANIFEST_NAME,
+                      json.dumps({"version": MANIFEST_VERSION, "pages": pages}, indent=0, sort_keys=True),
+                      manifest_hash)
+
+    written = sum(1 for _, _, changed in results if changed)
+    return {"pages": len(results), "written": written, "unchanged": len(results) - written}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="生成静态 HTML 日历网站（增量重建）")
+    parser.add_argument("start", type=int, help="起始年份")
+    parser.add_argument("end", type=int, help="结束年份（包含）")
+    parser.add_argument("--output", default="site", help="输出目录（默认 site）")
+    parser.add_argument("--workers", type=int, default=1, help="进程数（默认1，0 表示 CPU 核数）")
+    parser.add_argument("--chunk-years", type=int, default=4, help="每个任务包含的年数（默认4）")
+    args = parser.parse_args()
+
+    stats = build_site(args.output, args.start, args.end,
+                       workers=args.workers or None, chunk_years=args.chunk_years)
+    print(f"共 {stats['pages']} 个页面：改写 {stats['written']} 个，未变化 {stats['unchanged']} 个")
+
+
+if __name__ == "__main__":
+    main()
@@ -57,6 +57,8 @@ current_dir, project_root = setup_project_paths()
 print("-" * 50)
 print("🔄 正在加载团队开发模块...")
 
+import calendar_core  # 闰年/星期核心，备用视图也依赖它
+
 # 直接导入所有模块
 try:
     from my_keyboard import KeyboardController
@@ -73,54 +75,79 @@ except Exception as e:
     SolarCalendar = None
 
 try:
-    from my_lunar import get_lunar_date
+    from my_lunar import get_lunar_date, get_lunar_info, get_lunar_month
     print("✅ lunar 模块导入成功")
 except Exception as e:
     print(f"⚠️  lunar 模块导入失败: {e}")
     get_lunar_date = None
+    get_lunar_info = None
+    get_lunar_month = None
+
+try:
+    from festivals import get_month_festivals
+    print("✅ festivals 模块导入成功")
+except Exception as e:
+    print(f"⚠️  festivals 模块导入失败: {e}")
+    get_month_festivals = None
 
 try:
-    from views import display_month_view, display_year_view
+    from views import set_lunar_function, set_lunar_month_function
+    if get_lunar_info:
+        set_lunar_function(get_lunar_info)  # 注入结构化农历查询，用于标记初一
+        set_lunar_month_function(get_lunar_month)  # 整月批量查询，每月只算一次
     print("✅ views 模块导入成功")
 except Exception as e:
     print(f"⚠️  views 模块导入失败: {e}")
-    display_month_view = None
-    display_year_view = None
+
+try:
+    from render import render, write_frame
+    print("✅ render 模块导入成功")
+except Exception as e:
+    print(f"⚠️  render 模块导入失败: {e}")
+    render = None
+    write_frame = None
+
+try:
+    from screen import ScreenRenderer
+except Exception as e:
+    print(f"⚠️  screen 模块导入失败: {e}")
+    ScreenRenderer = None
+
+try:
+    from prefetch import Prefetcher
+except Exception as e:
+    print(f"⚠️  prefetch 模块导入失败: {e}")
+    Prefetcher = None
 
 print("-" * 50)
 
 
 # ========== 🖼️ 备用视图实现（当 views 模块缺失时）==========
 def simple_month_view(year, month):
-    """简单月视图（备用）"""
-    from calendar import monthcalendar, month_name
+    """简单月视图（备用），返回整帧文本"""
+    lines = ["", f"📅 {year}年 {month}月", "=" * 35,
+             " 日   一   二   三   四   五   六", "-" * 35]
 
-    print(f"\n📅 {year}年 {month_name[month]}月")
-    print("=" * 35)
-    print(" 日   一   二   三   四   五   六")
-    print("-" * 35)
-
-    cal = monthcalendar(year, month)
-    for week in cal:
+    for week in calendar_core.month_weeks(year, month):
         line = ""
         for day in week:
             if day == 0:
                 line += "     "
             else:
                 line += f"{day:2d}  "
-        print(f" {line}")
-    print("=" * 35)
+        lines.append(f" {line}")
+    lines.append("=" * 35)
+    return "\n".join(lines) + "\n"
 
 
 def simple_year_view(year):
-    """简单年视图（备用）"""
-    print(f"\n📊 {year}年 全年概览")
-    print("=" * 40)
+    """简单年视图（备用），返回整帧文本"""
+    lines = ["", f"📊 {year}年 全年概览", "=" * 40]
     for m in range(1, 13):
-        q = (m + 2) // 3  # 第几季度
-        days = 31 if m in [1, 3, 5, 7, 8, 10, 12] else 30 if m != 2 else 29 if (year % 4 == 0 and year % 100 != 0) or year % 400 == 0 else 28
-        print(f"{m:2d}月 ({days:2d}天) | {'■' * 6}")
-    print("=" * 40)
+        days = calendar_core.month_days(year, m)
+        lines.append(f"{m:2d}月 ({days:2d}天) | {'■' * 6}")
+    lines.append("=" * 40)
+    return "\n".join(lines) + "\n"
 
 
 # ========== 👥 开发团队信息展示 ==========
@@ -155,6 +182,10 @@ class CalendarApp:
         }
         self.keyboard_controller = None
         self.is_running = False
+        # 差分重绘：按键时只重写变化的行，不再每次 fork 一个 shell 清屏
+        self.screen = ScreenRenderer() if ScreenRenderer else None
+        # 后台把相邻月份/年份预先渲染进渲染缓存，下一次按键直接命中
+        self.prefetcher = Prefetcher() if Prefetcher and render else None
 
     def keyboard_callback(self, new_state):
         """接收键盘控制器传来的状态更新"""
@@ -162,70 +193,96 @@ class CalendarApp:
         self.display_current_view()
 
     def display_current_view(self):
-        """根据当前状态显示视图"""
-        os.system('cls' if os.name == 'nt' else 'clear')  # 清屏
-
-        print("\n" + "=" * 50)
-        print("        📅 Python 万年历系统")
-        print("=" * 50)
-
-        view_name = "月视图" if self.state['view'] == 'month' else "年视图"
-        print(f"📍 当前位置: {self.state['year']}年{self.state['month']:02d}月 | 模式: {view_name}")
-        print("-" * 50)
-
-        # 显示内容
-        if self.state['view'] == 'month':
-            self._show_month()
+        """根据当前状态显示视图（整帧拼成一个字符串，一次写出）"""
+        frame = self.render_current_view()
+        if self.screen:
+            self.screen.draw(frame)
+        elif write_frame:
+            write_frame(frame)
         else:
-            self._show_year()
-
-        self.show_help()
+            sys.stdout.write(frame)
+            sys.stdout.flush()
 
-    def _show_month(self):
-        """显示月视图（优先使用模块，否则降级）"""
-        year, month = self.state['year'], self.state['month']
-        if display_month_view:
+    def render_current_view(self):
+        """渲染当前状态对应的整帧文本"""
+        view_name = "月视图" if self.state['view'] == 'month' else "年视图"
+        parts = [
+            "\n" + "=" * 50 + "\n",
+            "        📅 Python 万年历系统\n",
+            "=" * 50 + "\n",
+            f"📍 当前位置: {self.state['year']}年{self.state['month']:02d}月 | 模式: {view_name}\n",
+            "-" * 50 + "\n",
+        ]
+
+        # 内容（视图走渲染缓存，预取过的直接命中），再把相邻视图交给后台线程
+        view, year, month = self.state['view'], self.state['year'], self.state['month']
+        if view != 'month':
+            view = 'year'
+        parts.append(self._render_content(view, year, month))
+        if self.prefetcher:
+            self.prefetcher.schedule(view, year, month)
+
+        parts.append(self._render_help())
+        return "".join(parts)
+
+    def _render_view(self, view, fallback, *args):
+        """渲染视图：优先走渲染缓存，模块缺失时使用备用视图"""
+        if render:
             try:
-                display_month_view(year, month)
+                return render(view, *args)
             except Exception as e:
-                print(f"[警告] display_month_view 执行出错: {e}")
-        else:
-            simple_month_view(year, month)
+                return f"[警告] {view} 视图渲染出错: {e}\n"
+        return fallback(*args)
+
+    def _render_content(self, view, year, month=None):
+        """渲染视图内容（不含标题和操作提示）"""
+        if view == 'month':
+            return self._render_month(year, month)
+        return self._render_year(year)
+
+    def _render_month(self, year, month):
+        """渲染月视图及农历、节日信息"""
+        parts = [self._render_view("month", simple_month_view, year, month)]
 
-        # 显示农历首日
-        if get_lunar_date:
+        # 农历首日（与月视图共用同一次整月查询的缓存结果）
+        if get_lunar_month:
             try:
-                lunar_info = get_lunar_date(year, month, 1)
-                print(f"\n🌙 本月农历起始: {lunar_info}")
+                try:
+                    lunar_info = get_lunar_month(year, month)[0]
+                except ValueError:
+                    # 该月只有部分日期在农历数据范围内，单独查询1号
+                    lunar_info = get_lunar_info(year, month, 1)
+                parts.append(f"\n🌙 本月农历起始: {lunar_info}\n")
             except Exception as e:
-                print(f"\n⚠️  农历数据获取失败: {e}")
+                parts.append(f"\n⚠️  农历数据获取失败: {e}\n")
 
-    def _show_year(self):
-        """显示年视图"""
-        year = self.state['year']
-        if display_year_view:
+        # 本月节日（按年建立的节日索引，逐月二分查询）
+        if get_month_festivals:
             try:
-                display_year_view(year)
+                festivals = get_month_festivals(year, month)
+                if festivals:
+                    parts.append("🎉 本月节日: " + "  ".join(f"{day}日{name}" for day, name in festivals) + "\n")
             except Exception as e:
-                print(f"[警告] display_year_view 执行出错: {e}")
-        else:
-            simple_year_view(year)
-
-        # 年度统计
-        is_leap = (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0)
-        print(f"\n📆 {year}年 统计:")
-        print(f"  总天数: {366 if is_leap else 365}")
-        print(f"  是否闰年: {'是' if is_leap else '否'}")
-
-    def show_help(self):
+                parts.append(f"⚠️  节日数据获取失败: {e}\n")
+        return "".join(parts)
+
+    def _render_year(self, year):
+        """渲染年视图及年度统计"""
+        is_leap = calendar_core.is_leap_year(year)
+        return (self._render_view("year", simple_year_view, year)
+                + f"\n📆 {year}年 统计:\n"
+                + f"  总天数: {366 if is_leap else 365}\n"
+                + f"  是否闰年: {'是' if is_leap else '否'}\n")
+
+    def _render_help(self):
         """操作提示"""
-        print("\n" + "-" * 50)
-        print("📋 操作指南:")
-        print("  ↑↓ ←→ : 调整年月")
-        print("  V      : 切换视图模式")
-        print("  空格键 : 返回今天")
-        print("  Q      : 退出程序")
-        print("-" * 50)
+        return ("\n" + "-" * 50 + "\n"
+                "📋 操作指南:\n"
+                "  ↑↓ ←→ : 调整年月\n"
+                "  V      : 切换视图模式\n"
+                "  空格键 : 返回今天\n"
+                "  Q      : 退出程序\n"
+                + "-" * 50 + "\n")
 
     def setup_keyboard(self):
         """初始化键盘控制器"""
@@ -249,6 +306,8 @@ class CalendarApp:
             print("🛑 无法启动键盘控制，程序退出。")
             return
 
+        if self.prefetcher:
+            self.prefetcher.start()
         self.display_current_view()
         print("\n🎮 键盘监听已启动...")
         print("💡 使用方向键导航，按 Q 退出")
@@ -273,6 +332,11 @@ class CalendarApp:
         """释放资源"""
         if self.keyboard_controller:
             self.keyboard_controller.stop()
+        if self.prefetcher:
+            self.prefetcher.stop()
+            stats = self.prefetcher.stats()
+            print(f"\n⚡ 视图缓存: 命中 {stats['hits']} 次，未命中 {stats['misses']} 次，"
+                  f"后台预取 {stats['prefetched']} 个（命中率 {stats['hit_rate']:.0%}）")
         print("\n🎯 程序已安全退出")
 
 
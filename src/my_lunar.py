@@ -3,6 +3,22 @@
 🧑‍💻 开发者: 许梓轩
 
 """
+import os
+from array import array
+from bisect import bisect_right
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+from solar import SolarCalendar
+from calendar_table import CalendarTable
+
+try:
+    import numpy as np
+except ImportError:  # 批量接口依赖 numpy，单日期接口不受影响
+    np = None
+
+# 设置该环境变量后，导入时自动映射预生成的表文件（见 calendar_table.py）
+TABLE_FILE_ENV = "PYCALENDAR_TABLE"
 
 
 _LUNAR_MONTH_NAMES = [
@@ -16,35 +32,572 @@ _LUNAR_DAY_PREFIX = [
     "廿一", "廿二", "廿三", "廿四", "廿五", "廿六", "廿七", "廿八", "廿九", "三十"
 ]
 
-# 特殊日期对照表（公历 → 农历），只写几个关键点
-_SPECIAL_DATES = {
-    # (year, month, day): "农历描述"
-    (2025, 1, 29): "正月初一 春节",
-    (2025, 4, 5): "三月初八",
-    (2024, 10, 1): "八月十九",
-    (2023, 1, 22): "正月初一 春节",
+# 农历节日（农历月, 日）→ 名称；闰月不过节，除夕单独判断
+# festivals 模块直接使用这张表，农历标注和节日查询共用同一份数据
+LUNAR_FESTIVALS = {
+    (1, 1): "春节",
+    (1, 15): "元宵节",
+    (5, 5): "端午节",
+    (7, 7): "七夕",
+    (8, 15): "中秋节",
+    (9, 9): "重阳节",
+    (12, 8): "腊八节",
 }
 
+# 农历数据表：农历1900-2100年，每年压缩为一个整数
+#   bit 0-12 : 按顺序（含闰月）各月大小，1为大月30天，0为小月29天
+#   bit 13-16: 闰月月份，0表示无闰月
+#   bit 17-22: 正月初一距离公历1月1日的天数
+_LUNAR_YEAR_INFO = (
+    0x3d16d2, 0x620752, 0x4c0ea5, 0x38b64a, 0x5c064b, 0x440a9b,  # 1900-1905
+    0x309556, 0x56056a, 0x400b59, 0x2a5752, 0x500752, 0x3adb25,  # 1906-1911
+    0x600b25, 0x480a4b, 0x32b4ab, 0x5802ad, 0x42056b, 0x2c4b69,  # 1912-1917
+    0x520da9, 0x3efd92, 0x640e92, 0x4c0d25, 0x36ba4d, 0x5c0a56,  # 1918-1923
+    0x4602b6, 0x2e95b5, 0x5606d4, 0x400ea9, 0x2c5e92, 0x500e92,  # 1924-1929
+    0x3acd26, 0x5e052b, 0x480a57, 0x32b2b6, 0x580b5a, 0x4406d4,  # 1930-1935
+    0x2e6ec9, 0x520749, 0x3cf693, 0x620a93, 0x4c052b, 0x34ca5b,  # 1936-1941
+    0x5a0aad, 0x46056a, 0x309b55, 0x560ba4, 0x400b49, 0x2a5a93,  # 1942-1947
+    0x500a95, 0x38f52d, 0x5e0536, 0x480aad, 0x34b5aa, 0x5805b2,  # 1948-1953
+    0x420da5, 0x2e7d4a, 0x540d4a, 0x3d0a95, 0x600a97, 0x4c0556,  # 1954-1959
+    0x36cab5, 0x5a0ad5, 0x4606d2, 0x308ea5, 0x560ea5, 0x40064a,  # 1960-1965
+    0x286c97, 0x4e0a9b, 0x3af55a, 0x5e056a, 0x480b69, 0x34b752,  # 1966-1971
+    0x5a0b52, 0x420b25, 0x2c964b, 0x520a4b, 0x3d14ab, 0x6002ad,  # 1972-1977
+    0x4a056d, 0x36cb69, 0x5c0da9, 0x460d92, 0x309d25, 0x560d25,  # 1978-1983
+    0x415a4d, 0x640a56, 0x4e02b6, 0x38c5b5, 0x5e06d5, 0x480ea9,  # 1984-1989
+    0x34be92, 0x5a0e92, 0x440d26, 0x2c6a56, 0x500a57, 0x3d14d6,  # 1990-1995
+    0x62035a, 0x4a06d5, 0x36b6c9, 0x5c0749, 0x460693, 0x2e952b,  # 1996-2001
+    0x54052b, 0x3e0a5b, 0x2a555a, 0x4e056a, 0x38fb55, 0x600ba4,  # 2002-2007
+    0x4a0b49, 0x32ba93, 0x580a95, 0x42052d, 0x2c8aad, 0x500ab5,  # 2008-2013
+    0x3d35aa, 0x6205d2, 0x4c0da5, 0x36dd4a, 0x5c0d4a, 0x460c95,  # 2014-2019
+    0x30952e, 0x540556, 0x3e0ab5, 0x2a55b2, 0x5006d2, 0x38cea5,  # 2020-2025
+    0x5e0725, 0x48064b, 0x32ac97, 0x560cab, 0x42055a, 0x2c6ad6,  # 2026-2031
+    0x520b69, 0x3d7752, 0x620b52, 0x4c0b25, 0x36da4b, 0x5a0a4b,  # 2032-2037
+    0x4404ab, 0x2ea55b, 0x5405ad, 0x3e0b6a, 0x2a5b52, 0x500d92,  # 2038-2043
+    0x3afd25, 0x5e0d25, 0x480a55, 0x32b4ad, 0x5804b6, 0x4005b5,  # 2044-2049
+    0x2c6daa, 0x520ec9, 0x3f1e92, 0x620e92, 0x4c0d26, 0x36ca56,  # 2050-2055
+    0x5a0a57, 0x440556, 0x2e86d5, 0x540755, 0x400749, 0x286e93,  # 2056-2061
+    0x4e0693, 0x38f52b, 0x5e052b, 0x460a5b, 0x32b55a, 0x58056a,  # 2062-2067
+    0x420b65, 0x2c974a, 0x520b4a, 0x3d1a95, 0x620a95, 0x4a052d,  # 2068-2073
+    0x34caad, 0x5a0ab5, 0x4605aa, 0x2e8ba5, 0x540da5, 0x400d4a,  # 2074-2079
+    0x2a7c95, 0x4e0c96, 0x38f94e, 0x5e0556, 0x480ab5, 0x32b5b2,  # 2080-2085
+    0x5806d2, 0x420ea5, 0x2e8e4a, 0x50068b, 0x3b0c97, 0x6004ab,  # 2086-2091
+    0x4a055b, 0x34cad6, 0x5a0b6a, 0x460752, 0x309725, 0x540b45,  # 2092-2097
+    0x3e0a8b, 0x28549b, 0x4e04ab,  # 2098-2100
+)
+
+LUNAR_MIN_YEAR = 1900
+LUNAR_MAX_YEAR = LUNAR_MIN_YEAR + len(_LUNAR_YEAR_INFO) - 1
+
+
+def _decode_year_info(info: int) -> tuple:
+    """
+    解码一年的农历数据
+
+    返回:
+        tuple: (新年偏移天数, 闰月月份, 各月天数元组)
+    """
+    leap_month = (info >> 13) & 0xF
+    month_count = 13 if leap_month else 12
+    lengths = tuple(30 if info >> i & 1 else 29 for i in range(month_count))
+    return info >> 17, leap_month, lengths
+
+
+def _build_lunar_index():
+    """
+    生成按序数查找的索引
+
+    返回:
+        tuple: (new_year_ordinals, month_starts, leap_months)
+            new_year_ordinals: 每个农历年正月初一的序数，最后多一项为下一年的正月初一
+            month_starts: 每年各月初一相对正月初一的天数（前缀和，末项为全年天数）
+            leap_months: 每年的闰月月份
+    """
+    new_year_ordinals = []
+    month_starts = []
+    leap_months = []
+    for index, info in enumerate(_LUNAR_YEAR_INFO):
+        offset, leap_month, lengths = _decode_year_info(info)
+        new_year_ordinals.append(SolarCalendar.to_ordinal(LUNAR_MIN_YEAR + index, 1, 1) + offset)
+        starts = [0]
+        for length in lengths:
+            starts.append(starts[-1] + length)
+        month_starts.append(tuple(starts))
+        leap_months.append(leap_month)
+    new_year_ordinals.append(new_year_ordinals[-1] + month_starts[-1][-1])
+    return tuple(new_year_ordinals), tuple(month_starts), tuple(leap_months)
+
+
+_NEW_YEAR_ORDINALS, _MONTH_STARTS, _LEAP_MONTHS = _build_lunar_index()
+
+# 支持的公历日期范围（序数，左闭右开）
+_MIN_ORDINAL = _NEW_YEAR_ORDINALS[0]
+_MAX_ORDINAL = _NEW_YEAR_ORDINALS[-1]
+
+
+def _check_ordinal_range(ordinal: int):
+    """超出农历数据范围时抛出 ValueError"""
+    if not _MIN_ORDINAL <= ordinal < _MAX_ORDINAL:
+        first = SolarCalendar.from_ordinal(_MIN_ORDINAL)
+        last = SolarCalendar.from_ordinal(_MAX_ORDINAL - 1)
+        raise ValueError(f"农历数据仅支持公历{first[0]}年{first[1]}月{first[2]}日"
+                         f"至{last[0]}年{last[1]}月{last[2]}日")
+
+
+def _locate(ordinal: int) -> tuple:
+    """
+    定位序数在农历表中的位置
+
+    返回:
+        tuple: (年下标, 含闰月的第几个月（0开始）, 农历日)
+    """
+    _check_ordinal_range(ordinal)
+
+    # 农历年要么是公历年，要么是前一年，比较一次正月初一即可
+    year = SolarCalendar.from_ordinal(ordinal)[0]
+    index = year - LUNAR_MIN_YEAR
+    if index >= len(_LUNAR_YEAR_INFO) or ordinal < _NEW_YEAR_ORDINALS[index]:
+        index -= 1
+
+    days = ordinal - _NEW_YEAR_ORDINALS[index]
+    starts = _MONTH_STARTS[index]
+    position = bisect_right(starts, days) - 1
+    return index, position, days - starts[position] + 1
+
+
+def _month_of_position(index: int, position: int) -> tuple:
+    """含闰月的月份位置 → (农历月, 是否闰月)"""
+    leap_month = _LEAP_MONTHS[index]
+    if leap_month and position >= leap_month:
+        return position, position == leap_month
+    return position + 1, False
+
+
+def _lunar_from_ordinal(ordinal: int) -> tuple:
+    """
+    序数 → 农历
+
+    返回:
+        tuple: (农历年, 农历月, 农历日, 是否闰月)
+    """
+    index, position, lunar_day = _locate(ordinal)
+    lunar_month, is_leap = _month_of_position(index, position)
+    return LUNAR_MIN_YEAR + index, lunar_month, lunar_day, is_leap
+
+
+# LunarDays 中每天的压缩编码（16位）
+_CODE_DAY_MASK = 0x1F       # bit 0-4 : 农历日
+_CODE_LEAP = 1 << 5         # bit 5   : 闰月
+_CODE_MONTH_SHIFT = 6       # bit 6-9 : 农历月
+_CODE_YEAR_FLAG = 1 << 10   # bit 10  : 农历年 = 基准年 + 1
+_CODE_EVE = 1 << 11         # bit 11  : 除夕（农历年最后一天）
+
+
+class LunarDate(NamedTuple):
+    """
+    结构化的农历日期
+
+    只保存数字和标志位，需要文字时才通过 str() 或 text 格式化
+    """
+    year: int
+    month: int
+    day: int
+    is_leap_month: bool
+    is_first_day: bool
+    festival: Optional[str]
+
+    @property
+    def month_name(self) -> str:
+        """农历月名，如“正月”“闰六月”"""
+        return ("闰" if self.is_leap_month else "") + _LUNAR_MONTH_NAMES[self.month - 1]
+
+    @property
+    def day_name(self) -> str:
+        """农历日名，如“初一”"""
+        return _LUNAR_DAY_PREFIX[self.day - 1]
+
+    @property
+    def text(self) -> str:
+        """与 get_lunar_date 相同格式的描述文字"""
+        text = f"农历{self.year}年{self.month_name}{self.day_name}"
+        if self.festival:
+            text += " " + self.festival
+        return text
+
+    def __str__(self):
+        return self.text
+
+
+def _lunar_date_from_ordinal(ordinal: int) -> LunarDate:
+    """序数 → LunarDate（附带节日）"""
+    index, position, lunar_day = _locate(ordinal)
+    lunar_month, is_leap = _month_of_position(index, position)
+
+    festival = None
+    if not is_leap:
+        festival = LUNAR_FESTIVALS.get((lunar_month, lunar_day))
+    if festival is None and ordinal + 1 == _NEW_YEAR_ORDINALS[index + 1]:
+        festival = "除夕"
+
+    return LunarDate(LUNAR_MIN_YEAR + index, lunar_month, lunar_day, is_leap, lunar_day == 1, festival)
+
+
+def solar_to_lunar(year: int, month: int, day: int) -> tuple:
+    """
+    公历转农历（查表，O(1)）
+
+    参数:
+        year: 公历年
+        month: 公历月
+        day: 公历日
+
+    返回:
+        tuple: (农历年, 农历月, 农历日, 是否闰月)
+
+    异常:
+        ValueError: 日期无效或超出农历数据范围
+    """
+    return _lunar_from_ordinal(SolarCalendar.to_ordinal(year, month, day))
+
+
+def _lunar_position(index: int, lunar_month: int, lunar_day: int, is_leap: bool) -> int:
+    """
+    校验农历日期并返回含闰月的月份位置（0开始）
+
+    异常:
+        ValueError: 月份/日期无效、该年没有这个闰月或该月没有这一天
+    """
+    if not 1 <= lunar_month <= 12:
+        raise ValueError("农历月份必须在1-12之间")
+
+    leap_month = _LEAP_MONTHS[index]
+    if is_leap:
+        if leap_month != lunar_month:
+            raise ValueError(f"农历{LUNAR_MIN_YEAR + index}年没有闰{_LUNAR_MONTH_NAMES[lunar_month - 1]}")
+        position = lunar_month
+    else:
+        position = lunar_month if leap_month and lunar_month > leap_month else lunar_month - 1
+
+    starts = _MONTH_STARTS[index]
+    month_length = starts[position + 1] - starts[position]
+    if not 1 <= lunar_day <= month_length:
+        raise ValueError(f"农历日期必须在1-{month_length}之间")
+    return position
+
+
+def lunar_to_solar(lunar_year: int, lunar_month: int, lunar_day: int, is_leap: bool = False) -> tuple:
+    """
+    农历转公历（查正月初一序数索引，O(1)）
+
+    参数:
+        lunar_year: 农历年
+        lunar_month: 农历月（1-12）
+        lunar_day: 农历日（1-30）
+        is_leap: 是否为闰月
+
+    返回:
+        tuple: (year, month, day)
+
+    异常:
+        ValueError: 农历日期不存在或超出数据范围
+    """
+    index = lunar_year - LUNAR_MIN_YEAR
+    if not 0 <= index < len(_LUNAR_YEAR_INFO):
+        raise ValueError(f"农历年份必须在{LUNAR_MIN_YEAR}-{LUNAR_MAX_YEAR}之间")
+
+    position = _lunar_position(index, lunar_month, lunar_day, is_leap)
+    ordinal = _NEW_YEAR_ORDINALS[index] + _MONTH_STARTS[index][position] + lunar_day - 1
+    return SolarCalendar.from_ordinal(ordinal)
+
+
+def lunar_month_starts(lunar_year: int) -> tuple:
+    """
+    某个农历年各月（含闰月，按顺序）初一的公历序数
+
+    参数:
+        lunar_year: 农历年
+
+    返回:
+        tuple: 长度为该年月数+1，末项为下一年正月初一（数据最后一年也有），
+               相邻两项之差即月长；序数见 SolarCalendar.to_ordinal
+
+    异常:
+        ValueError: 超出农历数据范围
+    """
+    index = lunar_year - LUNAR_MIN_YEAR
+    if not 0 <= index < len(_LUNAR_YEAR_INFO):
+        raise ValueError(f"农历年份必须在{LUNAR_MIN_YEAR}-{LUNAR_MAX_YEAR}之间")
+    new_year = _NEW_YEAR_ORDINALS[index]
+    return tuple(new_year + start for start in _MONTH_STARTS[index])
+
+
+def lunar_ordinal_range() -> tuple:
+    """
+    农历数据覆盖的公历日期范围
+
+    返回:
+        tuple: (第一天的序数, 最后一天的序数+1)，左闭右开
+    """
+    return _MIN_ORDINAL, _MAX_ORDINAL
+
+
+@lru_cache(maxsize=1)
+def _index_arrays() -> tuple:
+    """把正月初一序数、各月起始偏移和闰月整理成 numpy 数组（各月起始补齐到14列）"""
+    new_years = np.asarray(_NEW_YEAR_ORDINALS[:-1], dtype=np.int64)
+    starts = np.array([starts + (starts[-1],) * (14 - len(starts)) for starts in _MONTH_STARTS],
+                      dtype=np.int64)
+    leap_months = np.asarray(_LEAP_MONTHS, dtype=np.int64)
+    return new_years, starts, leap_months
+
+
+def lunar_to_solar_batch(lunar_months, lunar_days, start_year: int, end_year: int,
+                         is_leap=False, clamp: bool = False) -> tuple:
+    """
+    批量农历转公历：一次解析多个（农历月, 农历日）在一段农历年范围内的公历日期，
+    例如未来50年的八月十五
+
+    参数:
+        lunar_months: 农历月序列
+        lunar_days: 农历日序列（与 lunar_months 等长或为标量）
+        start_year: 起始农历年
+        end_year: 结束农历年（包含）
+        is_leap: 是否闰月，可以是标量或与日期等长的序列
+        clamp: 该月没有这一天（如小月三十）时是否改用月末；否则标记为无效
+
+    返回:
+        tuple: (years, months, days, valid)，均为形状 (年数, 日期数) 的数组，
+               valid 为 False 的位置（闰月不存在或日期不存在）年月日均为0
+    """
+    if np is None:
+        raise ImportError("批量接口需要 numpy，请先执行: pip install numpy")
+    if not LUNAR_MIN_YEAR <= start_year <= end_year <= LUNAR_MAX_YEAR:
+        raise ValueError(f"农历年份必须在{LUNAR_MIN_YEAR}-{LUNAR_MAX_YEAR}之间")
+
+    months, days, leap = np.broadcast_arrays(np.asarray(lunar_months, dtype=np.int64),
+                                             np.asarray(lunar_days, dtype=np.int64),
+                                             np.asarray(is_leap, dtype=bool))
+    months, days, leap = np.atleast_1d(months, days, leap)
+    new_years, starts, leap_months = _index_arrays()
+
+    index = np.arange(start_year - LUNAR_MIN_YEAR, end_year - LUNAR_MIN_YEAR + 1)[:, None]
+    year_leap = leap_months[index]
+    valid = (months >= 1) & (months <= 12) & (days >= 1) & (~leap | (year_leap == months))
+
+    safe_months = np.clip(months, 1, 12)
+    position = np.where(leap | ((year_leap > 0) & (safe_months > year_leap)), safe_months, safe_months - 1)
+    month_start = np.take_along_axis(starts[index[:, 0]], position, axis=1)
+    month_length = np.take_along_axis(starts[index[:, 0]], position + 1, axis=1) - month_start
+
+    if clamp:
+        days = np.minimum(days, month_length)
+    else:
+        valid = valid & (days <= month_length)
+
+    ordinals = np.where(valid, new_years[index] + month_start + days - 1, 1)
+    years, months, days = SolarCalendar.from_ordinal_batch(ordinals)
+    return (np.where(valid, years, 0), np.where(valid, months, 0),
+            np.where(valid, days, 0), valid)
+
+
+# 当前映射的表文件，None 表示直接查 _LUNAR_YEAR_INFO
+_table_file = None
+
+
+def use_table_file(path) -> Optional[CalendarTable]:
+    """
+    映射预生成的表文件，之后 get_lunar_info 在表的范围内直接按偏移读取
+
+    参数:
+        path: 表文件路径（由 python src/calendar_table.py 生成），None 表示停用
+
+    返回:
+        CalendarTable: 映射的表文件，停用时返回 None
+
+    异常:
+        OSError: 文件无法打开
+        ValueError: 文件格式或版本不符
+    """
+    global _table_file
+    if _table_file is not None:
+        _table_file.close()
+        _table_file = None
+    if path is not None:
+        _table_file = CalendarTable(path)
+    return _table_file
+
+
+def get_lunar_info(year: int, month: int, day: int) -> LunarDate:
+    """
+    获取公历日期对应的结构化农历信息
+
+    参数:
+        year: 公历年
+        month: 公历月
+        day: 公历日
+
+    返回:
+        LunarDate: 不做任何字符串格式化，判断初一等只需读取字段
+
+    异常:
+        ValueError: 日期无效或超出农历数据范围
+    """
+    ordinal = SolarCalendar.to_ordinal(year, month, day)
+    if _table_file is not None and ordinal in _table_file:
+        code, festival_id = _table_file.record(ordinal)
+        return _decode_lunar_code(year - 1, code, _table_file.festival_name(festival_id))
+    return _lunar_date_from_ordinal(ordinal)
+
 
 def get_lunar_date(year, month, day):
     """
-    极简版农历返回函数
+    获取公历日期对应的农历描述
+
+    参数:
+        year: 公历年
+        month: 公历月
+        day: 公历日
+
+    返回:
+        str: 例如 "农历2025年正月初一 春节"、"农历2025年闰六月初一"
     """
-    try:
-        # 先查特殊日期表
-        key = (year, month, day)
-        if key in _SPECIAL_DATES:
-            return f"农历{year}年{_SPECIAL_DATES[key]}"
+    return get_lunar_info(year, month, day).text
 
-        # 否则简单估算：假设农历年份不变，月份对应，日期取模
-        lunar_month = ((month - 3) % 12) + 1
-        lunar_day = (day + 7) % 30 + 1
-        month_str = _LUNAR_MONTH_NAMES[lunar_month - 1]
-        day_str = _LUNAR_DAY_PREFIX[lunar_day - 1]
 
-        return f"农历{year}年{month_str}{day_str}"
+def _decode_lunar_code(base_year: int, code: int, festival: Optional[str] = None) -> LunarDate:
+    """
+    16位编码 → LunarDate
 
-    except Exception:
-        # ⚠️ 任何错误都兜底
-        return f"农历{year}年三月初八"  # 固定返回一个安全值
+    参数:
+        base_year: 年份标志为0时对应的农历年（即该日公历年-1）
+        code: 编码
+        festival: 已知的节日名（来自表文件），None 时由农历月日推出
+    """
+    lunar_day = code & _CODE_DAY_MASK
+    lunar_month = code >> _CODE_MONTH_SHIFT & 0xF
+    is_leap = bool(code & _CODE_LEAP)
+
+    if festival is None:
+        if not is_leap:
+            festival = LUNAR_FESTIVALS.get((lunar_month, lunar_day))
+        if festival is None and code & _CODE_EVE:
+            festival = "除夕"
+
+    year = base_year + (1 if code & _CODE_YEAR_FLAG else 0)
+    return LunarDate(year, lunar_month, lunar_day, is_leap, lunar_day == 1, festival)
+
+
+class LunarDays:
+    """
+    连续若干公历日的农历数据（每天一个16位编码）
+
+    由 get_lunar_month / get_lunar_year 生成；按下标取值时才解码为 LunarDate
+    """
+
+    __slots__ = ("start_ordinal", "base_year", "codes")
+
+    def __init__(self, start_ordinal: int, base_year: int, codes):
+        """
+        参数:
+            start_ordinal: 第一天的序数
+            base_year: 编码中年份标志为0时对应的农历年
+            codes: array('H') 编码数组
+        """
+        self.start_ordinal = start_ordinal
+        self.base_year = base_year
+        self.codes = memoryview(codes).toreadonly()
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getitem__(self, index: int) -> LunarDate:
+        """第 index 天（0开始）的 LunarDate"""
+        return _decode_lunar_code(self.base_year, self.codes[index])
+
+    def __iter__(self):
+        for index in range(len(self.codes)):
+            yield self[index]
+
+    def first_day_offsets(self) -> list:
+        """农历初一所在的下标（0开始），不解码、不格式化"""
+        return [index for index, code in enumerate(self.codes) if code & _CODE_DAY_MASK == 1]
+
+
+def _lunar_days(start_ordinal: int, count: int) -> LunarDays:
+    """
+    只定位第一天，之后逐日递推农历日/月/年，生成 LunarDays
+    """
+    _check_ordinal_range(start_ordinal + count - 1)
+    index, position, lunar_day = _locate(start_ordinal)
+    base_year = SolarCalendar.from_ordinal(start_ordinal)[0] - 1
+
+    starts = _MONTH_STARTS[index]
+    month_length = starts[position + 1] - starts[position]
+    lunar_month, is_leap = _month_of_position(index, position)
+    head = (lunar_month << _CODE_MONTH_SHIFT) | (_CODE_LEAP if is_leap else 0)
+    if LUNAR_MIN_YEAR + index > base_year:
+        head |= _CODE_YEAR_FLAG
 
+    codes = array("H")
+    for _ in range(count):
+        is_eve = lunar_day == month_length and position == len(starts) - 2
+        codes.append(head | lunar_day | (_CODE_EVE if is_eve else 0))
+
+        lunar_day += 1
+        if lunar_day > month_length:
+            lunar_day = 1
+            position += 1
+            if position == len(starts) - 1:
+                index, position = index + 1, 0
+                if index < len(_MONTH_STARTS):
+                    starts = _MONTH_STARTS[index]
+            if index < len(_MONTH_STARTS):
+                month_length = starts[position + 1] - starts[position]
+                lunar_month, is_leap = _month_of_position(index, position)
+                head = (lunar_month << _CODE_MONTH_SHIFT) | (_CODE_LEAP if is_leap else 0)
+                if LUNAR_MIN_YEAR + index > base_year:
+                    head |= _CODE_YEAR_FLAG
+
+    return LunarDays(start_ordinal, base_year, codes)
+
+
+@lru_cache(maxsize=256)
+def get_lunar_month(year: int, month: int) -> LunarDays:
+    """
+    一次性获取整个公历月的农历数据
+
+    参数:
+        year: 公历年
+        month: 公历月
+
+    返回:
+        LunarDays: 下标 day-1 对应该月第 day 天；结果只读并被缓存，可放心共享
+
+    异常:
+        ValueError: 超出农历数据范围
+    """
+    return _lunar_days(SolarCalendar.to_ordinal(year, month, 1),
+                       SolarCalendar.get_month_days(year, month))
+
+
+def get_lunar_year(year: int) -> LunarDays:
+    """
+    一次性获取整个公历年的农历数据
+
+    参数:
+        year: 公历年
+
+    返回:
+        LunarDays: 下标为 年内第几天-1（见 SolarCalendar.get_day_of_year）
+
+    异常:
+        ValueError: 超出农历数据范围
+    """
+    return _lunar_days(SolarCalendar.to_ordinal(year, 1, 1),
+                       SolarCalendar.get_cumulative_days(year)[12])
+
+
+if os.environ.get(TABLE_FILE_ENV):
+    try:
+        use_table_file(os.environ[TABLE_FILE_ENV])
+    except (OSError, ValueError) as e:
+        print(f"⚠️  农历表文件加载失败，改用内置数据: {e}")
@@ -0,0 +1,119 @@
+# 预取模块：键盘导航时在后台线程预先渲染相邻的月/年视图
+"""
+当前视图显示后，把用户下一步最可能按到的视图放进后台队列：
+- 月视图：前后一个月（←→）、前后一年的同月（↑↓）、同年的年视图（V）
+- 年视图：前后一年（↑↓）、当前月的月视图（V）
+
+后台线程通过 RenderCache.warm 把它们预先渲染进 render 模块的渲染缓存，
+下一次按键 render() 直接命中；预取器自己不保存任何帧，缓存键（含农历函数和今天）、
+LRU 淘汰和命中统计都只有 RenderCache 一份
+"""
+import threading
+from collections import deque
+
+from render import get_cache
+
+
+def neighbour_keys(view: str, year: int, month: int) -> list:
+    """
+    当前视图的相邻视图（按优先级排列）
+
+    参数:
+        view: 'month' 或 'year'
+        year: 年份
+        month: 月份
+
+    返回:
+        list: [(view, year, month), ...]，年视图的 month 为 None
+    """
+    previous_month = (year - 1, 12) if month == 1 else (year, month - 1)
+    next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+    if view == "month":
+        keys = [("month", *next_month), ("month", *previous_month),
+                ("month", year + 1, month), ("month", year - 1, month),
+                ("year", year, None)]
+    else:
+        keys = [("year", year + 1, None), ("year", year - 1, None), ("month", year, month)]
+    return [key for key in keys if key[1] >= 1]
+
+
+class Prefetcher:
+    """
+    后台预取器
+
+    schedule() 把相邻视图交给后台线程，后台线程调用 cache.warm() 预先渲染；
+    前台照常调用 render()，命中与否由 RenderCache 统计
+    """
+
+    def __init__(self, cache=None):
+        """
+        参数:
+            cache: 要预热的 render.RenderCache，None 表示 render() 使用的默认缓存
+        """
+        self.cache = cache or get_cache()
+        self.prefetched = 0
+
+        self._pending = deque()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._running = False
+
+    # --- 前台接口 ---
+    def schedule(self, view: str, year: int, month: int = None):
+        """
+        用户停在某个视图上时调用：丢弃旧的待办，改为预取它的相邻视图
+        """
+        with self._condition:
+            self._pending.clear()
+            self._pending.extend(neighbour_keys(view, year, month))
+            self._condition.notify()
+
+    def stats(self) -> dict:
+        """
+        命中统计
+
+        返回:
+            dict: 渲染缓存的 hits / misses / hit_rate / cached，加上后台预取的帧数 prefetched
+        """
+        stats = self.cache.stats()
+        with self._condition:
+            stats["prefetched"] = self.prefetched
+        return stats
+
+    # --- 后台线程 ---
+    def start(self):
+        """启动后台线程（守护线程，重复调用无副作用）"""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._run, name="calendar-prefetch", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0):
+        """停止后台线程"""
+        with self._condition:
+            self._running = False
+            self._pending.clear()
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._running and not self._pending:
+                    self._condition.wait()
+                if not self._running:
+                    return
+                key = self._pending.popleft()
+
+            try:
+                rendered = self.cache.warm(*key)
+            except Exception:
+                continue  # 预取失败不影响前台，真正显示时会再渲染一次并报告错误
+            if rendered:
+                with self._condition:
+                    self.prefetched += 1
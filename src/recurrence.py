@@ -0,0 +1,223 @@
+# 重复规则模块：按规则惰性展开重复事件（如“每隔一周的周二”“每个农历初一”）
+import heapq
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from solar import SolarCalendar
+from my_lunar import LUNAR_MAX_YEAR, lunar_month_starts, lunar_ordinal_range, solar_to_lunar
+
+# WeeklyRule 未指定 anchor 时的对齐基准：固定为公元1年1月1日，
+# 同一条“每隔 n 周”的规则无论从哪个窗口开始展开，命中的周都相同
+WEEKLY_EPOCH = (1, 1, 1)
+
+
+def _month_range(start: tuple, end: Optional[tuple]):
+    """依次产生 start 所在月到 end 所在月的 (year, month)，end 为 None 时无限产生"""
+    year, month = start[0], start[1]
+    while end is None or (year, month) <= (end[0], end[1]):
+        yield year, month
+        month += 1
+        if month > 12:
+            year, month = year + 1, 1
+
+
+class RecurrenceRule(ABC):
+    """
+    重复规则基类
+
+    子类实现 _candidates(start, end)：按时间顺序直接跳到可能的日期，
+    基类负责把结果裁剪到 [start, end) 窗口内
+    """
+
+    def iter_dates(self, start: tuple, end: Optional[tuple] = None):
+        """
+        惰性展开规则
+
+        参数:
+            start: 窗口起点 (year, month, day)，包含
+            end: 窗口终点 (year, month, day)，不包含；None 表示不设上限
+
+        返回:
+            generator: 依次产生 (year, month, day)
+        """
+        start, end = tuple(start), (tuple(end) if end is not None else None)
+        for date in self._candidates(start, end):
+            if date < start:
+                continue
+            if end is not None and date >= end:
+                return
+            yield date
+
+    def in_month(self, year: int, month: int) -> list:
+        """
+        只展开某个月内的日期（供月视图使用）
+
+        返回:
+            list: 该月内命中的 (year, month, day) 列表
+        """
+        next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+        return list(self.iter_dates((year, month, 1), (next_year, next_month, 1)))
+
+    @abstractmethod
+    def _candidates(self, start: tuple, end: Optional[tuple]):
+        """按时间顺序产生候选日期 (year, month, day)，可以从 start 之前开始，也可以无限产生"""
+
+
+class WeeklyRule(RecurrenceRule):
+    """每隔 interval 周的星期 weekday，例如每隔一周的周二"""
+
+    def __init__(self, weekday: int, interval: int = 1, anchor: Optional[tuple] = None):
+        """
+        参数:
+            weekday: 星期几（0=周日，...，6=周六）
+            interval: 间隔周数（1=每周，2=每隔一周）
+            anchor: 对齐基准日期，从该日期起的第一个 weekday 为第一次出现；
+                    默认为 WEEKLY_EPOCH，展开结果与查询窗口无关
+        """
+        if not 0 <= weekday <= 6:
+            raise ValueError("星期必须在0-6之间")
+        if interval < 1:
+            raise ValueError("间隔必须为正整数")
+        self.weekday = weekday
+        self.interval = interval
+        self.anchor = anchor
+
+    def _candidates(self, start, end):
+        anchor = self.anchor or WEEKLY_EPOCH
+        # 基准日期所在周命中的那天
+        anchor_ordinal = SolarCalendar.to_ordinal(*anchor)
+        anchor_ordinal += (self.weekday - SolarCalendar.get_weekday(*anchor)) % 7
+
+        # 直接跳到窗口起点之后的第一次出现
+        step = 7 * self.interval
+        ordinal = anchor_ordinal
+        start_ordinal = SolarCalendar.to_ordinal(*start)
+        if ordinal < start_ordinal:
+            ordinal += -(-(start_ordinal - ordinal) // step) * step
+
+        while True:
+            yield SolarCalendar.from_ordinal(ordinal)
+            ordinal += step
+
+
+class MonthlyDayRule(RecurrenceRule):
+    """每月的第 day 天，例如每月15号"""
+
+    def __init__(self, day: int, clamp: bool = False):
+        """
+        参数:
+            day: 日期（1-31）
+            clamp: 该月没有这一天时是否改用月末（否则跳过该月）
+        """
+        if not 1 <= day <= 31:
+            raise ValueError("日期必须在1-31之间")
+        self.day = day
+        self.clamp = clamp
+
+    def _candidates(self, start, end):
+        for year, month in _month_range(start, end):
+            month_days = SolarCalendar.get_month_days(year, month)
+            if self.day <= month_days:
+                yield year, month, self.day
+            elif self.clamp:
+                yield year, month, month_days
+
+
+class MonthlyWeekdayRule(RecurrenceRule):
+    """每月第 n 个星期几，例如每月第二个周二、每月最后一个周五（n=-1）"""
+
+    def __init__(self, weekday: int, nth: int):
+        """
+        参数:
+            weekday: 星期几（0=周日，...，6=周六）
+            nth: 第几个（1-5），负数表示倒数第几个
+        """
+        if not 0 <= weekday <= 6:
+            raise ValueError("星期必须在0-6之间")
+        if nth == 0 or not -5 <= nth <= 5:
+            raise ValueError("nth 必须在1-5或-5到-1之间")
+        self.weekday = weekday
+        self.nth = nth
+
+    def _candidates(self, start, end):
+        for year, month in _month_range(start, end):
+            month_days = SolarCalendar.get_month_days(year, month)
+            if self.nth > 0:
+                first_weekday = SolarCalendar.get_weekday(year, month, 1)
+                day = 1 + (self.weekday - first_weekday) % 7 + 7 * (self.nth - 1)
+            else:
+                last_weekday = SolarCalendar.get_weekday(year, month, month_days)
+                day = month_days - (last_weekday - self.weekday) % 7 + 7 * (self.nth + 1)
+            if 1 <= day <= month_days:
+                yield year, month, day
+
+
+class LastWeekdayOfMonthRule(RecurrenceRule):
+    """每月最后一个工作日（默认周一到周五，可传入 WorkdayCalendar 以考虑节假日）"""
+
+    def __init__(self, workday_calendar=None):
+        """
+        参数:
+            workday_calendar: 可选的 workday.WorkdayCalendar
+        """
+        self.workday_calendar = workday_calendar
+
+    def _is_workday(self, year, month, day):
+        if self.workday_calendar is not None:
+            return self.workday_calendar.is_workday(year, month, day)
+        return SolarCalendar.get_weekday(year, month, day) not in (0, 6)
+
+    def _candidates(self, start, end):
+        for year, month in _month_range(start, end):
+            day = SolarCalendar.get_month_days(year, month)
+            while day >= 1 and not self._is_workday(year, month, day):
+                day -= 1
+            if day >= 1:
+                yield year, month, day
+
+
+class LunarMonthlyRule(RecurrenceRule):
+    """每个农历月的第 lunar_day 天，例如每个农历初一、十五"""
+
+    def __init__(self, lunar_day: int = 1):
+        """
+        参数:
+            lunar_day: 农历日（1-30）；没有这一天的小月（如二十九天的月份没有三十）跳过
+        """
+        if not 1 <= lunar_day <= 30:
+            raise ValueError("农历日必须在1-30之间")
+        self.lunar_day = lunar_day
+
+    def _candidates(self, start, end):
+        # 按 my_lunar 的各月初一序数逐月跳转：初一加上 lunar_day-1 就是命中日期，
+        # 月长不够的月份直接跳过，不需要逐日查询农历；超出农历数据范围后结束
+        first, last = lunar_ordinal_range()
+        ordinal = max(SolarCalendar.to_ordinal(*start), first)
+        if ordinal >= last:
+            return
+        for lunar_year in range(solar_to_lunar(*SolarCalendar.from_ordinal(ordinal))[0], LUNAR_MAX_YEAR + 1):
+            starts = lunar_month_starts(lunar_year)
+            for month_start, next_start in zip(starts, starts[1:]):
+                if self.lunar_day <= next_start - month_start:
+                    yield SolarCalendar.from_ordinal(month_start + self.lunar_day - 1)
+
+
+def expand_rules(rules, start: tuple, end: Optional[tuple] = None):
+    """
+    按时间顺序合并展开多条规则
+
+    参数:
+        rules: RecurrenceRule 序列
+        start: 窗口起点 (year, month, day)，包含
+        end: 窗口终点 (year, month, day)，不包含
+
+    返回:
+        generator: 依次产生 (year, month, day, rule)
+    """
+    def tagged(index, rule):
+        for date in rule.iter_dates(start, end):
+            yield (*date, index)
+
+    streams = [tagged(index, rule) for index, rule in enumerate(rules)]
+    for year, month, day, index in heapq.merge(*streams):
+        yield year, month, day, rules[index]
@@ -0,0 +1,166 @@
+# 渲染模块：把各视图整帧渲染成字符串，按 (视图, 年, 月, 今天, 农历函数) 缓存
+"""
+渲染结果只是字符串，终端、网页或导出都可以复用同一份文本
+
+缓存键包含“今天”，跨过午夜后首次访问会清空整个缓存（今天的标记位置变了）
+"""
+import sys
+import threading
+from collections import OrderedDict
+from datetime import date
+
+import views
+import display_month
+
+
+# 视图名 → 渲染函数(year, month, today) → str；needs_month 为 False 的视图缓存时忽略月份
+VIEWS = {
+    "month": (lambda year, month, today: views.render_month_view(year, month), True),
+    "year": (lambda year, month, today: views.render_year_view(year), False),
+    "aligned": (display_month.render_aligned_calendar, True),
+    "chinese": (display_month.render_chinese_aligned_calendar, True),
+}
+
+
+class RenderCache:
+    """
+    视图渲染结果的 LRU 缓存
+
+    键为 (视图, 年, 月, 今天, 农历函数)；注入不同的农历函数会自然得到不同的键。
+    可以被预取线程（见 prefetch.Prefetcher，通过 warm 预先放入）和前台同时调用，
+    缓存读写加锁，渲染本身在锁外进行
+    """
+
+    def __init__(self, maxsize: int = 128):
+        """
+        参数:
+            maxsize: 最多缓存的帧数
+        """
+        if maxsize < 1:
+            raise ValueError("缓存大小必须为正整数")
+        self.maxsize = maxsize
+        self._frames = OrderedDict()
+        self._today = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, view: str, year: int, month: int = None) -> str:
+        """
+        渲染视图（命中缓存时直接返回）
+
+        参数:
+            view: 视图名，见 VIEWS
+            year: 年份
+            month: 月份（年视图可省略）
+
+        返回:
+            str: 整帧文本
+
+        异常:
+            KeyError: 未知的视图名
+        """
+        function, needs_month = VIEWS[view]
+        with self._lock:
+            key = self._key(view, year, month if needs_month else None)
+            frame = self._frames.get(key)
+            if frame is not None:
+                self._frames.move_to_end(key)
+                self.hits += 1
+                return frame
+            self.misses += 1
+
+        frame = function(year, month, key[3])
+        self._store(key, frame)
+        return frame
+
+    def warm(self, view: str, year: int, month: int = None) -> bool:
+        """
+        预先渲染视图放入缓存（供后台预取），不计入命中统计
+
+        返回:
+            bool: 是否新渲染了一帧（已在缓存中时为 False）
+
+        异常:
+            KeyError: 未知的视图名
+        """
+        function, needs_month = VIEWS[view]
+        with self._lock:
+            key = self._key(view, year, month if needs_month else None)
+            if key in self._frames:
+                return False
+
+        self._store(key, function(year, month, key[3]))
+        return True
+
+    def stats(self) -> dict:
+        """
+        命中统计
+
+        返回:
+            dict: hits / misses / hit_rate / cached
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "cached": len(self._frames),
+            }
+
+    def clear(self):
+        """清空缓存"""
+        with self._lock:
+            self._frames.clear()
+
+    def __len__(self):
+        return len(self._frames)
+
+    def _key(self, view: str, year: int, month) -> tuple:
+        """当前的完整缓存键 (视图, 年, 月, 今天, 农历函数)，调用方需持有锁"""
+        return view, year, month, self._check_today(), views.get_lunar_functions()
+
+    def _store(self, key: tuple, frame: str):
+        """放入缓存并按 LRU 淘汰"""
+        with self._lock:
+            self._frames[key] = frame
+            self._frames.move_to_end(key)
+            if len(self._frames) > self.maxsize:
+                self._frames.popitem(last=False)
+
+    def _check_today(self) -> tuple:
+        """返回今天的 (year, month, day)；日期变化（跨过午夜）时清空缓存，调用方需持有锁"""
+        now = date.today()
+        today = (now.year, now.month, now.day)
+        if today != self._today:
+            self._frames.clear()
+            self._today = today
+        return today
+
+
+# 默认缓存，供 main 和其它前端共用
+_default_cache = RenderCache()
+
+
+def get_cache() -> RenderCache:
+    """返回默认缓存（render() 使用的那一个），预取器向它预先放入视图"""
+    return _default_cache
+
+
+def render(view: str, year: int, month: int = None) -> str:
+    """渲染视图（使用默认缓存），返回整帧文本"""
+    return _default_cache.render(view, year, month)
+
+
+def write_frame(text: str, stream=None):
+    """
+    把整帧文本一次写入终端
+
+    参数:
+        text: 整帧文本
+        stream: 输出流，默认 sys.stdout
+    """
+    stream = stream or sys.stdout
+    stream.write(text)
+    stream.flush()
@@ -0,0 +1,130 @@
+# 屏幕模块：差分重绘终端画面，替代每次按键都 os.system('clear')
+"""
+用 ANSI 控制序列把光标移回左上角，逐行对比新旧两帧，只重写变化的行，
+所有输出拼成一次写入；不支持 ANSI 的终端（TERM=dumb、输出被重定向等）
+退回到直接写出整帧
+"""
+import os
+import shutil
+import sys
+
+from stream_render import display_width
+
+# ANSI 控制序列
+CURSOR_HOME = "\x1b[H"
+CLEAR_SCREEN = "\x1b[2J"
+CLEAR_LINE_END = "\x1b[K"
+CLEAR_BELOW = "\x1b[J"
+
+
+def _move_to(row: int) -> str:
+    """把光标移到第 row 行行首（从1开始）"""
+    return f"\x1b[{row};1H"
+
+
+def _enable_windows_ansi(stream) -> bool:
+    """在 Windows 10+ 控制台上打开虚拟终端处理（ANSI 支持），失败返回 False"""
+    try:
+        import ctypes
+        import msvcrt
+
+        kernel32 = ctypes.windll.kernel32
+        handle = msvcrt.get_osfhandle(stream.fileno())
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except Exception:
+        return False
+
+
+def supports_ansi(stream) -> bool:
+    """判断输出流是否为支持 ANSI 控制序列的终端"""
+    try:
+        if not stream.isatty():
+            return False
+    except (AttributeError, ValueError):
+        return False
+    if os.environ.get("TERM", "") == "dumb":
+        return False
+    if os.name == "nt":
+        return _enable_windows_ansi(stream)
+    return True
+
+
+class ScreenRenderer:
+    """
+    差分重绘器
+
+    记住上一帧的各行，下一帧只重写有变化的行；帧太高（会滚屏）或有行太宽（会折行）时
+    绝对行号会失效，这时改为清屏后整帧重画
+    """
+
+    def __init__(self, stream=None, ansi=None):
+        """
+        参数:
+            stream: 输出流，None 表示每次写入时取当前的 sys.stdout
+            ansi: 是否使用 ANSI 差分重绘，None 表示自动检测
+        """
+        self.stream = stream
+        self.ansi = supports_ansi(stream or sys.stdout) if ansi is None else ansi
+        self._lines = None  # 上一帧的各行，None 表示下一帧需要整屏重画
+
+    def draw(self, frame: str) -> int:
+        """
+        显示一帧
+
+        参数:
+            frame: 整帧文本
+
+        返回:
+            int: 本次重写的行数（整屏重画时为帧的总行数）
+        """
+        lines = frame.split("\n")
+        if lines and lines[-1] == "":
+            lines.pop()
+
+        if not self.ansi:
+            self._write(frame)
+            return len(lines)
+
+        fits = self._fits(lines)
+        if self._lines is None or not fits:
+            # 首帧或帧放不下：清屏后整帧重画
+            self._write(CURSOR_HOME + CLEAR_SCREEN + "\n".join(lines) + "\n")
+            self._lines = lines if fits else None
+            return len(lines)
+
+        buffer = []
+        for row, line in enumerate(lines):
+            if row >= len(self._lines) or self._lines[row] != line:
+                buffer.append(_move_to(row + 1) + line + CLEAR_LINE_END)
+        # 光标停在帧下方，并清掉旧帧多出来的行和帧外的零散输出
+        buffer.append(_move_to(len(lines) + 1) + CLEAR_BELOW)
+
+        self._write("".join(buffer))
+        changed = len(buffer) - 1
+        self._lines = lines
+        return changed
+
+    @staticmethod
+    def _fits(lines) -> bool:
+        """
+        帧能否按绝对行号差分重绘
+
+        任何一行折行（显示宽度达到终端列数）都会让后面的行号错位；
+        帧高要比终端少两行，留出光标所在行和按键回显的一行，否则屏幕会滚动
+        """
+        columns, rows = shutil.get_terminal_size()
+        return len(lines) < rows - 1 and all(display_width(line) < columns for line in lines)
+
+    def invalidate(self):
+        """屏幕被其它输出破坏后调用，下一帧整屏重画"""
+        self._lines = None
+
+    def _write(self, text: str):
+        """一次写入并刷新"""
+        stream = self.stream or sys.stdout
+        stream.write(text)
+        stream.flush()
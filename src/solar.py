@@ -1,5 +1,289 @@
 # 公历计算模块（陈一帆负责） 
-import datetime
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple, Optional
+
+import calendar_core
+
+try:
+    import numpy as np
+except ImportError:  # 批量接口依赖 numpy，单日期接口不受影响
+    np = None
+
+
+# 闰年、月天数和星期的唯一实现在 calendar_core，这里沿用原来的模块内名称
+_MONTH_DAYS = calendar_core.MONTH_DAYS
+_CUMULATIVE_DAYS = calendar_core.CUMULATIVE_DAYS
+_DAYS_PER_CYCLE = calendar_core.DAYS_PER_CYCLE
+_CYCLE_YEARS = calendar_core.CYCLE_YEARS
+
+
+def _build_cycle_tables():
+    """
+    生成400年周期的月份版式表
+
+    返回:
+        tuple: 400个元组，每个元组含12个月的6×7版式（元组嵌套元组）
+
+    说明:
+        不同版式只有 7种首日星期 × 4种月长 = 28 种，所有月份共享这28个不可变对象
+    """
+    shared = {}
+    year_layouts = []
+
+    for year in range(1, _CYCLE_YEARS + 1):
+        months = []
+        for month in range(1, 13):
+            key = (calendar_core.first_weekday(year, month), calendar_core.month_days(year, month))
+            if key not in shared:
+                weekday, total_days = key
+                cells = [0] * weekday + list(range(1, total_days + 1))
+                cells += [0] * (42 - len(cells))
+                shared[key] = tuple(tuple(cells[row * 7:row * 7 + 7]) for row in range(6))
+            months.append(shared[key])
+        year_layouts.append(tuple(months))
+
+    return tuple(year_layouts)
+
+
+def _build_year_blocks(year_layouts):
+    """
+    把每个周期年的12个版式压平成504字节（12×6×7）的只读块
+
+    说明:
+        全年版式只有 7种元旦星期 × 平/闰年 = 14 种，相同的年份共享同一个 bytes 对象
+    """
+    shared = {}
+    blocks = []
+    for months in year_layouts:
+        if months not in shared:
+            shared[months] = bytes(cell for layout in months for row in layout for cell in row)
+        blocks.append(shared[months])
+    return tuple(blocks)
+
+
+_CYCLE_YEAR_LAYOUTS = _build_cycle_tables()
+_CYCLE_YEAR_BLOCKS = _build_year_blocks(_CYCLE_YEAR_LAYOUTS)
+
+
+def _require_numpy():
+    """批量接口的依赖检查，未安装 numpy 时给出明确提示"""
+    if np is None:
+        raise ImportError("批量接口需要 numpy，请先执行: pip install numpy")
+
+
+def _as_int_arrays(*columns):
+    """
+    把任意序列/数组/标量转换为等长的 int64 数组（支持广播），供各批量接口使用
+
+    与单日期接口一样拒绝非整数：小数不会被截断，NaN、None 等也不会变成垃圾值
+
+    异常:
+        ValueError: 任何一行含有不是有限整数的值
+    """
+    _require_numpy()
+    arrays, bad = _as_checked_int_arrays(*columns)
+    if bad.any():
+        index = int(np.flatnonzero(bad)[0])
+        raise ValueError(f"第{index}个值不是整数")
+    return arrays
+
+
+# 能被 float64 精确表示的最大整数，超过它的“整数”在转换中可能已经失真
+_MAX_EXACT_INT = 2 ** 53
+
+
+def _to_float(value) -> float:
+    """单个值转 float，无法转换（None、非数字字符串等）时返回 NaN"""
+    try:
+        return float(value)
+    except (TypeError, ValueError, OverflowError):
+        return float("nan")
+
+
+def _as_float_array(column):
+    """把序列/数组/标量转换为 float64 数组，无法转换的元素记为 NaN（不抛异常）"""
+    try:
+        return np.asarray(column, dtype=np.float64)
+    except (TypeError, ValueError, OverflowError):
+        values = np.asarray(column, dtype=object)
+        return np.array([_to_float(value) for value in values.flat], dtype=np.float64).reshape(values.shape)
+
+
+def _as_date_rows(rows):
+    """
+    把 N×3 的 (年, 月, 日) 序列拆成三列 float64 数组
+
+    长度不是3或无法迭代的行，三列都记为 NaN
+    """
+    try:
+        table = np.asarray(rows, dtype=np.float64)
+    except (TypeError, ValueError, OverflowError):
+        table = None  # 不整齐的行或含无法转换的值，逐行处理
+    if table is not None and table.size % 3 == 0:
+        table = table.reshape(-1, 3)
+        return table[:, 0], table[:, 1], table[:, 2]
+
+    columns = ([], [], [])
+    for row in rows:
+        try:
+            values = list(row)
+        except TypeError:
+            values = []
+        if len(values) != 3:
+            values = [None] * 3
+        for column, value in zip(columns, values):
+            column.append(_to_float(value))
+    return tuple(np.asarray(column, dtype=np.float64) for column in columns)
+
+
+def _as_checked_int_arrays(*columns):
+    """
+    把可能含脏数据的各列转换为等长的 int64 数组（支持广播，不抛异常）
+
+    返回:
+        tuple: (int64 数组列表, bad)，bad 为 bool 数组，标记任一列不是有限整数的行；
+               这些行在 int64 数组中用1占位
+    """
+    floats = np.broadcast_arrays(*[_as_float_array(column) for column in columns])
+    bad = np.zeros(floats[0].shape, dtype=bool)
+    for values in floats:
+        bad |= ~(np.isfinite(values) & (values == np.floor(values)) & (np.abs(values) <= _MAX_EXACT_INT))
+    return [np.where(bad, 1, values).astype(np.int64) for values in floats], bad
+
+
+def _np_date_reasons(y, m, d):
+    """
+    向量化计算每个日期的校验原因码（不抛异常）
+
+    返回:
+        tuple: (reasons, leap, month_days)，reasons 为 uint8 数组，
+               取值见 SolarCalendar.DATE_* 常量；month_days 在月份无效处无意义
+    """
+    leap = _np_is_leap(y)
+    month_ok = (m >= 1) & (m <= 12)
+    month_days = (np.asarray(_MONTH_DAYS, dtype=np.int64)[np.clip(m, 1, 12) - 1]
+                  + (leap & (m == 2)))
+
+    reasons = np.zeros(y.shape, dtype=np.uint8)
+    reasons[(d < 1) | (d > month_days)] = SolarCalendar.DATE_INVALID_DAY
+    reasons[~month_ok] = SolarCalendar.DATE_INVALID_MONTH
+    reasons[y < 1] = SolarCalendar.DATE_INVALID_YEAR
+    return reasons, leap, month_days
+
+
+def _np_check_dates(y, m, d):
+    """
+    批量校验日期，任何一个无效就抛出 ValueError
+
+    返回:
+        tuple: (leap, month_days) 两个数组，供调用方继续使用
+    """
+    reasons, leap, month_days = _np_date_reasons(y, m, d)
+    if reasons.any():
+        index = int(np.flatnonzero(reasons)[0])
+        if reasons.flat[index] == SolarCalendar.DATE_INVALID_DAY:
+            raise ValueError(f"第{index}个日期无效: 日期必须在1-{int(month_days.flat[index])}之间")
+        raise ValueError(f"第{index}个日期无效: 年份必须为正整数，月份必须在1-12之间")
+
+    return leap, month_days
+
+
+def _np_day_of_year(leap, m, d):
+    """向量化查前缀和表计算年内第几天"""
+    return np.asarray(_CUMULATIVE_DAYS, dtype=np.int64)[leap.astype(np.int64), m - 1] + d
+
+
+def _np_to_ordinal(y, m, d, leap):
+    """向量化日期 → 序数（公元1年1月1日为1，与 datetime.date.toordinal 一致）"""
+    y1 = y - 1
+    return y1 * 365 + y1 // 4 - y1 // 100 + y1 // 400 + _np_day_of_year(leap, m, d)
+
+
+def _np_from_ordinal(n):
+    """向量化序数 → 日期，算法与 SolarCalendar.from_ordinal 相同"""
+    z = n + 305
+    era = z // _DAYS_PER_CYCLE
+    doe = z - era * _DAYS_PER_CYCLE
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    d = doy - (153 * mp + 2) // 5 + 1
+    m = np.where(mp < 10, mp + 3, mp - 9)
+    y = yoe + era * 400 + (m <= 2)
+    return y, m, d
+
+
+def _np_is_leap(y):
+    """向量化闰年判断"""
+    return ((y % 4 == 0) & (y % 100 != 0)) | (y % 400 == 0)
+
+
+def _np_weekday(y, m, d):
+    """向量化蔡勒公式，返回值与 get_weekday 一致（0=周日，...，6=周六）"""
+    shift = m < 3
+    m = np.where(shift, m + 12, m)
+    y = np.where(shift, y - 1, y)
+    century = y // 100
+    year_of_century = y % 100
+    h = (d + (13 * (m + 1)) // 5 + year_of_century +
+         year_of_century // 4 + century // 4 - 2 * century) % 7
+    return (h + 6) % 7
+
+
+def _np_iso_weeks_in_year(y):
+    """向量化计算 ISO 年包含的周数（52 或 53）"""
+    jan1 = _np_weekday(y, np.ones_like(y), np.ones_like(y))
+    long_year = (jan1 == 4) | ((jan1 == 3) & _np_is_leap(y))
+    return np.where(long_year, 53, 52)
+
+
+def _np_iso_week(y, weekday, day_of_year):
+    """
+    向量化计算 ISO 周（周一开始，包含1月4日的周为第1周）
+
+    返回:
+        tuple: (iso_year, iso_week) 两个数组
+    """
+    iso_weekday = (weekday + 6) % 7 + 1
+    week = (day_of_year - iso_weekday + 10) // 7
+
+    # 第0周属于上一年的最后一周；超出本年周数的属于下一年的第1周
+    prev = week < 1
+    nxt = week > _np_iso_weeks_in_year(y)
+    iso_year = np.where(prev, y - 1, np.where(nxt, y + 1, y))
+    week = np.where(prev, _np_iso_weeks_in_year(y - 1), np.where(nxt, 1, week))
+
+    return iso_year, week
+
+
+def _generate_years_chunk(first: int, last: int, compact: bool) -> list:
+    """进程池任务：生成 [first, last] 年的日历（必须是模块级函数才能被序列化）"""
+    if compact:
+        return [SolarCalendar.get_year_block(year) for year in range(first, last + 1)]
+    return [SolarCalendar.generate_year_calendar(year) for year in range(first, last + 1)]
+
+
+def _estimate_year_bytes(compact: bool) -> int:
+    """粗略估算一年日历结果占用的内存（字节），用于换算内存上限"""
+    if compact:
+        return sys.getsizeof(SolarCalendar.get_year_block(1))
+    size = 0
+    for matrix in SolarCalendar.generate_year_calendar(1).values():
+        size += sys.getsizeof(matrix) + sum(sys.getsizeof(row) for row in matrix)
+    return size + sys.getsizeof({}) * 2
+
+
+class DayRecord(NamedTuple):
+    """iter_days 产生的单日记录"""
+    year: int
+    month: int
+    day: int
+    weekday: int       # 0=周日，...，6=周六
+    day_of_year: int   # 1-366
+
 
 class SolarCalendar:
     """公历日历计算类"""
@@ -13,6 +297,13 @@ class SolarCalendar:
     # 星期名称（周日开头）
     WEEKDAY_NAMES = ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]
     
+    # validate_dates_batch 的原因码
+    DATE_VALID = 0
+    DATE_INVALID_YEAR = 1    # 年份小于1
+    DATE_INVALID_MONTH = 2   # 月份不在1-12之间
+    DATE_INVALID_DAY = 3     # 日期超出该月天数
+    DATE_NOT_INTEGER = 4     # 年/月/日不是有限整数（小数、NaN、无穷、None 或无法转换的值）
+    
     @staticmethod
     def is_leap_year(year: int) -> bool:
         """
@@ -31,7 +322,7 @@ class SolarCalendar:
         if year < 1:
             raise ValueError("年份必须为正整数")
         
-        return (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0)
+        return calendar_core.is_leap_year(year)
     
     @staticmethod
     def get_month_days(year: int, month: int) -> int:
@@ -51,19 +342,16 @@ class SolarCalendar:
         if not 1 <= month <= 12:
             raise ValueError("月份必须在1-12之间")
         
-        # 各月份天数（非闰年2月为28天）
-        month_days = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
-        
         # 如果是闰年且是2月
         if month == 2 and SolarCalendar.is_leap_year(year):
             return 29
         
-        return month_days[month - 1]
+        return _MONTH_DAYS[month - 1]
     
     @staticmethod
     def get_weekday(year: int, month: int, day: int) -> int:
         """
-        计算指定日期是星期几（蔡勒公式）
+        计算指定日期是星期几（查400年周期表，见 calendar_core.weekday）
         
         参数:
             year: 年份（支持任意年份）
@@ -84,23 +372,7 @@ class SolarCalendar:
         if day < 1 or day > max_days:
             raise ValueError(f"日期必须在1-{max_days}之间")
         
-        # 蔡勒公式（Zeller's congruence）
-        if month < 3:
-            month += 12
-            year -= 1
-        
-        century = year // 100
-        year_of_century = year % 100
-        
-        # 蔡勒公式计算
-        h = (day + (13 * (month + 1)) // 5 + year_of_century + 
-             year_of_century // 4 + century // 4 - 2 * century) % 7
-        
-        # 调整结果为0-6（0=周六，1=周日，...，6=周五）
-        # 我们需要0=周日，1=周一，...，6=周六
-        weekday = (h + 6) % 7
-        
-        return weekday
+        return calendar_core.weekday(year, month, day)
     
     @staticmethod
     def get_weekday_name(weekday: int) -> str:
@@ -153,25 +425,8 @@ class SolarCalendar:
                 ...
             ]
         """
-        # 初始化6×7的矩阵，全部填充0
-        matrix = [[0 for _ in range(7)] for _ in range(6)]
-        
-        # 获取该月的天数和第一天是星期几
-        total_days = SolarCalendar.get_month_days(year, month)
-        first_day_weekday = SolarCalendar.get_weekday(year, month, 1)
-        
-        # 填充日期
-        row, col = 0, first_day_weekday
-        for day in range(1, total_days + 1):
-            matrix[row][col] = day
-            
-            # 移动到下一个位置
-            col += 1
-            if col >= 7:
-                col = 0
-                row += 1
-        
-        return matrix
+        # 从400年周期表复制一份，调用方可以自由修改返回的矩阵
+        return [list(row) for row in SolarCalendar.get_month_layout(year, month)]
     
     @staticmethod
     def generate_year_calendar(year: int) -> dict:
@@ -186,12 +441,80 @@ class SolarCalendar:
         """
         year_calendar = {}
         
-        for month in range(1, 13):
-            month_matrix = SolarCalendar.generate_month_matrix(year, month)
-            year_calendar[month] = month_matrix
+        for month, layout in enumerate(SolarCalendar.get_year_layout(year), start=1):
+            year_calendar[month] = [list(row) for row in layout]
         
         return year_calendar
     
+    @staticmethod
+    def get_first_weekday(year: int, month: int) -> int:
+        """
+        查表获取指定月份1号是星期几
+        
+        参数:
+            year: 年份
+            month: 月份（1-12）
+            
+        返回:
+            int: 星期几（0=周日，1=周一，...，6=周六）
+        """
+        if year < 1:
+            raise ValueError("年份必须为正整数")
+        if not 1 <= month <= 12:
+            raise ValueError("月份必须在1-12之间")
+        
+        return calendar_core.first_weekday(year, month)
+    
+    @staticmethod
+    def get_month_layout(year: int, month: int) -> tuple:
+        """
+        查表获取指定月份的日历版式（只读）
+        
+        参数:
+            year: 年份
+            month: 月份（1-12）
+            
+        返回:
+            tuple: 6×7的嵌套元组，空白处用0表示；
+                   相同版式的月份共享同一个对象，不产生新的分配
+        """
+        if not 1 <= month <= 12:
+            raise ValueError("月份必须在1-12之间")
+        
+        return SolarCalendar.get_year_layout(year)[month - 1]
+    
+    @staticmethod
+    def get_year_layout(year: int) -> tuple:
+        """
+        查表获取指定年份12个月的日历版式（只读）
+        
+        参数:
+            year: 年份
+            
+        返回:
+            tuple: 12个 get_month_layout 形式的版式，下标0对应1月
+        """
+        if year < 1:
+            raise ValueError("年份必须为正整数")
+        
+        return _CYCLE_YEAR_LAYOUTS[(year - 1) % _CYCLE_YEARS]
+    
+    @staticmethod
+    def get_year_block(year: int) -> bytes:
+        """
+        查表获取指定年份的紧凑日历块
+        
+        参数:
+            year: 年份
+            
+        返回:
+            bytes: 504字节，按 月×42 + 行×7 + 列 排列，每字节为日期（空白为0）
+        """
+        if year < 1:
+            raise ValueError("年份必须为正整数")
+        
+        return _CYCLE_YEAR_BLOCKS[(year - 1) % _CYCLE_YEARS]
+    
     @staticmethod
     def get_date_info(year: int, month: int, day: int) -> dict:
         """
@@ -216,14 +539,12 @@ class SolarCalendar:
         weekday_name = SolarCalendar.get_weekday_name(weekday)
         month_name = SolarCalendar.get_month_name(month)
         
-        # 计算是该年的第几天
-        day_of_year = day
-        for m in range(1, month):
-            day_of_year += SolarCalendar.get_month_days(year, m)
+        # 计算是该年的第几天（查前缀和表）
+        day_of_year = SolarCalendar.get_day_of_year(year, month, day)
         
         # 计算该月有多少周（可能有4-6周）
-        matrix = SolarCalendar.generate_month_matrix(year, month)
-        week_count = sum(1 for row in matrix if any(row))
+        first_weekday = SolarCalendar.get_first_weekday(year, month)
+        week_count = (first_weekday + max_days + 6) // 7
         
         return {
             "year": year,
@@ -236,10 +557,143 @@ class SolarCalendar:
             "is_leap_year": SolarCalendar.is_leap_year(year),
             "month_days": max_days,
             "week_count": week_count,
-            "first_weekday": SolarCalendar.get_weekday(year, month, 1),
-            "last_weekday": SolarCalendar.get_weekday(year, month, max_days)
+            "first_weekday": first_weekday,
+            "last_weekday": (first_weekday + max_days - 1) % 7
         }
     
+    @staticmethod
+    def get_cumulative_days(year: int) -> tuple:
+        """
+        获取指定年份各月的累计天数前缀和表
+        
+        参数:
+            year: 年份
+            
+        返回:
+            tuple: 13项，第i项为前i个月的总天数（第0项为0，第12项为全年天数）
+        """
+        return _CUMULATIVE_DAYS[SolarCalendar.is_leap_year(year)]
+    
+    @staticmethod
+    def get_day_of_year(year: int, month: int, day: int) -> int:
+        """
+        计算指定日期是该年的第几天（1开始）
+        
+        参数:
+            year: 年份
+            month: 月份
+            day: 日期
+            
+        返回:
+            int: 年内序号（1-366）
+        """
+        max_days = SolarCalendar.get_month_days(year, month)
+        if day < 1 or day > max_days:
+            raise ValueError(f"日期必须在1-{max_days}之间")
+        
+        return SolarCalendar.get_cumulative_days(year)[month - 1] + day
+    
+    @staticmethod
+    def to_ordinal(year: int, month: int, day: int) -> int:
+        """
+        日期转换为序数（闭式公式，不循环月份）
+        
+        参数:
+            year: 年份
+            month: 月份
+            day: 日期
+            
+        返回:
+            int: 序数，公元1年1月1日为1，与 datetime.date.toordinal 一致，
+                 但不受9999年的限制
+        """
+        y1 = year - 1
+        return (y1 * 365 + y1 // 4 - y1 // 100 + y1 // 400
+                + SolarCalendar.get_day_of_year(year, month, day))
+    
+    @staticmethod
+    def from_ordinal(ordinal: int) -> tuple:
+        """
+        序数转换为日期（闭式公式，不循环月份）
+        
+        参数:
+            ordinal: 序数（>=1）
+            
+        返回:
+            tuple: (year, month, day)
+            
+        说明:
+            以3月1日为年首，闰日落在“年末”，每400年146097天，
+            先定位周期、再定位周期内的年、最后用 (5×日+2)//153 求月份
+        """
+        if ordinal < 1:
+            raise ValueError("序数必须为正整数")
+        
+        z = ordinal + 305  # 距公元0年3月1日的天数
+        era, doe = divmod(z, _DAYS_PER_CYCLE)
+        yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+        doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+        mp = (5 * doy + 2) // 153
+        day = doy - (153 * mp + 2) // 5 + 1
+        month = mp + 3 if mp < 10 else mp - 9
+        year = yoe + era * 400 + (month <= 2)
+        
+        return year, month, day
+    
+    @staticmethod
+    def add_days(year: int, month: int, day: int, days: int) -> tuple:
+        """
+        日期加减天数
+        
+        参数:
+            year: 年份
+            month: 月份
+            day: 日期
+            days: 天数（可以为负数）
+            
+        返回:
+            tuple: (year, month, day)
+        """
+        return SolarCalendar.from_ordinal(SolarCalendar.to_ordinal(year, month, day) + days)
+    
+    @staticmethod
+    def add_months(year: int, month: int, day: int, months: int) -> tuple:
+        """
+        日期加减月数，目标月没有该日时取月末（如1月31日加1个月为2月28/29日）
+        
+        参数:
+            year: 年份
+            month: 月份
+            day: 日期
+            months: 月数（可以为负数）
+            
+        返回:
+            tuple: (year, month, day)
+        """
+        max_days = SolarCalendar.get_month_days(year, month)
+        if day < 1 or day > max_days:
+            raise ValueError(f"日期必须在1-{max_days}之间")
+        
+        year, month_index = divmod(year * 12 + month - 1 + months, 12)
+        month = month_index + 1
+        day = min(day, SolarCalendar.get_month_days(year, month))
+        
+        return year, month, day
+    
+    @staticmethod
+    def days_between(start: tuple, end: tuple) -> int:
+        """
+        计算两个日期相差的天数
+        
+        参数:
+            start: 起始日期 (year, month, day)
+            end: 结束日期 (year, month, day)
+            
+        返回:
+            int: end - start 的天数，end 在前时为负数
+        """
+        return SolarCalendar.to_ordinal(*end) - SolarCalendar.to_ordinal(*start)
+    
     @staticmethod
     def validate_date(year: int, month: int, day: int) -> bool:
         """
@@ -253,12 +707,10 @@ class SolarCalendar:
         返回:
             bool: 日期有效返回True，否则返回False
         """
-        try:
-            # 使用datetime验证更准确
-            datetime.date(year, month, day)
-            return True
-        except ValueError:
+        # 纯算术判断，不构造 datetime、不抛异常，也不受9999年的限制
+        if year < 1 or not 1 <= month <= 12:
             return False
+        return 1 <= day <= SolarCalendar.get_month_days(year, month)
     
     @staticmethod
     def get_week_number(year: int, month: int, day: int) -> int:
@@ -271,4 +723,385 @@ class SolarCalendar:
             day: 日期
             
         返回:
+            int: ISO 周序号（1-53）；年初几天可能属于上一年的最后一周，
+                 年末几天可能属于下一年的第1周，需要 ISO 年份时用 get_iso_calendar
+        """
+        return SolarCalendar.get_iso_calendar(year, month, day)[1]
+    
+    @staticmethod
+    def get_iso_weekday(year: int, month: int, day: int) -> int:
         """
+        计算 ISO 星期（1=周一，...，7=周日）
+        
+        参数:
+            year: 年份
+            month: 月份
+            day: 日期
+            
+        返回:
+            int: ISO 星期（1-7）
+        """
+        return (SolarCalendar.get_weekday(year, month, day) + 6) % 7 + 1
+    
+    @staticmethod
+    def get_iso_weeks_in_year(iso_year: int) -> int:
+        """
+        计算 ISO 年包含的周数
+        
+        参数:
+            iso_year: ISO 年份
+            
+        返回:
+            int: 52 或 53（1月1日是周四，或闰年1月1日是周三时为53周）
+        """
+        jan1 = SolarCalendar.get_weekday(iso_year, 1, 1)
+        if jan1 == 4 or (jan1 == 3 and SolarCalendar.is_leap_year(iso_year)):
+            return 53
+        return 52
+    
+    @staticmethod
+    def get_iso_calendar(year: int, month: int, day: int) -> tuple:
+        """
+        计算 ISO 日历三元组，结果与 datetime.date.isocalendar 一致
+        
+        参数:
+            year: 年份
+            month: 月份
+            day: 日期
+            
+        返回:
+            tuple: (iso_year, iso_week, iso_weekday)
+        """
+        iso_weekday = SolarCalendar.get_iso_weekday(year, month, day)
+        day_of_year = SolarCalendar.get_day_of_year(year, month, day)
+        
+        # 包含1月4日（即本年第一个周四）的周为第1周
+        week = (day_of_year - iso_weekday + 10) // 7
+        if week < 1:
+            return year - 1, SolarCalendar.get_iso_weeks_in_year(year - 1), iso_weekday
+        if week > SolarCalendar.get_iso_weeks_in_year(year):
+            return year + 1, 1, iso_weekday
+        return year, week, iso_weekday
+    
+    @staticmethod
+    def get_iso_year(year: int, month: int, day: int) -> int:
+        """
+        计算指定日期所属的 ISO 年份
+        
+        参数:
+            year: 年份
+            month: 月份
+            day: 日期
+            
+        返回:
+            int: ISO 年份（年初/年末可能与公历年份相差1）
+        """
+        return SolarCalendar.get_iso_calendar(year, month, day)[0]
+    
+    @staticmethod
+    def get_iso_week_range(iso_year: int, week: int) -> tuple:
+        """
+        获取 ISO 周对应的日期范围
+        
+        参数:
+            iso_year: ISO 年份
+            week: ISO 周序号（1-52/53）
+            
+        返回:
+            tuple: ((year, month, day), (year, month, day))，分别为该周的周一和周日
+        """
+        weeks = SolarCalendar.get_iso_weeks_in_year(iso_year)
+        if not 1 <= week <= weeks:
+            raise ValueError(f"周序号必须在1-{weeks}之间")
+        
+        # 第1周的周一 = 1月4日往前退到周一
+        jan4 = SolarCalendar.to_ordinal(iso_year, 1, 4)
+        monday = jan4 - SolarCalendar.get_iso_weekday(iso_year, 1, 4) + 1 + (week - 1) * 7
+        
+        return SolarCalendar.from_ordinal(monday), SolarCalendar.from_ordinal(monday + 6)
+    
+    @staticmethod
+    def get_date_info_batch(years, months, days) -> dict:
+        """
+        批量获取日期信息（向量化计算，适合百万级日期标注）
+        
+        参数:
+            years: 年份序列（list / tuple / numpy 数组，也可以是标量）
+            months: 月份序列
+            days: 日期序列
+            
+        返回:
+            dict: 列式结果，键与 get_date_info 对应，值为等长的 numpy 数组，
+                  另外包含 iso_year 和 iso_week 两列
+            
+        异常:
+            ImportError: 未安装 numpy
+            ValueError: 存在无效日期（提示第一个无效日期的下标）
+        """
+        y, m, d = _as_int_arrays(years, months, days)
+        leap, month_days = _np_check_dates(y, m, d)
+        
+        weekday = _np_weekday(y, m, d)
+        day_of_year = _np_day_of_year(leap, m, d)
+        
+        # 1号和月末的星期可由当天星期直接推出，无需再跑两次蔡勒公式
+        first_weekday = (weekday - (d - 1)) % 7
+        last_weekday = (first_weekday + month_days - 1) % 7
+        
+        # 周数 = 前导空位 + 天数 向上取整到7
+        week_count = (first_weekday + month_days + 6) // 7
+        
+        iso_year, iso_week = _np_iso_week(y, weekday, day_of_year)
+        
+        return {
+            "year": y,
+            "month": m,
+            "day": d,
+            "weekday": weekday,
+            "day_of_year": day_of_year,
+            "is_leap_year": leap,
+            "month_days": month_days,
+            "week_count": week_count,
+            "first_weekday": first_weekday,
+            "last_weekday": last_weekday,
+            "iso_year": iso_year,
+            "iso_week": iso_week
+        }
+    
+    @staticmethod
+    def to_ordinal_batch(years, months, days):
+        """
+        批量日期 → 序数（to_ordinal 的向量化版本）
+        
+        参数:
+            years / months / days: 年、月、日序列（numpy 数组或任意序列）
+            
+        返回:
+            numpy.ndarray: int64 序数数组
+        """
+        y, m, d = _as_int_arrays(years, months, days)
+        leap, _ = _np_check_dates(y, m, d)
+        return _np_to_ordinal(y, m, d, leap)
+    
+    @staticmethod
+    def from_ordinal_batch(ordinals) -> tuple:
+        """
+        批量序数 → 日期（from_ordinal 的向量化版本）
+        
+        参数:
+            ordinals: 序数序列（>=1）
+            
+        返回:
+            tuple: (years, months, days) 三个 int64 数组
+        """
+        (n,) = _as_int_arrays(ordinals)
+        if (n < 1).any():
+            raise ValueError("序数必须为正整数")
+        return _np_from_ordinal(n)
+    
+    @staticmethod
+    def add_days_batch(years, months, days, offsets) -> tuple:
+        """
+        批量日期加减天数（add_days 的向量化版本）
+        
+        参数:
+            years / months / days: 年、月、日序列
+            offsets: 天数序列（可以为负数，也可以是标量）
+            
+        返回:
+            tuple: (years, months, days) 三个 int64 数组
+        """
+        y, m, d, offsets = _as_int_arrays(years, months, days, offsets)
+        leap, _ = _np_check_dates(y, m, d)
+        n = _np_to_ordinal(y, m, d, leap) + offsets
+        if (n < 1).any():
+            raise ValueError("结果日期早于公元1年1月1日")
+        return _np_from_ordinal(n)
+    
+    @staticmethod
+    def add_months_batch(years, months, days, offsets) -> tuple:
+        """
+        批量日期加减月数，超出目标月天数时取月末（add_months 的向量化版本）
+        
+        参数:
+            years / months / days: 年、月、日序列
+            offsets: 月数序列（可以为负数，也可以是标量）
+            
+        返回:
+            tuple: (years, months, days) 三个 int64 数组
+        """
+        y, m, d, offsets = _as_int_arrays(years, months, days, offsets)
+        _np_check_dates(y, m, d)
+        total = y * 12 + m - 1 + offsets
+        y, m = total // 12, total % 12 + 1
+        month_days = np.asarray(_MONTH_DAYS, dtype=np.int64)[m - 1] + (_np_is_leap(y) & (m == 2))
+        return y, m, np.minimum(d, month_days)
+    
+    @staticmethod
+    def days_between_batch(start_years, start_months, start_days,
+                           end_years, end_months, end_days):
+        """
+        批量计算两组日期相差的天数（days_between 的向量化版本）
+        
+        返回:
+            numpy.ndarray: end - start 的天数
+        """
+        return (SolarCalendar.to_ordinal_batch(end_years, end_months, end_days)
+                - SolarCalendar.to_ordinal_batch(start_years, start_months, start_days))
+    
+    @staticmethod
+    def get_iso_calendar_batch(years, months, days) -> tuple:
+        """
+        批量计算 ISO 日历（get_iso_calendar 的向量化版本）
+        
+        参数:
+            years / months / days: 年、月、日序列（numpy 数组或任意序列）
+            
+        返回:
+            tuple: (iso_years, iso_weeks, iso_weekdays) 三个 int64 数组
+        """
+        y, m, d = _as_int_arrays(years, months, days)
+        leap, _ = _np_check_dates(y, m, d)
+        weekday = _np_weekday(y, m, d)
+        iso_year, iso_week = _np_iso_week(y, weekday, _np_day_of_year(leap, m, d))
+        return iso_year, iso_week, (weekday + 6) % 7 + 1
+    
+    @staticmethod
+    def iter_days(start: tuple, end: Optional[tuple] = None, step: int = 1):
+        """
+        惰性遍历日期范围，逐日产生 DayRecord
+        
+        参数:
+            start: 起始日期 (year, month, day)，包含
+            end: 结束日期 (year, month, day)，不包含；为 None 时无限遍历
+            step: 步长（天数，正整数）
+            
+        返回:
+            generator: 依次产生 DayRecord
+            
+        说明:
+            只在起点算一次星期和年内序号，之后按步长递推，
+            跨月/跨年时才查一次月长，常数内存即可遍历上千年
+        """
+        if step < 1:
+            raise ValueError("步长必须为正整数")
+        
+        year, month, day = start
+        weekday = SolarCalendar.get_weekday(year, month, day)
+        day_of_year = SolarCalendar.get_day_of_year(year, month, day)
+        month_days = SolarCalendar.get_month_days(year, month)
+        year_days = SolarCalendar.get_cumulative_days(year)[12]
+        
+        if end is None:
+            remaining = None
+        else:
+            remaining = SolarCalendar.to_ordinal(*end) - SolarCalendar.to_ordinal(year, month, day)
+        
+        while remaining is None or remaining > 0:
+            yield DayRecord(year, month, day, weekday, day_of_year)
+            
+            if remaining is not None:
+                remaining -= step
+                if remaining <= 0:
+                    return
+            
+            weekday = (weekday + step) % 7
+            
+            if step > 31:
+                # 大步长直接用序数跳转，避免逐月递推
+                ordinal = SolarCalendar.to_ordinal(year, month, day) + step
+                year, month, day = SolarCalendar.from_ordinal(ordinal)
+                day_of_year = SolarCalendar.get_day_of_year(year, month, day)
+                month_days = SolarCalendar.get_month_days(year, month)
+                year_days = SolarCalendar.get_cumulative_days(year)[12]
+                continue
+            
+            day += step
+            day_of_year += step
+            while day > month_days:
+                day -= month_days
+                month += 1
+                if month > 12:
+                    month = 1
+                    year += 1
+                    day_of_year -= year_days
+                    year_days = SolarCalendar.get_cumulative_days(year)[12]
+                month_days = SolarCalendar.get_month_days(year, month)
+    
+    @staticmethod
+    def generate_years_calendar(start: int, end: int, workers: Optional[int] = None,
+                                chunk_size: int = 64, memory_limit: Optional[int] = None,
+                                compact: bool = False):
+        """
+        多进程生成多年日历，按年份顺序流式返回
+        
+        参数:
+            start: 起始年份（包含）
+            end: 结束年份（包含）
+            workers: 进程数，None 表示 CPU 核数，1 表示在当前进程串行生成
+            chunk_size: 每个任务包含的年数
+            memory_limit: 已生成但尚未被消费的结果最多占用的内存（字节），
+                          None 表示每个进程最多排队2个任务
+            compact: True 时每年返回504字节的 get_year_block，否则返回
+                     generate_year_calendar 的字典
+            
+        返回:
+            generator: 依次产生 (year, calendar)
+        """
+        if start < 1 or end < start:
+            raise ValueError("年份范围无效")
+        if chunk_size < 1:
+            raise ValueError("chunk_size 必须为正整数")
+        
+        workers = workers or os.cpu_count() or 1
+        chunks = [(first, min(first + chunk_size - 1, end), compact)
+                  for first in range(start, end + 1, chunk_size)]
+        
+        if workers == 1:
+            for first, last, _ in chunks:
+                yield from zip(range(first, last + 1), _generate_years_chunk(first, last, compact))
+            return
+        
+        if memory_limit is None:
+            max_pending = workers * 2
+        else:
+            max_pending = max(1, memory_limit // (chunk_size * _estimate_year_bytes(compact)))
+        
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = deque()
+            next_chunk = 0
+            while next_chunk < len(chunks) or pending:
+                # 补满任务窗口，控制在途结果的数量
+                while next_chunk < len(chunks) and len(pending) < max_pending:
+                    first, last, _ = chunks[next_chunk]
+                    pending.append((first, pool.submit(_generate_years_chunk, first, last, compact)))
+                    next_chunk += 1
+                
+                first, future = pending.popleft()
+                yield from enumerate(future.result(), start=first)
+    
+    @staticmethod
+    def validate_dates_batch(years, months=None, days=None) -> tuple:
+        """
+        批量验证日期（纯算术，不因任何一行的脏数据抛异常，适合大量脏数据）
+        
+        参数:
+            years: 年份序列；若 months 和 days 省略，则视为 N×3 的 (年, 月, 日) 序列
+            months: 月份序列，单独省略时视为缺失值
+            days: 日期序列，单独省略时视为缺失值
+            
+        返回:
+            tuple: (valid, reasons)
+                valid: bool 数组，日期有效为 True
+                reasons: uint8 数组，取值为 DATE_VALID / DATE_INVALID_YEAR /
+                         DATE_INVALID_MONTH / DATE_INVALID_DAY / DATE_NOT_INTEGER；
+                         小数、NaN、无穷、None 等不会被截断成整数，一律为 DATE_NOT_INTEGER
+        """
+        _require_numpy()
+        if months is None and days is None:
+            years, months, days = _as_date_rows(years)
+        
+        (y, m, d), bad = _as_checked_int_arrays(years, months, days)
+        reasons, _, _ = _np_date_reasons(y, m, d)
+        reasons[bad] = SolarCalendar.DATE_NOT_INTEGER
+        return reasons == SolarCalendar.DATE_VALID, reasons
@@ -0,0 +1,202 @@
+# 流式网格渲染模块：把任意范围的月份/年份按显示宽度排成多列，逐行产出
+"""
+和 views.display_year_view 固定三列、一次打印一年不同，这里：
+- 列数由终端宽度（或指定的页宽）决定
+- 以生成器逐行产出，每次只保留一排月份，打印1000年日历到文件也是常数内存
+- 按 unicodedata.east_asian_width 计算中文等宽字符的显示宽度，中文标题也能对齐
+
+运行方式：python src/stream_render.py 2025 [2030] [--style zh] [--width 120] [--output cal.txt]
+"""
+import argparse
+import shutil
+import sys
+import unicodedata
+from itertools import islice
+
+import views
+from solar import SolarCalendar
+
+
+# 两种样式的单个月份块宽度（显示宽度）
+BLOCK_WIDTHS = {"en": 27, "zh": 21}
+
+# 中文样式的月份名和星期表头（每个汉字占2列）
+_ZH_MONTH_NAMES = ("一月", "二月", "三月", "四月", "五月", "六月",
+                   "七月", "八月", "九月", "十月", "十一月", "十二月")
+_ZH_WEEKDAY_HEADER = " 日 一 二 三 四 五 六"
+
+# 每个月份块的行数：标题 + 表头 + 6周
+BLOCK_LINES = 8
+
+
+def display_width(text: str) -> int:
+    """
+    计算字符串在终端中的显示宽度
+
+    全角（F）和宽字符（W）占2列，组合字符占0列，其余占1列
+    """
+    width = 0
+    for char in text:
+        if unicodedata.combining(char):
+            continue
+        width += 2 if unicodedata.east_asian_width(char) in ("W", "F") else 1
+    return width
+
+
+def pad(text: str, width: int, align: str = "left") -> str:
+    """
+    按显示宽度补空格
+
+    参数:
+        text: 原字符串
+        width: 目标显示宽度（原字符串更宽时不截断）
+        align: 'left' 或 'center'
+    """
+    space = max(0, width - display_width(text))
+    if align == "center":
+        left = space // 2
+        return " " * left + text + " " * (space - left)
+    return text + " " * space
+
+
+def month_block(year: int, month: int, style: str = "en") -> list:
+    """
+    生成单个月份块的各行（未补齐宽度）
+
+    参数:
+        year: 年份
+        month: 月份
+        style: 'en' 复用 views.generate_month_lines；'zh' 为中文标题和表头
+
+    返回:
+        list: BLOCK_LINES 行字符串
+    """
+    if style == "en":
+        return views.generate_month_lines(year, month)[:BLOCK_LINES]
+    if style != "zh":
+        raise ValueError("样式必须是 'en' 或 'zh'")
+
+    width = BLOCK_WIDTHS["zh"]
+    lines = [pad(f"{year}年{_ZH_MONTH_NAMES[month - 1]}", width, "center"), _ZH_WEEKDAY_HEADER]
+    lunar_first_days = views.get_lunar_first_days(year, month, SolarCalendar.get_month_days(year, month))
+    for week in SolarCalendar.get_month_layout(year, month):
+        if any(week):
+            lines.append("".join("   " if day == 0 else f"{day:2}*" if day in lunar_first_days else f"{day:3}"
+                                 for day in week).rstrip())
+    while len(lines) < BLOCK_LINES:
+        lines.append("")
+    return lines
+
+
+def choose_columns(block_width: int, width: int = None, gap: int = 4) -> int:
+    """
+    根据页宽计算每排放几个月
+
+    参数:
+        block_width: 单个月份块宽度
+        width: 页宽，None 表示使用当前终端宽度
+        gap: 列间距
+
+    返回:
+        int: 列数（至少为1）
+    """
+    if width is None:
+        width = shutil.get_terminal_size().columns
+    return max(1, (width + gap) // (block_width + gap))
+
+
+def iter_month_rows(months, columns: int = None, width: int = None, style: str = "en", gap: int = 4):
+    """
+    把一串月份排成多列，逐行产出
+
+    参数:
+        months: (year, month) 的可迭代对象，可以是惰性的生成器
+        columns: 列数，None 表示按 width 计算
+        width: 页宽，None 表示当前终端宽度
+        style: 'en' 或 'zh'
+        gap: 列间距
+
+    返回:
+        generator: 依次产生不带换行符的行；每排月份之后产生一个空行
+    """
+    block_width = BLOCK_WIDTHS[style]
+    columns = columns or choose_columns(block_width, width, gap)
+    separator = " " * gap
+
+    months = iter(months)
+    while True:
+        row = list(islice(months, columns))
+        if not row:
+            return
+        blocks = [month_block(year, month, style) for year, month in row]
+        for i in range(BLOCK_LINES):
+            yield separator.join(pad(block[i], block_width) for block in blocks).rstrip()
+        yield ""
+
+
+def iter_year_lines(start_year: int, end_year: int = None, columns: int = None,
+                    width: int = None, style: str = "en", gap: int = 4):
+    """
+    逐行产出 [start_year, end_year] 各年的全年日历，每年前有一行年份标题
+
+    参数:
+        start_year: 起始年份
+        end_year: 结束年份（包含），None 表示只渲染一年
+        其余参数同 iter_month_rows
+
+    返回:
+        generator: 依次产生不带换行符的行
+    """
+    end_year = start_year if end_year is None else end_year
+    block_width = BLOCK_WIDTHS[style]
+    columns = columns or choose_columns(block_width, width, gap)
+    page_width = columns * block_width + (columns - 1) * gap
+
+    for year in range(start_year, end_year + 1):
+        title = f"{year}年" if style == "zh" else str(year)
+        yield pad(title, page_width, "center").rstrip()
+        yield ""
+        yield from iter_month_rows(((year, month) for month in range(1, 13)),
+                                   columns=columns, style=style, gap=gap)
+
+
+def write_lines(lines, stream=None):
+    """
+    把逐行产出的结果写入流（由流自身缓冲，不在内存中拼接整段文本）
+
+    参数:
+        lines: 行的可迭代对象
+        stream: 输出流，默认 sys.stdout
+    """
+    stream = stream or sys.stdout
+    stream.writelines(line + "\n" for line in lines)
+    stream.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="多列流式输出多年日历")
+    parser.add_argument("start", type=int, help="起始年份")
+    parser.add_argument("end", type=int, nargs="?", help="结束年份（包含，默认同起始年份）")
+    parser.add_argument("--style", choices=sorted(BLOCK_WIDTHS), default="en", help="样式（默认en）")
+    parser.add_argument("--columns", type=int, help="每排月份数（默认按宽度计算）")
+    parser.add_argument("--width", type=int, help="页宽（默认终端宽度）")
+    parser.add_argument("--output", help="输出文件（默认标准输出）")
+    args = parser.parse_args()
+
+    try:
+        from my_lunar import get_lunar_info, get_lunar_month
+        views.set_lunar_month_function(get_lunar_month)  # 农历数据范围内标记初一
+        views.set_lunar_function(get_lunar_info)  # 只有部分日期在范围内的月份（1900年1月等）逐日查询
+    except Exception as e:
+        print(f"⚠️  农历模块加载失败，不标记初一: {e}", file=sys.stderr)
+
+    lines = iter_year_lines(args.start, args.end, columns=args.columns, width=args.width, style=args.style)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            write_lines(lines, file)
+    else:
+        write_lines(lines)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,8 @@
 # src/views.py
 # 日历视图模块：负责生成年/月日历界面，支持农历初一标记
+import sys
+
+import calendar_core
 
 # --- 基础配置 ---
 month_names = [
@@ -7,40 +10,92 @@ month_names = [
     "July", "August", "September", "October", "November", "December"
 ]
 
-# 每月默认天数（非闰年）
-month_days = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+# 每月默认天数（非闰年），与 calendar_core 共用同一张表
+month_days = calendar_core.MONTH_DAYS
 
 
 # --- 农历函数注入机制 ---
-# 外部传入 get_lunar_date 函数（来自 my_lunar）
+# 外部传入农历查询函数（来自 my_lunar），可以是返回 LunarDate 的 get_lunar_info，
+# 也可以是返回字符串的 get_lunar_date
 _get_lunar_date_func = None
 
 
 def set_lunar_function(get_lunar_fn):
     """
     由 main.py 注入农历查询函数
-    示例：views.set_lunar_function(get_lunar_date)
+    示例：views.set_lunar_function(get_lunar_info)
+         views.set_lunar_function(get_lunar_date)  # 旧的字符串接口仍然可用
     """
     global _get_lunar_date_func
     _get_lunar_date_func = get_lunar_fn
 
 
+# 外部传入整月农历查询函数（my_lunar.get_lunar_month），每月只调用一次
+_get_lunar_month_func = None
+
+
+def set_lunar_month_function(get_lunar_month_fn):
+    """
+    由 main.py 注入整月农历查询函数，注入后优先于逐日查询
+    示例：views.set_lunar_month_function(get_lunar_month)
+    """
+    global _get_lunar_month_func
+    _get_lunar_month_func = get_lunar_month_fn
+
+
+def get_lunar_functions():
+    """
+    返回当前注入的 (逐日函数, 整月函数)，渲染缓存用它区分不同的农历数据来源
+    """
+    return _get_lunar_date_func, _get_lunar_month_func
+
+
+def get_lunar_first_days(year, month, days):
+    """
+    获取该月所有农历初一的公历日期集合
+    有整月函数时一次批量查询，否则逐日调用 is_lunar_first_day；
+    整月查询出错时（如1900年1月、2101年1月只有部分日期在农历数据范围内）也退回逐日查询，
+    范围内的日期照常标记
+    """
+    if _get_lunar_month_func is not None:
+        try:
+            return {offset + 1 for offset in _get_lunar_month_func(year, month).first_day_offsets()}
+        except Exception:
+            pass
+    return {day for day in range(1, days + 1) if is_lunar_first_day(year, month, day)}
+
+
+def is_lunar_first_day(year, month, day):
+    """
+    判断是否为农历初一（未注入农历函数或查询出错时返回 False）
+    结构化结果直接读 is_first_day 字段，字符串结果才退回到查找“初一”
+    """
+    if _get_lunar_date_func is None:
+        return False
+    try:
+        lunar = _get_lunar_date_func(year, month, day)
+    except Exception:
+        # 安全降级：出错就不标星号
+        return False
+
+    is_first_day = getattr(lunar, "is_first_day", None)
+    if is_first_day is not None:
+        return bool(is_first_day)
+    return isinstance(lunar, str) and "初一" in lunar
+
+
 # --- 工具函数 ---
 def is_leap_year(year):
-    """判断是否为闰年"""
-    return (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0)
+    """判断是否为闰年（calendar_core.is_leap_year）"""
+    return calendar_core.is_leap_year(year)
 
 
 def get_weekday(day, month, year):
     """
-    使用基姆拉尔森公式计算星期几
+    计算星期几（calendar_core.weekday，查400年周期表）
     返回值：0=周日, 1=周一, ..., 6=周六
     """
-    if month < 3:
-        month += 12
-        year -= 1
-    w = (day + 2 * month + 3 * (month + 1) // 5 + year + year // 4 - year // 100 + year // 400) % 7
-    return w
+    return calendar_core.weekday(year, month, day)
 
 
 # --- 单月日历生成 ---
@@ -49,12 +104,8 @@ def generate_month_lines(year, month):
     生成指定年月的日历行列表（每行为字符串），用于横向拼接显示
     支持在农历初一日期后添加 *
     """
-    global _get_lunar_date_func
-
     # 确定该月总天数
-    days = month_days[month - 1]
-    if month == 2 and is_leap_year(year):
-        days = 29
+    days = calendar_core.month_days(year, month)
 
     # 构建标题和表头
     title = f"{month_names[month - 1]} {year}"
@@ -64,24 +115,16 @@ def generate_month_lines(year, month):
     lines.append(header)
 
     # 计算每月1号是星期几
-    first_weekday = get_weekday(1, month, year)
+    first_weekday = calendar_core.first_weekday(year, month)
     current_line = "   " * first_weekday  # 前导空格对齐星期
 
+    # 整月农历初一只查一次
+    lunar_first_days = get_lunar_first_days(year, month, days)
+
     # 逐日绘制
     for day in range(1, days + 1):
-        # 判断是否为农历初一
-        is_lunar_first_day = False
-        if _get_lunar_date_func is not None:
-            try:
-                lunar_str = _get_lunar_date_func(year, month, day)
-                if isinstance(lunar_str, str) and "初一" in lunar_str:
-                    is_lunar_first_day = True
-            except Exception as e:
-                # 安全降级：出错就不标星号
-                pass
-
-        # 添加日期 + 星号（如果需要）
-        if is_lunar_first_day:
+        # 添加日期 + 星号（农历初一）
+        if day in lunar_first_days:
             current_line += f"{day:2}*"
         else:
             current_line += f"{day:3}"
@@ -103,12 +146,12 @@ def generate_month_lines(year, month):
 
 
 # --- 年视图显示 ---
-def display_year_view(year):
+def render_year_view(year):
     """
-    显示某一年的全年12个月日历（三列排版）
+    渲染某一年的全年12个月日历（三列排版），返回整帧字符串
     """
-    print(f"==================== {year} 年日历（年视图） ====================")
-    print("注：* 标记为农历初一\n")
+    lines = [f"==================== {year} 年日历（年视图） ====================",
+             "注：* 标记为农历初一", ""]
 
     # 预生成所有月份的行数据
     all_months = [generate_month_lines(year, m) for m in range(1, 13)]
@@ -120,54 +163,54 @@ def display_year_view(year):
         while len(months_in_row) < 3:
             months_in_row.append([""] * 8)
 
-        # 拼接每一行的高度（最多8行）
+        # 拼接每一行的高度（最多8行），中间留4个空格
         for i in range(8):
-            line = ""
-            for j, m_lines in enumerate(months_in_row):
-                if j > 0:
-                    line += "    "  # 中间留空隙
-                part = m_lines[i] if i < len(m_lines) else ""
-                line += f"{part:27}"  # 固定宽度，保证对齐
-            print(line)
-        print()  # 季度之间空一行
+            lines.append("    ".join(f"{m_lines[i] if i < len(m_lines) else '':27}" for m_lines in months_in_row))
+        lines.append("")  # 季度之间空一行
+
+    return "\n".join(lines) + "\n"
+
+
+def display_year_view(year):
+    """
+    显示某一年的全年12个月日历（三列排版），整帧一次写出
+    """
+    sys.stdout.write(render_year_view(year))
 
 
 # --- 月视图显示（简洁版）---
-def display_month_view(year, month):
+def render_month_view(year, month):
     """
-    显示单个月份的日历（用于月视图模式）
+    渲染单个月份的日历（用于月视图模式），返回整帧字符串
     """
-    global _get_lunar_date_func
+    days = calendar_core.month_days(year, month)
 
-    days = month_days[month - 1]
-    if month == 2 and is_leap_year(year):
-        days = 29
+    lines = [f"        {month_names[month - 1]} {year}        ", "Su Mo Tu We Th Fr Sa"]
 
-    print(f"        {month_names[month - 1]} {year}        ")
-    print("Su Mo Tu We Th Fr Sa")
+    first_weekday = calendar_core.first_weekday(year, month)
+    current_line = "   " * first_weekday
 
-    first_weekday = get_weekday(1, month, year)
-    print("   " * first_weekday, end="")
+    lunar_first_days = get_lunar_first_days(year, month, days)
 
     for day in range(1, days + 1):
-        is_lunar_first = False
-        if _get_lunar_date_func is not None:
-            try:
-                lunar_str = _get_lunar_date_func(year, month, day)
-                if isinstance(lunar_str, str) and "初一" in lunar_str:
-                    is_lunar_first = True
-            except:
-                pass
-
-        if is_lunar_first:
-            print(f"{day:2}*", end="")
+        if day in lunar_first_days:
+            current_line += f"{day:2}*"
         else:
-            print(f"{day:3}", end="")
+            current_line += f"{day:3}"
 
         if (first_weekday + day) % 7 == 0:
-            print()  # 换行
+            lines.append(current_line)  # 换行
+            current_line = ""
+
+    if current_line:
+        lines.append(current_line)  # 最后补换行
+
+    lines.append("-------------------------")
+    return "\n".join(lines) + "\n"
 
-    if (first_weekday + day) % 7 != 0:
-        print()  # 最后补换行
 
-    print("-------------------------")
+def display_month_view(year, month):
+    """
+    显示单个月份的日历（用于月视图模式），整帧一次写出
+    """
+    sys.stdout.write(render_month_view(year, month))
@@ -0,0 +1,366 @@
+# 工作日计算模块：节假日、调休与工作日计数
+from array import array
+from bisect import bisect_left
+
+from solar import SolarCalendar
+
+try:
+    import numpy as np
+except ImportError:  # 批量接口依赖 numpy，单日期接口不受影响
+    np = None
+
+
+# 每年固定日期的公历节假日（月, 日）→ 名称，与旧版月视图中标注的节日一致
+FIXED_SOLAR_HOLIDAYS = {
+    (1, 1): "元旦",
+    (5, 1): "劳动节",
+    (10, 1): "国庆节",
+}
+
+# 示例数据集：2025年国务院办公厅公布的放假与调休安排
+CN_2025_DATASET = {
+    "holidays": {
+        (2025, 1, 1): "元旦",
+        **{(2025, 1, day): "春节" for day in range(28, 32)},
+        **{(2025, 2, day): "春节" for day in range(1, 5)},
+        **{(2025, 4, day): "清明节" for day in range(4, 7)},
+        **{(2025, 5, day): "劳动节" for day in range(1, 6)},
+        (2025, 5, 31): "端午节",
+        (2025, 6, 1): "端午节",
+        (2025, 6, 2): "端午节",
+        **{(2025, 10, day): "国庆节、中秋节" for day in range(1, 9)},
+    },
+    "makeup_workdays": [
+        (2025, 1, 26), (2025, 2, 8), (2025, 4, 27), (2025, 9, 28), (2025, 10, 11),
+    ],
+}
+
+
+class WorkdayCalendar:
+    """
+    工作日日历
+
+    节假日和调休上班日可以自由插拔；每年首次使用时生成一张前缀和表
+    （第i项为该年前i天的工作日数），另有一张从公元1年起按年累计的工作日总数表，
+    之后跨任意年数的计数为 O(1)、按工作日偏移为 O(log n)
+    """
+
+    def __init__(self, holidays=None, makeup_workdays=None,
+                 fixed_holidays=None, weekend=(0, 6)):
+        """
+        参数:
+            holidays: 节假日，{(year, month, day): 名称} 字典或 (year, month, day) 序列
+            makeup_workdays: 调休上班日，(year, month, day) 序列，优先级高于周末和节假日
+            fixed_holidays: 每年固定的节假日 {(month, day): 名称}，
+                            None 表示使用 FIXED_SOLAR_HOLIDAYS，传入 {} 可关闭
+            weekend: 休息的星期（0=周日，...，6=周六）
+        """
+        self.weekend = frozenset(weekend)
+        self.fixed_holidays = dict(FIXED_SOLAR_HOLIDAYS if fixed_holidays is None else fixed_holidays)
+        self._holidays = {}          # 序数 → 名称
+        self._makeup_workdays = set()  # 序数
+        self._prefix_cache = {}      # 年份 → array('H') 前缀和
+        self._year_totals = None     # array('q')，第k项为公元1年到k年的工作日总数，按需向后扩展
+        self._year_adjustments = {}  # 年份 → 节假日/调休相对“周末+固定节假日”的工作日增减
+
+        if holidays:
+            self.add_holidays(holidays)
+        if makeup_workdays:
+            self.add_makeup_workdays(makeup_workdays)
+
+    @classmethod
+    def from_dataset(cls, dataset: dict, **kwargs):
+        """
+        从数据集字典创建（格式同 CN_2025_DATASET）
+
+        参数:
+            dataset: 包含 "holidays" 和 "makeup_workdays" 两个键的字典
+            kwargs: 其余参数原样传给构造函数
+        """
+        return cls(dataset.get("holidays"), dataset.get("makeup_workdays"), **kwargs)
+
+    # --- 数据维护 ---
+    def add_holidays(self, holidays):
+        """
+        添加节假日
+
+        参数:
+            holidays: {(year, month, day): 名称} 字典或 (year, month, day) 序列
+        """
+        items = holidays.items() if isinstance(holidays, dict) else ((date, "假日") for date in holidays)
+        for date, name in items:
+            self._holidays[SolarCalendar.to_ordinal(*date)] = name
+            self._prefix_cache.pop(date[0], None)
+        self._year_totals = None
+
+    def add_makeup_workdays(self, dates):
+        """
+        添加调休上班日
+
+        参数:
+            dates: (year, month, day) 序列
+        """
+        for date in dates:
+            self._makeup_workdays.add(SolarCalendar.to_ordinal(*date))
+            self._prefix_cache.pop(date[0], None)
+        self._year_totals = None
+
+    # --- 单日查询 ---
+    def get_holiday_name(self, year: int, month: int, day: int):
+        """
+        获取节假日名称
+
+        返回:
+            str: 节假日名称，不是节假日返回 None
+        """
+        name = self._holidays.get(SolarCalendar.to_ordinal(year, month, day))
+        return name if name is not None else self.fixed_holidays.get((month, day))
+
+    def is_workday(self, year: int, month: int, day: int) -> bool:
+        """
+        判断是否为工作日
+
+        参数:
+            year: 年份
+            month: 月份
+            day: 日期
+
+        返回:
+            bool: 工作日返回True，周末或节假日返回False（调休上班日为True）
+        """
+        prefix = self._year_prefix(year)
+        day_of_year = SolarCalendar.get_day_of_year(year, month, day)
+        return prefix[day_of_year] != prefix[day_of_year - 1]
+
+    def get_workdays_in_year(self, year: int) -> int:
+        """获取全年工作日总数"""
+        return self._year_prefix(year)[-1]
+
+    # --- 区间计数与偏移 ---
+    def count_workdays(self, start: tuple, end: tuple) -> int:
+        """
+        统计 [start, end) 之间的工作日数
+
+        参数:
+            start: 起始日期 (year, month, day)，包含
+            end: 结束日期 (year, month, day)，不包含
+
+        返回:
+            int: 工作日数；end 早于 start 时返回负数
+        """
+        if SolarCalendar.to_ordinal(*end) < SolarCalendar.to_ordinal(*start):
+            return -self.count_workdays(end, start)
+
+        start_prefix = self._year_prefix(start[0])[SolarCalendar.get_day_of_year(*start) - 1]
+        end_prefix = self._year_prefix(end[0])[SolarCalendar.get_day_of_year(*end) - 1]
+
+        # 跨年部分直接查按年累计表，与相隔年数无关
+        return (self._workdays_before(end[0]) + end_prefix) - (self._workdays_before(start[0]) + start_prefix)
+
+    def add_workdays(self, date: tuple, workdays: int) -> tuple:
+        """
+        计算 date 之后（或之前）第 N 个工作日
+
+        参数:
+            date: 起始日期 (year, month, day)，本身不计入
+            workdays: N，负数表示往前数，0 返回 date 本身
+
+        返回:
+            tuple: (year, month, day)
+        """
+        if workdays == 0:
+            return tuple(date)
+
+        prefix = self._year_prefix(date[0])
+        day_of_year = SolarCalendar.get_day_of_year(*date)
+        before = self._workdays_before(date[0])
+
+        # 换算成“从公元1年1月1日起的第 target 个工作日”
+        if workdays > 0:
+            target = before + prefix[day_of_year] + workdays
+        else:
+            target = before + prefix[day_of_year - 1] + workdays + 1
+            if target < 1:
+                raise ValueError("结果日期早于公元1年1月1日")
+
+        # 累计表不够长时向后扩展（每年最多366个工作日，至少要再扩展这么多年）
+        totals = self._year_totals
+        while totals[-1] < target:
+            self._workdays_before(len(totals) + (target - totals[-1]) // 366 + 1)
+            totals = self._year_totals
+
+        # 二分找到目标所在的年，再在该年前缀和中找第一次达到目标的那天
+        year = bisect_left(totals, target)
+        prefix = self._year_prefix(year)
+        day_of_year = bisect_left(prefix, target - totals[year - 1])
+
+        return SolarCalendar.from_ordinal(SolarCalendar.to_ordinal(year, 1, 1) + day_of_year - 1)
+
+    # --- 批量接口 ---
+    def is_workday_batch(self, years, months, days):
+        """
+        批量判断工作日（is_workday 的向量化版本）
+
+        返回:
+            numpy.ndarray: bool 数组
+        """
+        ordinals = SolarCalendar.to_ordinal_batch(years, months, days)
+        base, cumulative = self._cumulative(ordinals)
+        index = ordinals - base
+        return cumulative[index + 1] != cumulative[index]
+
+    def count_workdays_batch(self, start_years, start_months, start_days,
+                             end_years, end_months, end_days):
+        """
+        批量统计 [start, end) 之间的工作日数（count_workdays 的向量化版本）
+
+        返回:
+            numpy.ndarray: 工作日数数组
+        """
+        starts = SolarCalendar.to_ordinal_batch(start_years, start_months, start_days)
+        ends = SolarCalendar.to_ordinal_batch(end_years, end_months, end_days)
+        starts, ends = np.broadcast_arrays(starts, ends)
+        base, cumulative = self._cumulative(np.concatenate([starts.ravel(), ends.ravel()]))
+        return cumulative[ends - base] - cumulative[starts - base]
+
+    def add_workdays_batch(self, years, months, days, workdays):
+        """
+        批量计算第 N 个工作日（add_workdays 的向量化版本）
+
+        参数:
+            years / months / days: 起始日期序列
+            workdays: N 的序列或标量（可以为负数）
+
+        返回:
+            tuple: (years, months, days) 三个 int64 数组
+        """
+        ordinals = SolarCalendar.to_ordinal_batch(years, months, days)
+        ordinals, workdays = np.broadcast_arrays(ordinals, np.asarray(workdays, dtype=np.int64))
+
+        # 按每年至少约200个工作日预留余量，不够时继续扩大范围
+        margin = int(np.abs(workdays).max(initial=0)) // 200 + 1
+        while True:
+            base, cumulative = self._cumulative(ordinals, margin_years=margin)
+            index = ordinals - base
+            forward = workdays >= 0
+            targets = np.where(forward, cumulative[index + 1], cumulative[index]) + workdays
+            if targets.min(initial=0) >= 0 and targets.max(initial=0) <= cumulative[-1]:
+                break
+            if base == 1 and targets.min(initial=0) < 0:
+                raise ValueError("结果日期早于公元1年1月1日")
+            margin *= 2
+
+        after = np.searchsorted(cumulative, targets, side="left") - 1
+        before = np.searchsorted(cumulative, targets, side="right") - 1
+        result = np.where(forward, after, before) + base
+        result = np.where(workdays == 0, ordinals, result)
+        return SolarCalendar.from_ordinal_batch(result)
+
+    # --- 前缀和表 ---
+    def _year_prefix(self, year: int) -> array:
+        """
+        获取（必要时生成）某年的工作日前缀和表
+
+        返回:
+            array('H'): 长度为全年天数+1，第i项为该年前i天中的工作日数
+        """
+        prefix = self._prefix_cache.get(year)
+        if prefix is not None:
+            return prefix
+
+        first = SolarCalendar.to_ordinal(year, 1, 1)
+        cumulative_days = SolarCalendar.get_cumulative_days(year)
+        fixed = {first + cumulative_days[month - 1] + day - 1
+                 for month, day in self.fixed_holidays
+                 if SolarCalendar.validate_date(year, month, day)}
+
+        weekday = SolarCalendar.get_first_weekday(year, 1)
+        prefix = array("H", [0])
+        count = 0
+        for ordinal in range(first, first + cumulative_days[12]):
+            if ordinal in self._makeup_workdays:
+                count += 1
+            elif weekday not in self.weekend and ordinal not in self._holidays and ordinal not in fixed:
+                count += 1
+            prefix.append(count)
+            weekday = (weekday + 1) % 7
+
+        self._prefix_cache[year] = prefix
+        return prefix
+
+    def _workdays_before(self, year: int) -> int:
+        """
+        公元1年1月1日到 year 年1月1日（不含）之间的工作日数
+
+        查按年累计表；表不够长时用 _year_total 逐年向后扩展，每年只算一次
+        """
+        totals = self._year_totals
+        if totals is None:
+            totals = self._year_totals = array("q", [0])
+            self._year_adjustments = self._special_adjustments()
+        while len(totals) < year:
+            totals.append(totals[-1] + self._year_total(len(totals)))
+        return totals[year - 1]
+
+    def _is_fixed_holiday(self, ordinal: int) -> bool:
+        year, month, day = SolarCalendar.from_ordinal(ordinal)
+        return (month, day) in self.fixed_holidays
+
+    def _special_adjustments(self) -> dict:
+        """
+        统计各年的节假日和调休上班日让工作日数比“只看周末和固定节假日”多出（或少了）多少
+
+        返回:
+            dict: {年份: 增减天数}，没有变化的年份不出现
+        """
+        adjustments = {}
+        for ordinal in set(self._holidays) | self._makeup_workdays:
+            baseline = ordinal % 7 not in self.weekend and not self._is_fixed_holiday(ordinal)
+            actual = ordinal in self._makeup_workdays or (baseline and ordinal not in self._holidays)
+            if actual != baseline:
+                year = SolarCalendar.from_ordinal(ordinal)[0]
+                adjustments[year] = adjustments.get(year, 0) + (1 if actual else -1)
+        return adjustments
+
+    def _year_total(self, year: int) -> int:
+        """
+        全年工作日总数；已有前缀和表时直接读取，否则不逐日展开，按整周计数后修正
+        """
+        prefix = self._prefix_cache.get(year)
+        if prefix is not None:
+            return prefix[-1]
+
+        day_count = SolarCalendar.get_cumulative_days(year)[12]
+        first_weekday = SolarCalendar.get_first_weekday(year, 1)
+        weeks, rest = divmod(day_count, 7)
+        total = weeks * (7 - len(self.weekend))
+        total += sum(1 for i in range(rest) if (first_weekday + i) % 7 not in self.weekend)
+
+        # 落在非周末的固定节假日
+        for month, day in self.fixed_holidays:
+            if (SolarCalendar.validate_date(year, month, day)
+                    and SolarCalendar.get_weekday(year, month, day) not in self.weekend):
+                total -= 1
+        return total + self._year_adjustments.get(year, 0)
+
+    def _cumulative(self, ordinals, margin_years: int = 1) -> tuple:
+        """
+        把覆盖 ordinals 的各年前缀和表拼接成一张连续的累计表
+
+        返回:
+            tuple: (base, cumulative)，cumulative[i] 为序数 [base, base+i) 内的工作日数
+        """
+        first_year = SolarCalendar.from_ordinal(int(ordinals.min()))[0]
+        last_year = SolarCalendar.from_ordinal(int(ordinals.max()))[0]
+        first_year = max(1, first_year - margin_years)
+        last_year += margin_years
+
+        parts = []
+        offset = 0
+        for year in range(first_year, last_year + 1):
+            prefix = np.frombuffer(self._year_prefix(year), dtype=np.uint16).astype(np.int64)
+            parts.append(prefix[:-1] + offset)
+            offset += int(prefix[-1])
+        parts.append(np.array([offset], dtype=np.int64))
+
+        return SolarCalendar.to_ordinal(first_year, 1, 1), np.concatenate(parts)